@@ -84,6 +84,13 @@ from holisticai.bias.metrics._regression import (
     zscore_diff,
 )
 
+# Streaming
+from holisticai.bias.metrics._streaming import (
+    ClassificationBiasAccumulator,
+    MulticlassBiasAccumulator,
+    RegressionBiasAccumulator,
+)
+
 # All bias functions and classes
 __all__ = [
     "statistical_parity",
@@ -151,4 +158,7 @@ __all__ = [
     "coefficient_of_variation",
     "consistency_score",
     "jain_index",
+    "ClassificationBiasAccumulator",
+    "MulticlassBiasAccumulator",
+    "RegressionBiasAccumulator",
 ]
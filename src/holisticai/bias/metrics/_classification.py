@@ -5,7 +5,7 @@ import numpy as np
 import pandas as pd
 
 # Efficacy metrics
-from sklearn.metrics import accuracy_score, confusion_matrix, roc_auc_score
+from sklearn.metrics import accuracy_score, roc_auc_score
 from sklearn.neighbors import NearestNeighbors
 
 # utils
@@ -39,6 +39,175 @@ def _group_success_rate(g, y):
     return y[g == 1].sum() / g.sum()  # success rate group_a
 
 
+def _group_confusion_counts(g, y_pred, y_true=None):
+    """Group confusion counts.
+
+    This function counts the predictions of a given subgroup with a single\
+    bincount. Without y_true it returns the counts of (negative, positive)\
+    predictions, otherwise the counts of (tn, fp, fn, tp).
+
+    Parameters
+    ----------
+    g : array-like
+        subgroup vector (binary)
+    y_pred : array-like
+        predictions vector (binary)
+    y_true : array-like, optional
+        target vector (binary)
+
+    Returns
+    -------
+    numpy array
+        group confusion counts
+    """
+    mask = g == 1
+    codes = y_pred[mask].astype(int)
+    if y_true is None:
+        return np.bincount(codes, minlength=2)
+    codes += 2 * y_true[mask].astype(int)
+    return np.bincount(codes, minlength=4)
+
+
+def _classification_group_stats(group_a, group_b, y_pred, y_true=None):
+    """Classification group statistics.
+
+    This function computes, in one pass over the coerced inputs, the\
+    sufficient statistics of group_a and group_b from which every group\
+    classification bias metric is derived: group sizes and success rates,\
+    and, if y_true is given, the true/false positive/negative rates\
+    (normalized over the true labels, empty rows give 0) and the accuracy.
+
+    Parameters
+    ----------
+    group_a : numpy array
+        Group membership vector (binary)
+    group_b : numpy array
+        Group membership vector (binary)
+    y_pred : numpy array
+        Predictions vector (binary)
+    y_true : numpy array, optional
+        Target vector (binary)
+
+    Returns
+    -------
+    dict
+        group statistics, keys suffixed with _a or _b
+    """
+    counts_a = _group_confusion_counts(group_a, y_pred, y_true)
+    counts_b = _group_confusion_counts(group_b, y_pred, y_true)
+    return _classification_stats_from_counts(counts_a, counts_b)
+
+
+def _classification_stats_from_counts(counts_a, counts_b):
+    """Classification group statistics from confusion counts.
+
+    This function derives the group statistics from the confusion counts\
+    of each group, as returned by _group_confusion_counts. Counts of length\
+    2 hold (negative, positive) predictions, counts of length 4 hold\
+    (tn, fp, fn, tp).
+
+    Parameters
+    ----------
+    counts_a : numpy array
+        confusion counts of group_a
+    counts_b : numpy array
+        confusion counts of group_b
+
+    Returns
+    -------
+    dict
+        group statistics, keys suffixed with _a or _b
+    """
+    stats = {}
+    for name, counts in (("a", counts_a), ("b", counts_b)):
+        n = counts.sum()
+        stats[f"n_{name}"] = n
+        if len(counts) == 2:
+            stats[f"sr_{name}"] = counts[1] / n
+            continue
+        tn, fp, fn, tp = counts
+        neg, pos = tn + fp, fn + tp
+        stats[f"sr_{name}"] = (fp + tp) / n
+        stats[f"tnr_{name}"] = tn / neg if neg > 0 else 0.0
+        stats[f"fpr_{name}"] = fp / neg if neg > 0 else 0.0
+        stats[f"fnr_{name}"] = fn / pos if pos > 0 else 0.0
+        stats[f"tpr_{name}"] = tp / pos if pos > 0 else 0.0
+        stats[f"acc_{name}"] = (tn + tp) / n
+    return stats
+
+
+def _statistical_parity(stats):
+    return stats["sr_a"] - stats["sr_b"]
+
+
+def _disparate_impact(stats):
+    return stats["sr_a"] / stats["sr_b"]
+
+
+def _four_fifths(stats):
+    sr_a, sr_b = stats["sr_a"], stats["sr_b"]
+    return min(sr_a / sr_b, sr_b / sr_a)
+
+
+def _cohen_d(stats):
+    sr_a, sr_b = stats["sr_a"], stats["sr_b"]
+    n_a, n_b = stats["n_a"], stats["n_b"]
+
+    # calculate STD_a and STD_b
+    std_b = np.sqrt(sr_b * (1 - sr_b))
+    std_a = np.sqrt(sr_a * (1 - sr_a))
+
+    # calculate poolSTD
+    std_pool = np.sqrt(((n_b - 1) * std_b**2 + (n_a - 1) * std_a**2) / (n_a + n_b - 2))
+
+    return (sr_a - sr_b) / std_pool
+
+
+def _z_test_terms(stats):
+    sr_a, sr_b = stats["sr_a"], stats["sr_b"]
+    n_a, n_b = stats["n_a"], stats["n_b"]
+    sr_tot = (sr_a * n_a + sr_b * n_b) / (n_a + n_b)
+    n_tot = n_a + n_b
+
+    # calculate p_a
+    p_a = n_a / n_tot
+    return sr_a, sr_b, sr_tot, n_tot, p_a
+
+
+def _z_test_diff(stats):
+    sr_a, sr_b, sr_tot, n_tot, p_a = _z_test_terms(stats)
+    return (sr_a - sr_b) / np.sqrt((sr_tot * (1 - sr_tot)) / (n_tot * p_a * (1 - p_a)))
+
+
+def _z_test_ratio(stats):
+    sr_a, sr_b, sr_tot, n_tot, p_a = _z_test_terms(stats)
+    return (np.log(sr_a / sr_b)) / np.sqrt((1 - sr_tot) / (sr_tot * n_tot * p_a * (1 - p_a)))
+
+
+def _equal_opportunity_diff(stats):
+    return stats["tpr_a"] - stats["tpr_b"]
+
+
+def _false_positive_rate_diff(stats):
+    return stats["fpr_a"] - stats["fpr_b"]
+
+
+def _false_negative_rate_diff(stats):
+    return stats["fnr_a"] - stats["fnr_b"]
+
+
+def _true_negative_rate_diff(stats):
+    return stats["tnr_a"] - stats["tnr_b"]
+
+
+def _average_odds_diff(stats):
+    return 0.5 * (_equal_opportunity_diff(stats) + _false_positive_rate_diff(stats))
+
+
+def _accuracy_diff(stats):
+    return stats["acc_a"] - stats["acc_b"]
+
+
 def statistical_parity(group_a, group_b, y_pred):
     """Statistical parity.
 
@@ -82,11 +251,10 @@ def statistical_parity(group_a, group_b, y_pred):
     # check and coerce
     group_a, group_b, y_pred, _ = _classification_checks(group_a, group_b, y_pred, y_true=None)
 
-    # calculate sr_a and sr_b
-    sr_a = _group_success_rate(group_a, y_pred)  # success rate group_a
-    sr_b = _group_success_rate(group_b, y_pred)  # success rate group_b
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred)
 
-    return sr_a - sr_b
+    return _statistical_parity(stats)
 
 
 def success_rate(group_a, group_b, y_pred):
@@ -162,11 +330,10 @@ def disparate_impact(group_a, group_b, y_pred):
     # check and coerce
     group_a, group_b, y_pred, _ = _classification_checks(group_a, group_b, y_pred, y_true=None)
 
-    # calculate sr_a and sr_b
-    sr_a = _group_success_rate(group_a, y_pred)  # success rate group_a
-    sr_b = _group_success_rate(group_b, y_pred)  # success rate group_b
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred)
 
-    return sr_a / sr_b
+    return _disparate_impact(stats)
 
 
 def four_fifths(group_a, group_b, y_pred):
@@ -206,11 +373,10 @@ def four_fifths(group_a, group_b, y_pred):
     # check and coerce
     group_a, group_b, y_pred, _ = _classification_checks(group_a, group_b, y_pred, y_true=None)
 
-    # calculate sr_a and sr_b
-    sr_a = _group_success_rate(group_a, y_pred)  # success rate group_a
-    sr_b = _group_success_rate(group_b, y_pred)  # success rate group_b
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred)
 
-    return min(sr_a / sr_b, sr_b / sr_a)
+    return _four_fifths(stats)
 
 
 def cohen_d(group_a, group_b, y_pred):
@@ -256,22 +422,10 @@ def cohen_d(group_a, group_b, y_pred):
     # check and coerce
     group_a, group_b, y_pred, _ = _classification_checks(group_a, group_b, y_pred, y_true=None)
 
-    # calculate sr_a and sr_b
-    sr_a = _group_success_rate(group_a, y_pred)  # success rate group_a
-    sr_b = _group_success_rate(group_b, y_pred)  # success rate group_b
-
-    # calculate STD_a and STD_b
-    std_b = np.sqrt(sr_b * (1 - sr_b))
-    std_a = np.sqrt(sr_a * (1 - sr_a))
-
-    # calculate n_a and n_b
-    n_a = group_a.sum()
-    n_b = group_b.sum()
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred)
 
-    # calculate poolSTD
-    std_pool = np.sqrt(((n_b - 1) * std_b**2 + (n_a - 1) * std_a**2) / (n_a + n_b - 2))
-
-    return (sr_a - sr_b) / std_pool
+    return _cohen_d(stats)
 
 
 def z_test_diff(group_a, group_b, y_pred):
@@ -320,18 +474,10 @@ def z_test_diff(group_a, group_b, y_pred):
     # check and coerce
     group_a, group_b, y_pred, _ = _classification_checks(group_a, group_b, y_pred, y_true=None)
 
-    # calculate sr_a and sr_b
-    sr_a = _group_success_rate(group_a, y_pred)  # success rate group_a
-    sr_b = _group_success_rate(group_b, y_pred)  # success rate group_b
-    n_a = group_a.sum()
-    n_b = group_b.sum()
-    sr_tot = (sr_a * n_a + sr_b * n_b) / (n_a + n_b)
-    n_tot = n_a + n_b
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred)
 
-    # calculate p_a
-    p_a = n_a / n_tot
-
-    return (sr_a - sr_b) / np.sqrt((sr_tot * (1 - sr_tot)) / (n_tot * p_a * (1 - p_a)))
+    return _z_test_diff(stats)
 
 
 def z_test_ratio(group_a, group_b, y_pred):
@@ -379,18 +525,10 @@ def z_test_ratio(group_a, group_b, y_pred):
     # check and coerce
     group_a, group_b, y_pred, _ = _classification_checks(group_a, group_b, y_pred, y_true=None)
 
-    # calculate sr_a and sr_b
-    sr_a = _group_success_rate(group_a, y_pred)  # success rate group_a
-    sr_b = _group_success_rate(group_b, y_pred)  # success rate group_b
-    n_a = group_a.sum()
-    n_b = group_b.sum()
-    sr_tot = (sr_a * n_a + sr_b * n_b) / (n_a + n_b)
-    n_tot = n_a + n_b
-
-    # calculate p_a
-    p_a = n_a / n_tot
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred)
 
-    return (np.log(sr_a / sr_b)) / np.sqrt((1 - sr_tot) / (sr_tot * n_tot * p_a * (1 - p_a)))
+    return _z_test_ratio(stats)
 
 
 def _correlation_diff(group_a, group_b, y_pred, y_true):
@@ -491,11 +629,10 @@ def equal_opportunity_diff(group_a, group_b, y_pred, y_true):
     # check and coerce
     group_a, group_b, y_pred, y_true = _classification_checks(group_a, group_b, y_pred, y_true)
 
-    # Calculate true positive rates
-    tpr_a = confusion_matrix(y_true[group_a == 1], y_pred[group_a == 1], normalize="true")[1, 1]
-    tpr_b = confusion_matrix(y_true[group_b == 1], y_pred[group_b == 1], normalize="true")[1, 1]
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred, y_true)
 
-    return tpr_a - tpr_b
+    return _equal_opportunity_diff(stats)
 
 
 def false_positive_rate_diff(group_a, group_b, y_pred, y_true):
@@ -544,11 +681,10 @@ def false_positive_rate_diff(group_a, group_b, y_pred, y_true):
     # check and coerce
     group_a, group_b, y_pred, y_true = _classification_checks(group_a, group_b, y_pred, y_true)
 
-    # Calculate false positive rates
-    fpr_a = confusion_matrix(y_true[group_a == 1], y_pred[group_a == 1], normalize="true")[0, 1]
-    fpr_b = confusion_matrix(y_true[group_b == 1], y_pred[group_b == 1], normalize="true")[0, 1]
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred, y_true)
 
-    return fpr_a - fpr_b
+    return _false_positive_rate_diff(stats)
 
 
 def false_negative_rate_diff(group_a, group_b, y_pred, y_true):
@@ -597,11 +733,10 @@ def false_negative_rate_diff(group_a, group_b, y_pred, y_true):
     # check and coerce
     group_a, group_b, y_pred, y_true = _classification_checks(group_a, group_b, y_pred, y_true)
 
-    # Calculate false negative rates
-    fnr_a = confusion_matrix(y_true[group_a == 1], y_pred[group_a == 1], normalize="true")[1, 0]
-    fnr_b = confusion_matrix(y_true[group_b == 1], y_pred[group_b == 1], normalize="true")[1, 0]
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred, y_true)
 
-    return fnr_a - fnr_b
+    return _false_negative_rate_diff(stats)
 
 
 def true_negative_rate_diff(group_a, group_b, y_pred, y_true):
@@ -650,11 +785,10 @@ def true_negative_rate_diff(group_a, group_b, y_pred, y_true):
     # check and coerce
     group_a, group_b, y_pred, y_true = _classification_checks(group_a, group_b, y_pred, y_true)
 
-    # Calculate false negative rates
-    tnr_a = confusion_matrix(y_true[group_a == 1], y_pred[group_a == 1], normalize="true")[0, 0]
-    tnr_b = confusion_matrix(y_true[group_b == 1], y_pred[group_b == 1], normalize="true")[0, 0]
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred, y_true)
 
-    return tnr_a - tnr_b
+    return _true_negative_rate_diff(stats)
 
 
 def average_odds_diff(group_a, group_b, y_pred, y_true):
@@ -704,11 +838,10 @@ def average_odds_diff(group_a, group_b, y_pred, y_true):
     # check and coerce
     group_a, group_b, y_pred, y_true = _classification_checks(group_a, group_b, y_pred, y_true)
 
-    # Compute AOD
-    return 0.5 * (
-        equal_opportunity_diff(group_a, group_b, y_pred, y_true)
-        + false_positive_rate_diff(group_a, group_b, y_pred, y_true)
-    )
+    # calculate group statistics
+    stats = _classification_group_stats(group_a, group_b, y_pred, y_true)
+
+    return _average_odds_diff(stats)
 
 
 def accuracy_diff(group_a, group_b, y_score, y_true):
@@ -862,18 +995,18 @@ def classification_bias_metrics(
     }
 
     equal_outcome_metrics = {
-        "Statistical Parity": statistical_parity,
-        "Disparate Impact": disparate_impact,
-        "Four Fifths Rule": four_fifths,
-        "Cohen D": cohen_d,
-        "2SD Rule": z_test_diff,
+        "Statistical Parity": _statistical_parity,
+        "Disparate Impact": _disparate_impact,
+        "Four Fifths Rule": _four_fifths,
+        "Cohen D": _cohen_d,
+        "2SD Rule": _z_test_diff,
     }
 
     equal_opportunity_metrics = {
-        "Equality of Opportunity Difference": equal_opportunity_diff,
-        "False Positive Rate Difference": false_positive_rate_diff,
-        "Average Odds Difference": average_odds_diff,
-        "Accuracy Difference": accuracy_diff,
+        "Equality of Opportunity Difference": _equal_opportunity_diff,
+        "False Positive Rate Difference": _false_positive_rate_diff,
+        "Average Odds Difference": _average_odds_diff,
+        "Accuracy Difference": _accuracy_diff,
     }
 
     soft_metrics = {
@@ -900,12 +1033,14 @@ def classification_bias_metrics(
     has_group_parameters = all((p is not None) for p in [group_a, group_b, y_pred])
 
     if has_group_parameters:
-        out_metrics = [[pf, fn(group_a, group_b, y_pred), ref_vals[pf]] for pf, fn in equal_outcome_metrics.items()]
+        # validate once and derive every group metric from the same statistics
+        group_a, group_b, y_pred_, y_true_ = _classification_checks(group_a, group_b, y_pred, y_true)
+        stats = _classification_group_stats(group_a, group_b, y_pred_, y_true_)
+
+        out_metrics = [[pf, fn(stats), ref_vals[pf]] for pf, fn in equal_outcome_metrics.items()]
         opp_metrics = []
         if y_true is not None:
-            opp_metrics += [
-                [pf, fn(group_a, group_b, y_pred, y_true), ref_vals[pf]] for pf, fn in equal_opportunity_metrics.items()
-            ]
+            opp_metrics += [[pf, fn(stats), ref_vals[pf]] for pf, fn in equal_opportunity_metrics.items()]
         if y_score is not None:
             opp_metrics += [
                 [pf, fn(group_a, group_b, y_score, y_true), ref_vals[pf]] for pf, fn in soft_metrics.items()
@@ -6,6 +6,178 @@ import pandas as pd
 from holisticai.utils._validation import _multiclass_checks
 
 
+def _encode_labels(arr, labels):
+    """
+    Encode labels
+
+    Description
+    ----------
+    This function maps every entry of arr to the position\
+    of its value in labels. Only the unique values are looked\
+    up in Python, the mapping itself is a vectorized gather.
+
+    Parameters
+    ----------
+    arr : numpy array
+        Input vector (categorical)
+    labels : array-like
+        The unique values of arr in order
+
+    Returns
+    -------
+    numpy array
+        Integer codes : shape (num_instances,)
+    """
+    label_dict = {label: i for i, label in enumerate(labels)}
+    uniques, inverse = np.unique(arr, return_inverse=True)
+    lookup = np.array([label_dict[u] for u in uniques], dtype=np.intp)
+    return lookup[inverse.reshape(-1)]
+
+
+def _count_tensor(codes, shape):
+    """
+    Count tensor
+
+    Description
+    ----------
+    This function counts the occurrences of each combination\
+    of integer codes with a single bincount and returns the\
+    counts as a float tensor of the given shape.
+
+    Parameters
+    ----------
+    codes : list of numpy arrays
+        Integer codes, one array per dimension of the tensor
+    shape : tuple
+        The shape of the output tensor
+
+    Returns
+    -------
+    numpy ndarray
+        Count tensor : shape shape
+    """
+    flat = np.ravel_multi_index(tuple(codes), shape)
+    return np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape).astype(float)
+
+
+def _confusion_tensor(p_attr, y_pred, y_true, groups, classes):
+    """
+    Confusion tensor (coerced inputs)
+
+    Description
+    ----------
+    This function computes the confusion tensor of inputs\
+    already validated by _multiclass_checks.
+
+    Returns
+    -------
+    numpy ndarray
+        Confusion Tensor : shape (num_groups, num_classes, num_classes)
+    """
+    num_classes = len(classes)
+    num_groups = len(groups)
+    codes = [
+        _encode_labels(p_attr, groups),
+        _encode_labels(y_pred, classes),
+        _encode_labels(y_true, classes),
+    ]
+    return _count_tensor(codes, (num_groups, num_classes, num_classes))
+
+
+def _frequency_counts(p_attr, y_pred, groups, classes):
+    """
+    Frequency counts (coerced inputs)
+
+    Description
+    ----------
+    This function computes the group by class count matrix\
+    of inputs already validated by _multiclass_checks.
+
+    Returns
+    -------
+    numpy ndarray
+        Count Matrix : shape (num_groups, num_classes)
+    """
+    codes = [_encode_labels(p_attr, groups), _encode_labels(y_pred, classes)]
+    return _count_tensor(codes, (len(groups), len(classes)))
+
+
+def _aggregate_distances(dist_mat, aggregation_fun):
+    """
+    Aggregate pairwise group distances ('mean' or 'max')
+    """
+    num_groups = dist_mat.shape[0]
+    return np.max(dist_mat) if aggregation_fun == "max" else np.sum(dist_mat) / (num_groups * (num_groups - 1) / 2)
+
+
+def _pairwise_rate_differences(conftens):
+    """
+    Pairwise differences of the normalised confusion matrices
+
+    Description
+    ----------
+    This function normalises each group confusion matrix by\
+    its true class counts and returns the differences for every\
+    pair of groups k < j, together with the pair indices.
+
+    Returns
+    -------
+    tuple
+        (differences : shape (num_pairs, num_classes, num_classes), (rows, cols))
+    """
+    # normalization constant
+    conftens = conftens + 1e-32
+    norm = conftens.sum(axis=1)
+    rates = conftens / norm[:, np.newaxis, :]
+    rows, cols = np.triu_indices(conftens.shape[0], k=1)
+    return rates[rows] - rates[cols], (rows, cols)
+
+
+def _multiclass_equality_of_opp(conftens, aggregation_fun="mean"):
+    """
+    Multiclass Equality of Opportunity from a confusion tensor
+    """
+    num_groups, num_classes, _ = conftens.shape
+    diff, idx = _pairwise_rate_differences(conftens)
+    dist_mat = np.zeros((num_groups, num_groups))
+    dist_mat[idx] = np.abs(diff).sum(axis=(1, 2)) / (2 * num_classes)
+    return _aggregate_distances(dist_mat, aggregation_fun)
+
+
+def _multiclass_average_odds(conftens, aggregation_fun="mean"):
+    """
+    Multiclass Average Odds from a confusion tensor
+    """
+    num_groups, num_classes, _ = conftens.shape
+    diff, idx = _pairwise_rate_differences(conftens)
+    dist_mat = np.zeros((num_groups, num_groups))
+    dist_mat[idx] = np.abs(diff.sum(axis=2)).sum(axis=1) / (2 * num_classes)
+    return _aggregate_distances(dist_mat, aggregation_fun)
+
+
+def _multiclass_true_rates(conftens, aggregation_fun="mean"):
+    """
+    Multiclass True Rates from a confusion tensor
+    """
+    num_groups = conftens.shape[0]
+    diff, idx = _pairwise_rate_differences(conftens)
+    dist_mat = np.zeros((num_groups, num_groups))
+    dist_mat[idx] = np.abs(np.diagonal(diff, axis1=1, axis2=2)).mean(axis=1)
+    return _aggregate_distances(dist_mat, aggregation_fun)
+
+
+def _multiclass_statistical_parity(freq_counts, aggregation_fun="mean"):
+    """
+    Multiclass Statistical Parity from a group by class count matrix
+    """
+    num_groups = freq_counts.shape[0]
+    sr_mat = freq_counts / freq_counts.sum(axis=1).reshape(-1, 1) + 1e-32
+    rows, cols = np.triu_indices(num_groups, k=1)
+    dist_mat = np.zeros((num_groups, num_groups))
+    dist_mat[rows, cols] = np.abs(sr_mat[rows] - sr_mat[cols]).sum(axis=1) / 2
+    return _aggregate_distances(dist_mat, aggregation_fun)
+
+
 def confusion_matrix(y_pred, y_true, classes=None, normalize=None):
     """Confusion Matrix
 
@@ -52,15 +224,10 @@ def confusion_matrix(y_pred, y_true, classes=None, normalize=None):
 
     # variables
     num_classes = len(classes)
-    class_dict = dict(zip(classes, range(num_classes)))
-
-    # initialize the confusion matrix
-    confmat = np.zeros((num_classes, num_classes))
 
-    # loop over instances
-    for x, y in zip(y_pred, y_true):
-        # increment correct entry
-        confmat[class_dict[x], class_dict[y]] += 1
+    # count all (pred, true) pairs at once
+    codes = [_encode_labels(y_pred, classes), _encode_labels(y_true, classes)]
+    confmat = _count_tensor(codes, (num_classes, num_classes))
 
     if normalize is None:
         pass
@@ -142,19 +309,8 @@ def confusion_tensor(p_attr, y_pred, y_true, groups=None, classes=None, as_tenso
         classes=classes,
     )
 
-    # variables
-    num_classes = len(classes)
-    num_groups = len(groups)
-    class_dict = dict(zip(classes, range(num_classes)))
-    group_dict = dict(zip(groups, range(num_groups)))
-
-    # initialize the confusion tensor
-    conftens = np.zeros((num_groups, num_classes, num_classes))
-
-    # loop over instances
-    for x, y, z in zip(p_attr, y_pred, y_true):
-        # increment correct entry
-        conftens[group_dict[x], class_dict[y], class_dict[z]] += 1
+    # compute the confusion tensor
+    conftens = _confusion_tensor(p_attr, y_pred, y_true, groups, classes)
 
     # return as a tensor
     if as_tensor is True:
@@ -220,18 +376,8 @@ def frequency_matrix(p_attr, y_pred, groups=None, classes=None, normalize="group
         classes=classes,
     )
 
-    # variables
-    num_classes = len(classes)
-    num_groups = len(groups)
-    class_dict = dict(zip(classes, range(num_classes)))
-    group_dict = dict(zip(groups, range(num_groups)))
-
-    # initialize success rate matrix
-    sr_mat = np.zeros((num_groups, num_classes))
-
-    # loop over instances
-    for x, y in zip(p_attr, y_pred):
-        sr_mat[group_dict[x], class_dict[y]] += 1
+    # compute the count matrix
+    sr_mat = _frequency_counts(p_attr, y_pred, groups, classes)
 
     # normalize is None, return counts
     if normalize is None:
@@ -298,20 +444,12 @@ def accuracy_matrix(p_attr, y_pred, y_true, groups=None, classes=None):
         classes=classes,
     )
 
-    # variables
-    num_classes = len(classes)
-    num_groups = len(groups)
-
     # compute confusion tensor
-    conftens = confusion_tensor(p_attr, y_pred, y_true, groups, classes, as_tensor=True)
-
-    # initialize accuracy matrix
-    acc_mat = np.zeros((num_groups, num_classes))
+    conftens = _confusion_tensor(p_attr, y_pred, y_true, groups, classes)
 
-    # loop over groups
-    for k in range(num_groups):
-        confmat_k = conftens[k, :, :]
-        acc_mat[k, :] = np.diag(confmat_k) / (confmat_k.sum(axis=0) + confmat_k.sum(axis=1) - np.diag(confmat_k))
+    # accuracy matrix (all groups at once)
+    diag = np.diagonal(conftens, axis1=1, axis2=2)
+    acc_mat = diag / (conftens.sum(axis=1) + conftens.sum(axis=2) - diag)
 
     return pd.DataFrame(acc_mat, columns=classes).set_index(np.array(groups))
 
@@ -363,20 +501,11 @@ def precision_matrix(p_attr, y_pred, y_true, groups=None, classes=None):
         classes=classes,
     )
 
-    # variables
-    num_classes = len(classes)
-    num_groups = len(groups)
-
     # compute confusion tensor
-    conftens = confusion_tensor(p_attr, y_pred, y_true, groups, classes, as_tensor=True)
-
-    # initialize precision matrix
-    prec_mat = np.zeros((num_groups, num_classes))
+    conftens = _confusion_tensor(p_attr, y_pred, y_true, groups, classes)
 
-    # loop over groups
-    for k in range(num_groups):
-        confmat_k = conftens[k, :, :]
-        prec_mat[k, :] = np.diag(confmat_k) / np.sum(confmat_k, axis=0)
+    # precision matrix (all groups at once)
+    prec_mat = np.diagonal(conftens, axis1=1, axis2=2) / conftens.sum(axis=1)
 
     return pd.DataFrame(prec_mat, columns=classes).set_index(np.array(groups))
 
@@ -428,20 +557,11 @@ def recall_matrix(p_attr, y_pred, y_true, groups=None, classes=None):
         classes=classes,
     )
 
-    # variables
-    num_classes = len(classes)
-    num_groups = len(groups)
-
     # compute confusion tensor
-    conftens = confusion_tensor(p_attr, y_pred, y_true, groups, classes, as_tensor=True)
-
-    # initialize recall matrix
-    rec_mat = np.zeros((num_groups, num_classes))
+    conftens = _confusion_tensor(p_attr, y_pred, y_true, groups, classes)
 
-    # loop over groups
-    for k in range(num_groups):
-        confmat_k = conftens[k, :, :]
-        rec_mat[k, :] = np.diag(confmat_k) / np.sum(confmat_k, axis=1)
+    # recall matrix (all groups at once)
+    rec_mat = np.diagonal(conftens, axis1=1, axis2=2) / conftens.sum(axis=2)
 
     return pd.DataFrame(rec_mat, columns=classes).set_index(np.array(groups))
 
@@ -500,26 +620,10 @@ def multiclass_equality_of_opp(p_attr, y_pred, y_true, groups=None, classes=None
         classes=classes,
     )
 
-    # variables
-    num_classes = len(classes)
-    num_groups = len(groups)
-
     # compute confusion tensor
-    conftens = confusion_tensor(p_attr, y_pred, y_true, groups, classes, as_tensor=True) + 1e-32
-    # normalization constant
-    norm = conftens.sum(axis=1)
+    conftens = _confusion_tensor(p_attr, y_pred, y_true, groups, classes)
 
-    # initialize distance matrix
-    dist_mat = np.zeros((num_groups, num_groups))
-
-    # distance confusion matrix across groups
-    for k in range(num_groups):
-        confmat_k = conftens[k, :, :] / norm[k, :]
-        for j in range(k + 1, num_groups):
-            confmat_j = conftens[j, :, :] / norm[j, :]
-            dist_mat[k, j] = np.sum(np.abs(confmat_k - confmat_j)) / (2 * num_classes)
-
-    return np.max(dist_mat) if aggregation_fun == "max" else np.sum(dist_mat) / (num_groups * (num_groups - 1) / 2)
+    return _multiclass_equality_of_opp(conftens, aggregation_fun=aggregation_fun)
 
 
 def multiclass_average_odds(p_attr, y_pred, y_true, groups=None, classes=None, aggregation_fun="mean"):
@@ -577,26 +681,10 @@ def multiclass_average_odds(p_attr, y_pred, y_true, groups=None, classes=None, a
         classes=classes,
     )
 
-    # variables
-    num_classes = len(classes)
-    num_groups = len(groups)
-
     # compute confusion tensor
-    conftens = confusion_tensor(p_attr, y_pred, y_true, groups, classes, as_tensor=True) + 1e-32
-    # normalization constant
-    norm = conftens.sum(axis=1)
+    conftens = _confusion_tensor(p_attr, y_pred, y_true, groups, classes)
 
-    # initialize distance matrix
-    dist_mat = np.zeros((num_groups, num_groups))
-
-    # distance confusion matrix across groups
-    for k in range(num_groups):
-        confmat_k = conftens[k, :, :] / norm[k, :]
-        for j in range(k + 1, num_groups):
-            confmat_j = conftens[j, :, :] / norm[j, :]
-            dist_mat[k, j] = np.abs((confmat_k - confmat_j).sum(axis=1)).sum() / (2 * num_classes)
-
-    return np.max(dist_mat) if aggregation_fun == "max" else np.sum(dist_mat) / (num_groups * (num_groups - 1) / 2)
+    return _multiclass_average_odds(conftens, aggregation_fun=aggregation_fun)
 
 
 def multiclass_true_rates(p_attr, y_pred, y_true, groups=None, classes=None, aggregation_fun="mean"):
@@ -653,25 +741,10 @@ def multiclass_true_rates(p_attr, y_pred, y_true, groups=None, classes=None, agg
         classes=classes,
     )
 
-    # variables
-    num_groups = len(groups)
-
     # compute confusion tensor
-    conftens = confusion_tensor(p_attr, y_pred, y_true, groups, classes, as_tensor=True) + 1e-32
-    # normalization constant
-    norm = conftens.sum(axis=1)
+    conftens = _confusion_tensor(p_attr, y_pred, y_true, groups, classes)
 
-    # initialize distance matrix
-    dist_mat = np.zeros((num_groups, num_groups))
-
-    # distance confusion matrix across groups
-    for k in range(num_groups):
-        confmat_k = conftens[k, :, :] / norm[k, :]
-        for j in range(k + 1, num_groups):
-            confmat_j = conftens[j, :, :] / norm[j, :]
-            dist_mat[k, j] = np.abs(np.diag(confmat_k - confmat_j)).mean()
-
-    return np.max(dist_mat) if aggregation_fun == "max" else np.sum(dist_mat) / (num_groups * (num_groups - 1) / 2)
+    return _multiclass_true_rates(conftens, aggregation_fun=aggregation_fun)
 
 
 def multiclass_statistical_parity(p_attr, y_pred, groups=None, classes=None, aggregation_fun="mean"):
@@ -726,23 +799,10 @@ def multiclass_statistical_parity(p_attr, y_pred, groups=None, classes=None, agg
         classes=classes,
     )
 
-    # variables
-    num_groups = len(groups)
-
-    # compute frequency matrix (normalised by class)
-    sr_mat = frequency_matrix(p_attr, y_pred, groups, classes).to_numpy() + 1e-32
+    # compute frequency counts
+    freq_counts = _frequency_counts(p_attr, y_pred, groups, classes)
 
-    # initialize distance matrix
-    dist_mat = np.zeros((num_groups, num_groups))
-
-    # distance confusion matrix across groups
-    for k in range(num_groups):
-        pred_prob_k = sr_mat[k]
-        for j in range(k + 1, num_groups):
-            pred_prob_j = sr_mat[j]
-            dist_mat[k, j] = np.abs(pred_prob_k - pred_prob_j).sum() / 2
-
-    return np.max(dist_mat) if aggregation_fun == "max" else np.sum(dist_mat) / (num_groups * (num_groups - 1) / 2)
+    return _multiclass_statistical_parity(freq_counts, aggregation_fun=aggregation_fun)
 
 
 def multiclass_bias_metrics(p_attr, y_pred, y_true, groups=None, classes=None, metric_type="equal_outcome"):
@@ -773,17 +833,17 @@ def multiclass_bias_metrics(p_attr, y_pred, y_true, groups=None, classes=None, m
     """
 
     perform = {
-        "Max Multiclass Statistical Parity": multiclass_statistical_parity,
-        "Mean Multiclass Statistical Parity": multiclass_statistical_parity,
+        "Max Multiclass Statistical Parity": _multiclass_statistical_parity,
+        "Mean Multiclass Statistical Parity": _multiclass_statistical_parity,
     }
 
     true_perform = {
-        "Max Multiclass Equality of Opportunity": multiclass_equality_of_opp,
-        "Max Multiclass Average Odds": multiclass_average_odds,
-        "Max Multiclass True Positive Difference": multiclass_true_rates,
-        "Mean Multiclass Equality of Opportunity": multiclass_equality_of_opp,
-        "Mean Multiclass Average Odds": multiclass_average_odds,
-        "Mean Multiclass True Positive Difference": multiclass_true_rates,
+        "Max Multiclass Equality of Opportunity": _multiclass_equality_of_opp,
+        "Max Multiclass Average Odds": _multiclass_average_odds,
+        "Max Multiclass True Positive Difference": _multiclass_true_rates,
+        "Mean Multiclass Equality of Opportunity": _multiclass_equality_of_opp,
+        "Mean Multiclass Average Odds": _multiclass_average_odds,
+        "Mean Multiclass True Positive Difference": _multiclass_true_rates,
     }
 
     ref_vals = {
@@ -813,19 +873,39 @@ def multiclass_bias_metrics(p_attr, y_pred, y_true, groups=None, classes=None, m
     out_metrics = []
     opp_metrics = []
 
+    # counts shared by all equal outcome metrics
+    p_attr_, y_pred_, _, groups_, classes_ = _multiclass_checks(
+        p_attr=p_attr,
+        y_pred=y_pred,
+        y_true=None,
+        groups=groups,
+        classes=classes,
+    )
+    freq_counts = _frequency_counts(p_attr_, y_pred_, groups_, classes_)
+
     out_metrics += [
         [
             pf,
-            fn(p_attr, y_pred, groups, classes, aggregation_fun=param[pf]),
+            fn(freq_counts, aggregation_fun=param[pf]),
             ref_vals[pf],
         ]
         for pf, fn in perform.items()
     ]
     if y_true is not None:
+        # confusion tensor shared by all equal opportunity metrics
+        p_attr_, y_pred_, y_true_, groups_, classes_ = _multiclass_checks(
+            p_attr=p_attr,
+            y_pred=y_pred,
+            y_true=y_true,
+            groups=groups,
+            classes=classes,
+        )
+        conftens = _confusion_tensor(p_attr_, y_pred_, y_true_, groups_, classes_)
+
         opp_metrics += [
             [
                 pf,
-                fn(p_attr, y_pred, y_true, groups, classes, aggregation_fun=param[pf]),
+                fn(conftens, aggregation_fun=param[pf]),
                 ref_vals[pf],
             ]
             for pf, fn in true_perform.items()
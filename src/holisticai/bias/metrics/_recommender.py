@@ -1,6 +1,7 @@
 # Base imports
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 # sklearn imports
 from sklearn.metrics import mean_absolute_error
@@ -10,6 +11,7 @@ from holisticai.utils import mat_to_binary, normalize_tensor
 
 # Recommender Efficacy Metrics
 from holisticai.utils._recommender_tools import (
+    _axis_sum,
     avg_f1,
     avg_precision,
     avg_recall,
@@ -35,7 +37,7 @@ def aggregate_diversity(mat_pred, top=None, thresh=0.5, normalize=False):
 
     Parameters
     ----------
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender\
         score (binary or soft pred) for each user,item interaction.
     top : int, optional
@@ -96,7 +98,7 @@ def aggregate_diversity(mat_pred, top=None, thresh=0.5, normalize=False):
     binary_mat_pred = mat_to_binary(mat_pred, top=top, thresh=thresh)
 
     # Count items by summing over users
-    item_count = binary_mat_pred.sum(axis=0)
+    item_count = _axis_sum(binary_mat_pred, 0)
 
     # Proportion of all items shown
     return (item_count >= 1).sum() / len(item_count)
@@ -116,7 +118,7 @@ def gini_index(mat_pred, top=None, thresh=0.5, normalize=False):
 
     Parameters
     ----------
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender\
         score (binary or soft pred) for each user,item interaction.
     top : int, optional
@@ -176,7 +178,7 @@ def gini_index(mat_pred, top=None, thresh=0.5, normalize=False):
     binary_mat_pred = mat_to_binary(mat_pred, top=top, thresh=thresh)
 
     # compute frequencies and sort them
-    item_nums = binary_mat_pred.sum(axis=0)
+    item_nums = _axis_sum(binary_mat_pred, 0)
     item_freqs = item_nums / item_nums.sum()
     item_freqs_s = np.sort(item_freqs)
 
@@ -199,7 +201,7 @@ def exposure_entropy(mat_pred, top=None, thresh=0.5, normalize=False):
 
     Parameters
     ----------
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender\
         score (binary or soft pred) for each user,item interaction.
     top : int, optional
@@ -252,7 +254,7 @@ def exposure_entropy(mat_pred, top=None, thresh=0.5, normalize=False):
 
     # Get the item exposures
     binary_mat_pred = mat_to_binary(mat_pred, top=top, thresh=thresh)
-    item_exposures = binary_mat_pred.sum(axis=0)
+    item_exposures = _axis_sum(binary_mat_pred, 0)
     item_exposure_dist = item_exposures / item_exposures.sum()
 
     # Return entropy
@@ -273,7 +275,7 @@ def avg_recommendation_popularity(mat_pred, top=None, thresh=0.5, normalize=Fals
 
     Parameters
     ----------
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender\
         score (binary or soft pred) for each user,item interaction.
     top : int, optional
@@ -328,9 +330,9 @@ def avg_recommendation_popularity(mat_pred, top=None, thresh=0.5, normalize=Fals
 
     # Make matrices binary
     binary_mat_pred = mat_to_binary(mat_pred, top=top, thresh=thresh)
-    item_count = binary_mat_pred.sum(axis=0)
+    item_count = _axis_sum(binary_mat_pred, 0)
 
-    val = (binary_mat_pred * item_count).sum(axis=1) / (binary_mat_pred.sum(axis=1))
+    val = (binary_mat_pred @ item_count) / _axis_sum(binary_mat_pred, 1)
     return np.nanmean(val)
 
 
@@ -352,7 +354,7 @@ def mad_score(group_a, group_b, mat_pred, normalize=False):
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each user,item interaction.
     normalize : bool, optional
@@ -417,7 +419,9 @@ def mad_score(group_a, group_b, mat_pred, normalize=False):
     mat_pred_a = mat_pred[group_a == 1]
     mat_pred_b = mat_pred[group_b == 1]
 
-    # Get averages
+    # Get averages (over the stored scores if sparse)
+    if sparse.issparse(mat_pred):
+        mat_pred_a, mat_pred_b = mat_pred_a.data, mat_pred_b.data
     avg_a = np.nanmean(mat_pred_a)
     avg_b = np.nanmean(mat_pred_b)
 
@@ -442,7 +446,7 @@ def exposure_l1(group_a, group_b, mat_pred, top=None, thresh=0.5, normalize=Fals
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender\
         score (binary or soft pred) for each user,item interaction.
     top (optional) : int
@@ -504,11 +508,11 @@ def exposure_l1(group_a, group_b, mat_pred, top=None, thresh=0.5, normalize=Fals
     mat_pred_b = binary_mat_pred[group_b == 1]
 
     # Get the item exposure distribution for group_a
-    item_count_a = mat_pred_a.sum(axis=0)
+    item_count_a = _axis_sum(mat_pred_a, 0)
     item_dist_a = item_count_a / item_count_a.sum()
 
     # Get the item exposure distribution for group_b
-    item_count_b = mat_pred_b.sum(axis=0)
+    item_count_b = _axis_sum(mat_pred_b, 0)
     item_dist_b = item_count_b / item_count_b.sum()
 
     # Compute Total variation distance
@@ -533,7 +537,7 @@ def exposure_kl(group_a, group_b, mat_pred, top=None, thresh=0.5, normalize=Fals
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender\
         score (binary or soft pred) for each user,item interaction.
     top : int, optional
@@ -599,12 +603,12 @@ def exposure_kl(group_a, group_b, mat_pred, top=None, thresh=0.5, normalize=Fals
 
     # Get the item exposure distribution for group_a
     binary_mat_pred_a = mat_to_binary(mat_pred_a, top=top, thresh=thresh)
-    item_count_a = binary_mat_pred_a.sum(axis=0)
+    item_count_a = _axis_sum(binary_mat_pred_a, 0)
     item_dist_a = item_count_a / item_count_a.sum()
 
     # Get the item exposure distribution for group_b
     binary_mat_pred_b = mat_to_binary(mat_pred_b, top=top, thresh=thresh)
-    item_count_b = binary_mat_pred_b.sum(axis=0)
+    item_count_b = _axis_sum(binary_mat_pred_b, 0)
     item_dist_b = item_count_b / item_count_b.sum()
 
     # Compute KL divergence between dists
@@ -624,10 +628,10 @@ def _recommender_metric_ratio(metric, group_a, group_b, mat_pred, mat_true, top=
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender\
         score (binary or soft pred) for each user,item interaction.
-    mat_true : matrix-like
+    mat_true : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A target score\
         (binary or soft pred) for each user,item pair.
     top : int, optional
@@ -655,9 +659,15 @@ def _recommender_metric_ratio(metric, group_a, group_b, mat_pred, mat_true, top=
 
     # if normalize
     if normalize:
-        tens = np.stack((mat_pred, mat_true))
-        norm_tens = normalize_tensor(tens)
-        mat_pred, mat_true = norm_tens
+        if sparse.issparse(mat_pred):
+            # normalise the stacked stored scores and split them back
+            n_users = mat_pred.shape[0]
+            norm_mat = normalize_tensor(sparse.vstack((mat_pred, mat_true), format="csr"))
+            mat_pred, mat_true = norm_mat[:n_users], norm_mat[n_users:]
+        else:
+            tens = np.stack((mat_pred, mat_true))
+            norm_tens = normalize_tensor(tens)
+            mat_pred, mat_true = norm_tens
 
     # Split by group
     mat_pred_a = mat_pred[group_a == 1]
@@ -695,10 +705,10 @@ def avg_precision_ratio(group_a, group_b, mat_pred, mat_true, top=None, thresh=0
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender\
         score (binary or soft pred) for each user,item interaction.
-    mat_true : matrix-like
+    mat_true : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A target score\
         (binary or soft pred) for each user,item pair.
     top : int, optional
@@ -769,10 +779,10 @@ def avg_recall_ratio(group_a, group_b, mat_pred, mat_true, top=None, thresh=0.5,
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each user,item interaction.
-    mat_true : matrix-like
+    mat_true : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each user,item pair.
     top : int, optional
@@ -848,10 +858,10 @@ def avg_f1_ratio(group_a, group_b, mat_pred, mat_true, top=None, thresh=0.5, nor
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each user,item interaction.
-    mat_true : matrix-like
+    mat_true : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each user,item pair.
     top : int, optional
@@ -929,10 +939,10 @@ def recommender_rmse_ratio(group_a, group_b, mat_pred, mat_true, normalize=False
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each user,item interaction.
-    mat_true : matrix-like
+    mat_true : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each user,item pair.
     normalize : bool, optional
@@ -1005,10 +1015,10 @@ def recommender_mae_ratio(group_a, group_b, mat_pred, mat_true, normalize=False)
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each user,item interaction.
-    mat_true : matrix-like
+    mat_true : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each user,item pair.
     normalize : bool, optional
@@ -1077,7 +1087,10 @@ def recommender_bias_metrics(
     """Recommender bias metrics batch computation
 
     This function computes all the relevant recommender bias metrics,
-    and displays them as a pandas dataframe.
+    and displays them as a pandas dataframe. The score matrices may be
+    scipy sparse matrices (as returned by `recommender_formatter` with
+    `sparse_output=True`), in which case the stored entries are the
+    observed scores and the missing ones play the role of nan.
 
     Parameters
     ----------
@@ -1085,10 +1098,10 @@ def recommender_bias_metrics(
         Group membership vector.
     group_b : array-like
         Group membership vector.
-    mat_pred : matrix-like
+    mat_pred : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each user,item interaction.
-    mat_true : matrix-like
+    mat_true : matrix-like or scipy sparse matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each user,item pair.
     top : int, optional
@@ -13,6 +13,128 @@ def _calc_success_rate(group_membership: np.array, threshold=float):
     return (group_membership > threshold).mean()
 
 
+def _sorted_group_scores(group_a, group_b, y_pred):
+    """Sorted group scores
+
+    This function sorts the predictions once, overall and for each group,\
+    so that pass rates at any threshold can be read with searchsorted.
+
+    Parameters
+    ----------
+    group_a : numpy array
+        Group membership vector (binary)
+    group_b : numpy array
+        Group membership vector (binary)
+    y_pred : numpy array
+        Predictions vector (regression)
+
+    Returns
+    -------
+    tuple of numpy arrays
+        (sorted y_pred, sorted y_pred of group_a, sorted y_pred of group_b)
+    """
+    return np.sort(y_pred), np.sort(y_pred[group_a == 1]), np.sort(y_pred[group_b == 1])
+
+
+def _pass_counts(sorted_scores, thresholds):
+    """
+    Number of sorted scores greater or equal than each threshold
+    """
+    return len(sorted_scores) - np.searchsorted(sorted_scores, thresholds, side="left")
+
+
+def _quantile_pass_rates(sorted_scores, q):
+    """Pass rates at quantile thresholds
+
+    This function computes the thresholds at quantiles q of all\
+    the predictions and the fraction of each group passing them.
+
+    Parameters
+    ----------
+    sorted_scores : tuple of numpy arrays
+        Output of _sorted_group_scores
+    q : numpy array
+        Quantiles
+
+    Returns
+    -------
+    tuple of numpy arrays
+        (thresholds, pass counts a, pass counts b, success rates a, success rates b)
+    """
+    sorted_all, sorted_a, sorted_b = sorted_scores
+    thresholds = np.quantile(sorted_all, q)
+    pass_a = _pass_counts(sorted_a, thresholds)
+    pass_b = _pass_counts(sorted_b, thresholds)
+    return thresholds, pass_a, pass_b, pass_a / len(sorted_a), pass_b / len(sorted_b)
+
+
+def _statistical_parity_curve(sorted_scores, exact=False):
+    """Statistical parity versus threshold curve
+
+    This function computes the absolute difference of pass rates of the\
+    two groups at thresholds sweeping the quantiles of the predictions from\
+    1 to 0. By default 150 evenly spaced quantiles are used; if exact is True\
+    every prediction is used as a threshold.
+
+    Parameters
+    ----------
+    sorted_scores : tuple of numpy arrays
+        Output of _sorted_group_scores
+    exact : bool, optional
+        Whether to evaluate the curve at every prediction, default False
+
+    Returns
+    -------
+    numpy array
+        Absolute statistical parity at each threshold
+    """
+    sorted_all, sorted_a, sorted_b = sorted_scores
+    pass_value = sorted_all[::-1] if exact else np.quantile(sorted_all, np.linspace(1, 0, 150))
+    pass_a = _pass_counts(sorted_a, pass_value) / len(sorted_a)
+    pass_b = _pass_counts(sorted_b, pass_value) / len(sorted_b)
+    return np.abs(pass_a - pass_b)
+
+
+def _statistical_parity_auc(sorted_scores, exact=False):
+    di_arr = _statistical_parity_curve(sorted_scores, exact=exact)
+    return np.sum(di_arr / len(di_arr))
+
+
+def _max_statistical_parity(sorted_scores, exact=False):
+    return np.max(_statistical_parity_curve(sorted_scores, exact=exact))
+
+
+def _disparate_impact_regression(sorted_scores, q):
+    q = np.atleast_1d(q)
+    _, pass_a, pass_b, sr_a, sr_b = _quantile_pass_rates(sorted_scores, q)
+    for i in range(len(q)):
+        _check_non_empty(pass_a[i : i + 1], name="group_a", quantile=q[i])
+        _check_non_empty(pass_b[i : i + 1], name="group_b", quantile=q[i])
+    return np.squeeze(sr_a / sr_b)[()]
+
+
+def _statistical_parity_regression(sorted_scores, q):
+    q = np.atleast_1d(q)
+    _, pass_a, pass_b, sr_a, sr_b = _quantile_pass_rates(sorted_scores, q)
+    for i in range(len(q)):
+        _check_non_empty(pass_a[i : i + 1], name="group_a", quantile=q[i])
+        _check_non_empty(pass_b[i : i + 1], name="group_b", quantile=q[i])
+    return np.squeeze(sr_a - sr_b)[()]
+
+
+def _no_disparate_impact_level(sorted_scores):
+    # grid
+    q = np.linspace(1.0, 0.0, 100)
+    pred, _, _, a, b = _quantile_pass_rates(sorted_scores, q)
+
+    # find score that does not allow adverse impact
+    lower_bound = 0.8
+    upper_bound = 1.2
+    ratio = np.divide(a, b, out=np.zeros_like(a), where=b > 0)
+    found = np.flatnonzero((b > 0) & (lower_bound < ratio) & (ratio < upper_bound))
+    return pred[found[0]] if len(found) > 0 else pred[-1]
+
+
 def success_rate_regression(group_a, group_b, y_pred, threshold=0.50):
     """Success rate (Regression version)
 
@@ -101,26 +223,7 @@ def disparate_impact_regression(group_a, group_b, y_pred, q=0.8):
     # check and coerce inputs
     group_a, group_b, y_pred, _, q = _regression_checks(group_a, group_b, y_pred, None, q)
 
-    # numbers
-    n_a = group_a.sum()
-    n_b = group_b.sum()
-
-    _, group_a_list, group_b_list = slice_arrays_by_quantile(q, y_pred, [y_pred, group_a, group_b])
-
-    n_q = len(group_a_list)
-    disp_impact = np.zeros(n_q)
-
-    for i in range(n_q):
-        group_a, group_b = group_a_list[i], group_b_list[i]
-        _check_non_empty(group_a, name="group_a", quantile=q[i])
-        _check_non_empty(group_b, name="group_b", quantile=q[i])
-
-        sr_a = group_a.sum() / n_a  # success rate group_a
-        sr_b = group_b.sum() / n_b  # success rate group_b
-
-        disp_impact[i] = sr_a / sr_b
-
-    return np.squeeze(disp_impact)[()]
+    return _disparate_impact_regression(_sorted_group_scores(group_a, group_b, y_pred), q)
 
 
 def statistical_parity_regression(group_a, group_b, y_pred, q=0.5):
@@ -166,26 +269,7 @@ def statistical_parity_regression(group_a, group_b, y_pred, q=0.5):
     # check and coerce inputs
     group_a, group_b, y_pred, _, q = _regression_checks(group_a, group_b, y_pred, None, q)
 
-    # numbers
-    n_a = group_a.sum()
-    n_b = group_b.sum()
-
-    _, group_a_list, group_b_list = slice_arrays_by_quantile(q, y_pred, [y_pred, group_a, group_b])
-
-    n_q = len(group_a_list)
-    stat_parity = np.zeros(n_q)
-
-    for i in range(n_q):
-        group_a, group_b = group_a_list[i], group_b_list[i]
-        _check_non_empty(group_a, name="group_a", quantile=q[i])
-        _check_non_empty(group_b, name="group_b", quantile=q[i])
-
-        sr_a = group_a.sum() / n_a  # success rate group_a
-        sr_b = group_b.sum() / n_b  # success rate group_b
-
-        stat_parity[i] = sr_a - sr_b
-
-    return np.squeeze(stat_parity)[()]
+    return _statistical_parity_regression(_sorted_group_scores(group_a, group_b, y_pred), q)
 
 
 def no_disparate_impact_level(group_a, group_b, y_pred):
@@ -224,21 +308,7 @@ def no_disparate_impact_level(group_a, group_b, y_pred):
     # check and coerce inputs
     group_a, group_b, y_pred, _, _ = _regression_checks(group_a, group_b, y_pred, None, None)
 
-    # grid
-    q = np.linspace(1.0, 0.0, 100)
-
-    # try different values
-    for v in q:
-        pred = np.quantile(y_pred, v)
-        pass_members = y_pred >= pred
-        a = sum(group_a * pass_members) / group_a.sum()
-        b = sum(group_b * pass_members) / group_b.sum()
-        # find score that does not allow adverse impact
-        lower_bound = 0.8
-        upper_bound = 1.2
-        if b > 0 and lower_bound < a / b < upper_bound:
-            break
-    return pred
+    return _no_disparate_impact_level(_sorted_group_scores(group_a, group_b, y_pred))
 
 
 def avg_score_diff(group_a, group_b, y_pred, q=0):
@@ -456,7 +526,7 @@ def zscore_diff(group_a, group_b, y_pred, q=0):
     return np.squeeze(zscore_diff)[()]
 
 
-def statistical_parity_auc(group_a, group_b, y_pred):
+def statistical_parity_auc(group_a, group_b, y_pred, exact=False):
     """Statistical parity (AUC)
 
     This function computes the area under the statistical parity\
@@ -475,6 +545,9 @@ def statistical_parity_auc(group_a, group_b, y_pred):
         Group membership vector (binary)
     y_pred : array-like
         Predictions vector (regression)
+    exact : bool, optional
+        If True, every prediction is used as a threshold instead\
+        of 150 evenly spaced quantiles, default False
 
     Returns
     -------
@@ -494,19 +567,11 @@ def statistical_parity_auc(group_a, group_b, y_pred):
     # check and coerce inputs
     group_a, group_b, y_pred, _, _ = _regression_checks(group_a, group_b, y_pred, None, None)
 
-    # thresholds
-    thresh = np.linspace(1, 0, 150)
-    pass_value = np.quantile(y_pred, thresh)
-    y_binary = y_pred.reshape(-1, 1) >= pass_value.reshape(1, -1)
-    pass_a = y_binary[group_a == 1].sum(axis=0) / group_a.sum()
-    pass_b = y_binary[group_b == 1].sum(axis=0) / group_b.sum()
-    di_arr = np.abs(pass_a - pass_b)
-
     # AUC
-    return np.sum(di_arr * np.array([1 / 150] * 150))
+    return _statistical_parity_auc(_sorted_group_scores(group_a, group_b, y_pred), exact=exact)
 
 
-def _weighed_statistical_parity_auc(group_a, group_b, y_pred):
+def _weighed_statistical_parity_auc(group_a, group_b, y_pred, exact=False):
     """Weighed Statistical parity (AUC)
 
     This function computes the area under the statistical\
@@ -525,6 +590,9 @@ def _weighed_statistical_parity_auc(group_a, group_b, y_pred):
         Group membership vector (binary)
     y_pred : array-like
         Predictions vector (regression)
+    exact : bool, optional
+        If True, every prediction is used as a threshold instead\
+        of 150 evenly spaced quantiles, default False
 
     Returns
     -------
@@ -544,20 +612,14 @@ def _weighed_statistical_parity_auc(group_a, group_b, y_pred):
     # check and coerce inputs
     group_a, group_b, y_pred, _, _ = _regression_checks(group_a, group_b, y_pred, None, None)
 
-    # thresholds
-    thresh = np.linspace(1, 0, 150)
-    pass_value = np.quantile(y_pred, thresh)
-    y_binary = y_pred.reshape(-1, 1) >= pass_value.reshape(1, -1)
-    pass_a = y_binary[group_a == 1].sum(axis=0) / group_a.sum()
-    pass_b = y_binary[group_b == 1].sum(axis=0) / group_b.sum()
-    di_arr = np.abs(pass_a - pass_b)
-    differentials = np.linspace(2, 0, 150)
+    di_arr = _statistical_parity_curve(_sorted_group_scores(group_a, group_b, y_pred), exact=exact)
+    differentials = np.linspace(2, 0, len(di_arr))
 
     # Weighed AUC
-    return np.sum(di_arr * differentials / 150)
+    return np.sum(di_arr * differentials / len(di_arr))
 
 
-def max_statistical_parity(group_a, group_b, y_pred):
+def max_statistical_parity(group_a, group_b, y_pred, exact=False):
     """Max absolute statistical parity
 
     This function computes the maximum over all thresholds of\
@@ -576,6 +638,9 @@ def max_statistical_parity(group_a, group_b, y_pred):
         Group membership vector (binary)
     y_pred : array-like
         Predictions vector (regression)
+    exact : bool, optional
+        If True, every prediction is used as a threshold instead\
+        of 150 evenly spaced quantiles, default False
 
     Returns
     -------
@@ -595,16 +660,8 @@ def max_statistical_parity(group_a, group_b, y_pred):
     # check and coerce inputs
     group_a, group_b, y_pred, _, _ = _regression_checks(group_a, group_b, y_pred, None, None)
 
-    # thresholds
-    thresh = np.linspace(1, 0, 150)
-    pass_value = np.quantile(y_pred, thresh)
-    y_binary = y_pred.reshape(-1, 1) >= pass_value.reshape(1, -1)
-    pass_a = y_binary[group_a == 1].sum(axis=0) / group_a.sum()
-    pass_b = y_binary[group_b == 1].sum(axis=0) / group_b.sum()
-    di_arr = np.abs(pass_a - pass_b)
-
     # MAX
-    return np.max(di_arr)
+    return _max_statistical_parity(_sorted_group_scores(group_a, group_b, y_pred), exact=exact)
 
 
 def correlation_diff(group_a, group_b, y_pred, y_true, q=0):
@@ -858,16 +915,27 @@ def regression_bias_metrics(group_a, group_b, y_pred, y_true=None, metric_type="
     }
 
     equal_outcome_metrics = {
-        "Disparate Impact Q90": disparate_impact_regression,
-        "Disparate Impact Q80": disparate_impact_regression,
-        "Disparate Impact Q50": disparate_impact_regression,
-        "Statistical Parity Q50": statistical_parity_regression,
-        "No Disparate Impact Level": no_disparate_impact_level,
+        "Disparate Impact Q90": _disparate_impact_regression,
+        "Disparate Impact Q80": _disparate_impact_regression,
+        "Disparate Impact Q50": _disparate_impact_regression,
+        "Statistical Parity Q50": _statistical_parity_regression,
+        "No Disparate Impact Level": _no_disparate_impact_level,
         "Average Score Difference": avg_score_diff,
         "Average Score Ratio": avg_score_ratio,
         "Z Score Difference": zscore_diff,
-        "Max Statistical Parity": max_statistical_parity,
-        "Statistical Parity AUC": statistical_parity_auc,
+        "Max Statistical Parity": _max_statistical_parity,
+        "Statistical Parity AUC": _statistical_parity_auc,
+    }
+
+    # metrics computed from the predictions sorted once per group
+    sorted_metrics = {
+        "Disparate Impact Q90",
+        "Disparate Impact Q80",
+        "Disparate Impact Q50",
+        "Statistical Parity Q50",
+        "No Disparate Impact Level",
+        "Max Statistical Parity",
+        "Statistical Parity AUC",
     }
 
     equal_opportunity_metrics = {
@@ -923,8 +991,16 @@ def regression_bias_metrics(group_a, group_b, y_pred, y_true=None, metric_type="
     has_group_parameters = all((p is not None) for p in [group_a, group_b, y_pred])
 
     if has_group_parameters:
+        group_a_, group_b_, y_pred_, _, _ = _regression_checks(group_a, group_b, y_pred, None, None)
+        sorted_scores = _sorted_group_scores(group_a_, group_b_, y_pred_)
+
         out_metrics = [
-            [pf, fn(group_a, group_b, y_pred, **hypers[pf]), ref_vals[pf]] for pf, fn in equal_outcome_metrics.items()
+            [
+                pf,
+                fn(sorted_scores, **hypers[pf]) if pf in sorted_metrics else fn(group_a, group_b, y_pred, **hypers[pf]),
+                ref_vals[pf],
+            ]
+            for pf, fn in equal_outcome_metrics.items()
         ]
         if y_true is not None:
             opp_metrics = [
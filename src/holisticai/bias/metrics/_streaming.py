@@ -0,0 +1,800 @@
+# Base Imports
+import numpy as np
+import pandas as pd
+
+# Metrics
+from holisticai.bias.metrics._classification import (
+    _accuracy_diff,
+    _average_odds_diff,
+    _classification_stats_from_counts,
+    _cohen_d,
+    _disparate_impact,
+    _equal_opportunity_diff,
+    _false_positive_rate_diff,
+    _four_fifths,
+    _group_confusion_counts,
+    _statistical_parity,
+    _z_test_diff,
+)
+from holisticai.bias.metrics._multiclass import (
+    _confusion_tensor,
+    _frequency_counts,
+    _multiclass_average_odds,
+    _multiclass_equality_of_opp,
+    _multiclass_statistical_parity,
+    _multiclass_true_rates,
+)
+
+# utils
+from holisticai.utils._validation import _classification_checks, _multiclass_checks, _regression_checks
+
+
+def _metrics_frame(metrics):
+    return pd.DataFrame(metrics, columns=["Metric", "Value", "Reference"]).set_index("Metric")
+
+
+def _select_metrics(out_metrics, opp_metrics, metric_type):
+    """
+    Select the metrics to report ('group', 'equal_outcome' or 'equal_opportunity')
+    """
+    if metric_type == "group":
+        return _metrics_frame(out_metrics + opp_metrics)
+
+    if metric_type == "equal_outcome":
+        return _metrics_frame(out_metrics)
+
+    if metric_type == "equal_opportunity":
+        return _metrics_frame(opp_metrics)
+
+    msg = "metric_type is not one of : group, equal_outcome, equal_opportunity"
+    raise ValueError(msg)
+
+
+class ClassificationBiasAccumulator:
+    """
+    Streaming Classification Bias Metrics
+
+    Accumulates the confusion counts (tn, fp, fn, tp) of group_a and group_b\
+    over batches of predictions, so that the group metrics of\
+    classification_bias_metrics can be computed without holding all the\
+    predictions in memory. Accumulators built on separate shards can be\
+    combined with merge. Memory is constant in the number of rows seen and\
+    the results are exact.
+
+    ABROCA is not included, since it needs the full score distribution.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from holisticai.bias.metrics import ClassificationBiasAccumulator
+    >>> group_a = np.array([1, 1, 1, 1, 0, 0, 0, 0, 0, 0])
+    >>> group_b = np.array([0, 0, 0, 0, 1, 1, 1, 1, 1, 1])
+    >>> y_pred = np.array([1, 1, 1, 0, 1, 1, 0, 0, 0, 0])
+    >>> y_true = np.array([1, 1, 0, 0, 1, 0, 1, 0, 0, 1])
+    >>> acc = ClassificationBiasAccumulator()
+    >>> for batch in [slice(0, 5), slice(5, 10)]:
+    ...     _ = acc.update(group_a[batch], group_b[batch], y_pred[batch], y_true[batch])
+    >>> float(acc.compute().loc["Statistical Parity", "Value"])
+    0.4166666666666667
+    """
+
+    def __init__(self):
+        self.counts_a = None
+        self.counts_b = None
+
+    def update(self, group_a, group_b, y_pred, y_true=None):
+        """
+        Add a batch of predictions.
+
+        Parameters
+        ----------
+        group_a : array-like
+            Group membership vector (binary)
+        group_b : array-like
+            Group membership vector (binary)
+        y_pred : array-like
+            Predictions vector (binary)
+        y_true : array-like, optional
+            Target vector (binary), must be given for every batch or for none
+
+        Returns
+        -------
+        self
+        """
+        group_a, group_b, y_pred, y_true = _classification_checks(group_a, group_b, y_pred, y_true)
+        counts_a = _group_confusion_counts(group_a, y_pred, y_true)
+        counts_b = _group_confusion_counts(group_b, y_pred, y_true)
+        self._add(counts_a, counts_b)
+        return self
+
+    def merge(self, other):
+        """
+        Add the counts accumulated by another ClassificationBiasAccumulator.
+
+        Returns
+        -------
+        self
+        """
+        if other.counts_a is not None:
+            self._add(other.counts_a, other.counts_b)
+        return self
+
+    def _add(self, counts_a, counts_b):
+        if self.counts_a is None:
+            self.counts_a = counts_a.copy()
+            self.counts_b = counts_b.copy()
+            return
+        if len(counts_a) != len(self.counts_a):
+            msg = "y_true must be given for every batch or for none of them."
+            raise ValueError(msg)
+        self.counts_a = self.counts_a + counts_a
+        self.counts_b = self.counts_b + counts_b
+
+    def compute(self, metric_type="group"):
+        """
+        Compute the group bias metrics of all the rows seen so far.
+
+        Parameters
+        ----------
+        metric_type : str, optional
+            Specifies which metrics we compute: 'group', 'equal_outcome' or 'equal_opportunity'
+
+        Returns
+        -------
+        pandas DataFrame
+            Metrics | Values | Reference
+        """
+        if self.counts_a is None:
+            msg = "No data has been accumulated, call update first."
+            raise ValueError(msg)
+
+        equal_outcome_metrics = {
+            "Statistical Parity": (_statistical_parity, 0),
+            "Disparate Impact": (_disparate_impact, 1),
+            "Four Fifths Rule": (_four_fifths, 1),
+            "Cohen D": (_cohen_d, 0),
+            "2SD Rule": (_z_test_diff, 0),
+        }
+
+        equal_opportunity_metrics = {
+            "Equality of Opportunity Difference": (_equal_opportunity_diff, 0),
+            "False Positive Rate Difference": (_false_positive_rate_diff, 0),
+            "Average Odds Difference": (_average_odds_diff, 0),
+            "Accuracy Difference": (_accuracy_diff, 0),
+        }
+
+        stats = _classification_stats_from_counts(self.counts_a, self.counts_b)
+        out_metrics = [[pf, fn(stats), ref] for pf, (fn, ref) in equal_outcome_metrics.items()]
+        opp_metrics = []
+        if len(self.counts_a) == 4:
+            opp_metrics += [[pf, fn(stats), ref] for pf, (fn, ref) in equal_opportunity_metrics.items()]
+        return _select_metrics(out_metrics, opp_metrics, metric_type)
+
+
+class MulticlassBiasAccumulator:
+    """
+    Streaming Multiclass Bias Metrics
+
+    Accumulates the confusion tensor (or, without y_true, the group by class\
+    frequency counts) over batches of predictions, so that the metrics of\
+    multiclass_bias_metrics can be computed without holding all the predictions\
+    in memory. Groups and classes are discovered from the data as they appear\
+    and kept in sorted order. Accumulators built on separate shards can be\
+    combined with merge. Memory is constant in the number of rows seen and the\
+    results are exact.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from holisticai.bias.metrics import MulticlassBiasAccumulator
+    >>> p_attr = np.array(["A", "A", "A", "A", "B", "B", "B", "B", "C", "C"])
+    >>> y_pred = np.array([0, 1, 2, 0, 1, 2, 0, 1, 2, 0])
+    >>> acc = MulticlassBiasAccumulator()
+    >>> for batch in [slice(0, 6), slice(6, 10)]:
+    ...     _ = acc.update(p_attr[batch], y_pred[batch])
+    >>> float(acc.compute().loc["Max Multiclass Statistical Parity", "Value"])
+    0.5
+    """
+
+    def __init__(self):
+        self.groups = None
+        self.classes = None
+        self.counts = None
+
+    def update(self, p_attr, y_pred, y_true=None):
+        """
+        Add a batch of predictions.
+
+        Parameters
+        ----------
+        p_attr : array-like
+            Multiclass protected attribute vector
+        y_pred : array-like
+            Prediction vector (categorical)
+        y_true : array-like, optional
+            Target vector (categorical), must be given for every batch or for none
+
+        Returns
+        -------
+        self
+        """
+        p_attr, y_pred, y_true, groups, classes = _multiclass_checks(p_attr=p_attr, y_pred=y_pred, y_true=y_true)
+        if y_true is None:
+            counts = _frequency_counts(p_attr, y_pred, groups, classes)
+        else:
+            counts = _confusion_tensor(p_attr, y_pred, y_true, groups, classes)
+        self._add(groups, classes, counts)
+        return self
+
+    def merge(self, other):
+        """
+        Add the counts accumulated by another MulticlassBiasAccumulator.
+
+        Returns
+        -------
+        self
+        """
+        if other.counts is not None:
+            self._add(other.groups, other.classes, other.counts)
+        return self
+
+    @staticmethod
+    def _expand(counts, groups, classes, all_groups, all_classes):
+        """
+        Embed counts indexed by (groups, classes) into the (all_groups, all_classes) grid
+        """
+        idx_g = np.searchsorted(all_groups, groups)
+        idx_c = np.searchsorted(all_classes, classes)
+        shape = (len(all_groups),) + (len(all_classes),) * (counts.ndim - 1)
+        out = np.zeros(shape)
+        out[np.ix_(idx_g, *[idx_c] * (counts.ndim - 1))] = counts
+        return out
+
+    def _add(self, groups, classes, counts):
+        if self.counts is None:
+            self.groups, self.classes, self.counts = np.asarray(groups), np.asarray(classes), counts.copy()
+            return
+        if counts.ndim != self.counts.ndim:
+            msg = "y_true must be given for every batch or for none of them."
+            raise ValueError(msg)
+        all_groups = np.union1d(self.groups, groups)
+        all_classes = np.union1d(self.classes, classes)
+        self.counts = self._expand(self.counts, self.groups, self.classes, all_groups, all_classes) + self._expand(
+            counts, groups, classes, all_groups, all_classes
+        )
+        self.groups, self.classes = all_groups, all_classes
+
+    def compute(self, metric_type="equal_outcome"):
+        """
+        Compute the multiclass bias metrics of all the rows seen so far.
+
+        Parameters
+        ----------
+        metric_type : str, optional
+            Specifies which metrics we compute: 'both', 'equal_outcome' or 'equal_opportunity'
+
+        Returns
+        -------
+        pandas DataFrame
+            Metrics | Values | Reference
+        """
+        if self.counts is None:
+            msg = "No data has been accumulated, call update first."
+            raise ValueError(msg)
+
+        has_y_true = self.counts.ndim == 3
+        freq_counts = self.counts.sum(axis=2) if has_y_true else self.counts
+
+        out_metrics = [
+            ["Max Multiclass Statistical Parity", _multiclass_statistical_parity(freq_counts, "max"), 0],
+            ["Mean Multiclass Statistical Parity", _multiclass_statistical_parity(freq_counts, "mean"), 0],
+        ]
+        opp_metrics = []
+        if has_y_true:
+            true_perform = {
+                "Multiclass Equality of Opportunity": _multiclass_equality_of_opp,
+                "Multiclass Average Odds": _multiclass_average_odds,
+                "Multiclass True Positive Difference": _multiclass_true_rates,
+            }
+            for aggregation_fun in ["max", "mean"]:
+                opp_metrics += [
+                    [f"{aggregation_fun.capitalize()} {pf}", fn(self.counts, aggregation_fun), 0]
+                    for pf, fn in true_perform.items()
+                ]
+
+        if metric_type == "both":
+            return _metrics_frame(out_metrics + opp_metrics)
+        if metric_type in ["equal_outcome", "equal_opportunity"]:
+            return _select_metrics(out_metrics, opp_metrics, metric_type)
+
+        msg = "metric_type is not one of : both, equal_outcome, equal_opportunity"
+        raise ValueError(msg)
+
+
+# bits of the value keys covered by each level of the quantile digest, and number of levels above the leaves
+_DIGEST_BITS = 4
+_DIGEST_LEVELS = 64 // _DIGEST_BITS
+# number of (node, threshold) pairs evaluated at once by the tail queries
+_TAIL_BLOCK = 2**20
+
+
+def _ordered_keys(values):
+    """
+    Unsigned 64-bit keys with the same order as the (float) values
+    """
+    bits = (np.asarray(values, dtype=float) + 0.0).view(np.uint64)
+    sign = np.uint64(1 << 63)
+    return np.where(bits & sign, ~bits, bits | sign)
+
+
+def _linear_quantile_indices(n, q):
+    """
+    Ranks and weights of the linear interpolation of np.quantile (default method) for n values
+    """
+    virtual = n * q + (1 - q) - 1
+    previous = np.floor(virtual)
+    above = virtual >= n - 1
+    previous_rank = np.where(above, n - 1, previous)
+    next_rank = np.where(above, n - 1, previous + 1)
+    return previous_rank, next_rank, virtual - previous
+
+
+def _lerp(a, b, t):
+    """
+    Linear interpolation, computed as np.quantile does
+    """
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+class _QuantileDigest:
+    """
+    Mergeable quantile digest of weighted values
+
+    A q-digest [1]_ over the 64-bit keys of the values, where each node has 16\
+    children. Every node covers a range of keys and holds the sum of the weights\
+    of its values for each channel, with the smallest and largest of these values.\
+    Leaves hold a single value, so values that repeat are counted exactly.
+
+    The children of a node are folded into it when it would then hold at most\
+    1/k of the total of every channel. A threshold falls strictly inside at most\
+    one node per level, so ranks, and the channel sums above a threshold, are off\
+    by at most 16/k of the channel totals. Merging digests keeps this bound, and\
+    the number of nodes depends on k but not on the number of values.
+
+    References
+    ----------
+    .. [1] Shrivastava, Nisheeth, et al. "Medians and beyond: new aggregation techniques\
+        for sensor networks." Proceedings of the 2nd international conference on\
+        Embedded networked sensor systems. 2004.
+    """
+
+    def __init__(self, k, n_channels):
+        self.k = k
+        # compress when the number of nodes doubles since the last compression
+        self.capacity = 4 * k
+        self.levels = np.zeros(0, dtype=np.int8)
+        self.prefixes = np.zeros(0, dtype=np.uint64)
+        self.sums = np.zeros((0, n_channels))
+        self.vmin = np.zeros(0)
+        self.vmax = np.zeros(0)
+
+    @property
+    def totals(self):
+        return self.sums.sum(axis=0)
+
+    def add(self, values, weights):
+        """
+        Add values with one weight vector per channel
+        """
+        if len(values) == 0:
+            return
+        values = np.asarray(values, dtype=float) + 0.0
+        keys, inverse = np.unique(_ordered_keys(values), return_inverse=True)
+        sums = np.stack([np.bincount(inverse, weights=w, minlength=len(keys)) for w in weights], axis=1)
+        leaf_values = np.empty(len(keys))
+        leaf_values[inverse] = values
+        self._insert(np.zeros(len(keys), dtype=np.int8), keys, sums, leaf_values, leaf_values)
+
+    def merge(self, other):
+        """
+        Add the nodes of another digest
+        """
+        if len(other.prefixes) > 0:
+            self._insert(other.levels, other.prefixes, other.sums, other.vmin, other.vmax)
+
+    def _insert(self, levels, prefixes, sums, vmin, vmax):
+        levels = np.concatenate([self.levels, levels])
+        prefixes = np.concatenate([self.prefixes, prefixes])
+        sums = np.concatenate([self.sums, sums])
+        vmin = np.concatenate([self.vmin, vmin])
+        vmax = np.concatenate([self.vmax, vmax])
+
+        # sum the nodes present in both digests
+        order = np.lexsort((prefixes, levels))
+        levels, prefixes = levels[order], prefixes[order]
+        starts = np.flatnonzero(np.r_[True, (levels[1:] != levels[:-1]) | (prefixes[1:] != prefixes[:-1])])
+        self.levels, self.prefixes = levels[starts], prefixes[starts]
+        self.sums = np.add.reduceat(sums[order], starts)
+        self.vmin = np.minimum.reduceat(vmin[order], starts)
+        self.vmax = np.maximum.reduceat(vmax[order], starts)
+
+        if len(self.prefixes) > self.capacity:
+            self._compress()
+            self.capacity = max(self.capacity, 2 * len(self.prefixes))
+
+    def _compress(self):
+        """
+        Fold, level by level from the leaves, the children of every node whose total stays within 1/k
+        """
+        threshold = self.totals / self.k
+        order = np.lexsort((self.prefixes, self.levels))
+        bounds = np.searchsorted(self.levels[order], np.arange(_DIGEST_LEVELS + 2))
+        nodes = [
+            [
+                array[order[bounds[level] : bounds[level + 1]]]
+                for array in (self.prefixes, self.sums, self.vmin, self.vmax)
+            ]
+            for level in range(_DIGEST_LEVELS + 1)
+        ]
+        for level in range(_DIGEST_LEVELS):
+            prefixes, sums, vmin, vmax = nodes[level]
+            if len(prefixes) == 0:
+                continue
+            parents = prefixes >> np.uint64(_DIGEST_BITS)
+            starts = np.flatnonzero(np.r_[True, parents[1:] != parents[:-1]])
+            parents = parents[starts]
+            group_sums = np.add.reduceat(sums, starts)
+            group_vmin = np.minimum.reduceat(vmin, starts)
+            group_vmax = np.maximum.reduceat(vmax, starts)
+
+            # parents that are already nodes
+            upper = nodes[level + 1]
+            position = np.minimum(np.searchsorted(upper[0], parents), max(len(upper[0]) - 1, 0))
+            exists = np.zeros(len(parents), dtype=bool)
+            if len(upper[0]) > 0:
+                exists = upper[0][position] == parents
+                group_sums[exists] += upper[1][position[exists]]
+
+            fold = np.all(group_sums <= threshold, axis=1)
+            if not fold.any():
+                continue
+
+            keep = ~np.repeat(fold, np.diff(np.r_[starts, len(prefixes)]))
+            nodes[level] = [array[keep] for array in nodes[level]]
+
+            update = position[fold & exists]
+            upper[1][update] = group_sums[fold & exists]
+            upper[2][update] = np.minimum(upper[2][update], group_vmin[fold & exists])
+            upper[3][update] = np.maximum(upper[3][update], group_vmax[fold & exists])
+            new = fold & ~exists
+            groups = [group[new] for group in (parents, group_sums, group_vmin, group_vmax)]
+            if len(upper[0]) == 0:
+                nodes[level + 1] = groups
+            elif new.any():
+                upper = [np.concatenate([upper[i], groups[i]]) for i in range(len(upper))]
+                order = np.argsort(upper[0], kind="stable")
+                nodes[level + 1] = [array[order] for array in upper]
+
+        self.levels = np.repeat(np.arange(_DIGEST_LEVELS + 1, dtype=np.int8), [len(n[0]) for n in nodes])
+        self.prefixes, self.sums, self.vmin, self.vmax = (np.concatenate([n[i] for n in nodes]) for i in range(4))
+
+    def tail(self, thresholds):
+        """
+        Per channel sums of the values greater or equal than each threshold. The weights of a\
+        node with values on both sides of a threshold are split linearly between its extreme values.
+
+        Returns
+        -------
+        numpy ndarray
+            shape (n_channels, num_thresholds)
+        """
+        thresholds = np.atleast_1d(thresholds)
+        order = np.argsort(self.vmin, kind="stable")
+        suffix = np.zeros((len(order) + 1, self.sums.shape[1]))
+        suffix[:-1] = np.cumsum(self.sums[order][::-1], axis=0)[::-1]
+        result = suffix[np.searchsorted(self.vmin[order], thresholds, side="left")]
+
+        inner = np.flatnonzero(self.vmin < self.vmax)
+        if len(inner) > 0:
+            vmin, vmax = self.vmin[inner, None], self.vmax[inner, None]
+            step = max(1, _TAIL_BLOCK // len(inner))
+            for start in range(0, len(thresholds), step):
+                t = thresholds[None, start : start + step]
+                fraction = np.where(vmin < t, np.clip((vmax - t) / (vmax - vmin), 0, 1), 0)
+                result[start : start + step] += fraction.T @ self.sums[inner]
+        return result.T
+
+    def rank_values(self, ranks, channel=0):
+        """
+        Values at the given (0-based) ranks of the given (count) channel
+        """
+        order = np.argsort(self.vmax, kind="stable")
+        cumulative = np.cumsum(self.sums[order, channel])
+        index = np.minimum(np.searchsorted(cumulative, ranks, side="right"), len(order) - 1)
+        return self.vmax[order[index]]
+
+    def quantile(self, q, channel=0):
+        """
+        Quantiles of the values of the given (count) channel, interpolated as np.quantile does
+        """
+        q = np.atleast_1d(q)
+        previous_rank, next_rank, gamma = _linear_quantile_indices(self.totals[channel], q)
+        return _lerp(self.rank_values(previous_rank, channel), self.rank_values(next_rank, channel), gamma)
+
+
+def _group_moments(y_pred, y_true=None):
+    """
+    Sufficient statistics of a group: count, means, centered second moments and errors
+    """
+    n = len(y_pred)
+    moments = {"n": float(n)}
+    mean_p = y_pred.mean() if n > 0 else 0.0
+    moments["mean_p"] = mean_p
+    moments["m2_p"] = ((y_pred - mean_p) ** 2).sum()
+    if y_true is not None:
+        mean_t = y_true.mean() if n > 0 else 0.0
+        moments["mean_t"] = mean_t
+        moments["m2_t"] = ((y_true - mean_t) ** 2).sum()
+        moments["c_pt"] = ((y_pred - mean_p) * (y_true - mean_t)).sum()
+        moments["sse"] = ((y_true - y_pred) ** 2).sum()
+        moments["sae"] = np.abs(y_true - y_pred).sum()
+    return moments
+
+
+def _combine_moments(m1, m2):
+    """
+    Combine group sufficient statistics (pairwise update of Chan et al.)
+    """
+    n = m1["n"] + m2["n"]
+    if m1["n"] == 0 or m2["n"] == 0:
+        return dict(m2) if m1["n"] == 0 else dict(m1)
+    out = {"n": n}
+    w = m1["n"] * m2["n"] / n
+    delta_p = m2["mean_p"] - m1["mean_p"]
+    out["mean_p"] = m1["mean_p"] + delta_p * m2["n"] / n
+    out["m2_p"] = m1["m2_p"] + m2["m2_p"] + delta_p**2 * w
+    if "mean_t" in m1:
+        delta_t = m2["mean_t"] - m1["mean_t"]
+        out["mean_t"] = m1["mean_t"] + delta_t * m2["n"] / n
+        out["m2_t"] = m1["m2_t"] + m2["m2_t"] + delta_t**2 * w
+        out["c_pt"] = m1["c_pt"] + m2["c_pt"] + delta_p * delta_t * w
+        out["sse"] = m1["sse"] + m2["sse"]
+        out["sae"] = m1["sae"] + m2["sae"]
+    return out
+
+
+class RegressionBiasAccumulator:
+    """
+    Streaming Regression Bias Metrics
+
+    Accumulates, over batches of predictions, the statistics needed by the\
+    metrics of regression_bias_metrics, so that they can be computed without\
+    holding all the predictions in memory. Accumulators built on separate\
+    shards can be combined with merge. Memory is constant in the number of\
+    rows seen.
+
+    Metrics over all the rows (average score difference and ratio, Z score\
+    difference, RMSE and MAE ratios, correlation difference, Jain index) are\
+    exact, computed from per group counts, means and centered moments.\
+    Metrics based on quantiles of y_pred (disparate impact and statistical\
+    parity at a quantile, no disparate impact level, max statistical parity,\
+    statistical parity AUC and the Q80 error ratios) are computed from a\
+    mergeable quantile digest of y_pred. The ranks of their thresholds, and\
+    the counts and errors summed above them, are off by at most rank_error\
+    times the number of rows (or the total error). Values that repeat\
+    exactly are counted exactly, and up to 64 / rank_error distinct
+    values the metrics are those of regression_bias_metrics.
+
+    Parameters
+    ----------
+    rank_error : float, optional
+        Bound on the rank error of the quantiles, as a fraction of the rows, default 0.001
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from holisticai.bias.metrics import RegressionBiasAccumulator, regression_bias_metrics
+    >>> rng = np.random.default_rng(0)
+    >>> group_a = rng.integers(0, 2, 1000)
+    >>> y_pred = rng.random(1000)
+    >>> acc = RegressionBiasAccumulator()
+    >>> for batch in np.array_split(np.arange(1000), 4):
+    ...     _ = acc.update(group_a[batch], 1 - group_a[batch], y_pred[batch])
+    >>> metrics = acc.compute(metric_type="equal_outcome")
+    >>> round(float(metrics.loc["Disparate Impact Q50", "Value"]), 4)
+    0.8902
+    >>> batch = regression_bias_metrics(group_a, 1 - group_a, y_pred, metric_type="equal_outcome")
+    >>> bool(np.allclose(metrics["Value"].astype(float), batch["Value"].astype(float)))
+    True
+    """
+
+    def __init__(self, rank_error=0.001):
+        self.rank_error = rank_error
+        self.moments_a = None
+        self.moments_b = None
+        self.jain = None
+        # channels: count all, count a, count b, sse a, sse b, sae a, sae b
+        self.digest = _QuantileDigest(int(np.ceil(_DIGEST_LEVELS / rank_error)), n_channels=7)
+
+    def update(self, group_a, group_b, y_pred, y_true=None):
+        """
+        Add a batch of predictions.
+
+        Parameters
+        ----------
+        group_a : array-like
+            Group membership vector (binary)
+        group_b : array-like
+            Group membership vector (binary)
+        y_pred : array-like
+            Predictions vector (regression)
+        y_true : array-like, optional
+            Target vector (regression), must be given for every batch or for none
+
+        Returns
+        -------
+        self
+        """
+        group_a, group_b, y_pred, y_true, _ = _regression_checks(group_a, group_b, y_pred, y_true, None)
+        y_pred = y_pred.astype(float)
+        mask_a = group_a == 1
+        mask_b = group_b == 1
+
+        moments_a = _group_moments(y_pred[mask_a], None if y_true is None else y_true[mask_a])
+        moments_b = _group_moments(y_pred[mask_b], None if y_true is None else y_true[mask_b])
+
+        zeros = np.zeros(len(y_pred))
+        if y_true is None:
+            jain = None
+            sq_err = abs_err = zeros
+        else:
+            error = np.abs(y_true - y_pred)
+            jain = {"n": float(len(error)), "sum": error.sum(), "sum_sq": (error**2).sum()}
+            sq_err, abs_err = error**2, error
+
+        self._add(moments_a, moments_b, jain)
+        self.digest.add(
+            y_pred,
+            [
+                zeros + 1,
+                mask_a * 1.0,
+                mask_b * 1.0,
+                sq_err * mask_a,
+                sq_err * mask_b,
+                abs_err * mask_a,
+                abs_err * mask_b,
+            ],
+        )
+        return self
+
+    def merge(self, other):
+        """
+        Add the statistics accumulated by another RegressionBiasAccumulator.
+
+        Returns
+        -------
+        self
+        """
+        if other.moments_a is not None:
+            self._add(other.moments_a, other.moments_b, other.jain)
+            self.digest.merge(other.digest)
+        return self
+
+    def _add(self, moments_a, moments_b, jain):
+        if self.moments_a is None:
+            self.moments_a, self.moments_b, self.jain = moments_a, moments_b, jain
+        else:
+            if (jain is None) != (self.jain is None):
+                msg = "y_true must be given for every batch or for none of them."
+                raise ValueError(msg)
+            self.moments_a = _combine_moments(self.moments_a, moments_a)
+            self.moments_b = _combine_moments(self.moments_b, moments_b)
+            if jain is not None:
+                self.jain = {k: self.jain[k] + jain[k] for k in jain}
+
+    def _quantile(self, q):
+        return self.digest.quantile(q)
+
+    def _pass_rates(self, q):
+        tail = self.digest.tail(self._quantile(q))
+        return tail[1] / self.moments_a["n"], tail[2] / self.moments_b["n"]
+
+    def _disparate_impact(self, q):
+        sr_a, sr_b = self._pass_rates(q)
+        return (sr_a / sr_b)[0]
+
+    def _statistical_parity(self, q):
+        sr_a, sr_b = self._pass_rates(q)
+        return (sr_a - sr_b)[0]
+
+    def _no_disparate_impact_level(self):
+        q = np.linspace(1.0, 0.0, 100)
+        thresholds = self._quantile(q)
+        sr_a, sr_b = self._pass_rates(q)
+        lower_bound = 0.8
+        upper_bound = 1.2
+        ratio = np.divide(sr_a, sr_b, out=np.zeros_like(sr_a), where=sr_b > 0)
+        found = np.flatnonzero((sr_b > 0) & (lower_bound < ratio) & (ratio < upper_bound))
+        return thresholds[found[0]] if len(found) > 0 else thresholds[-1]
+
+    def _statistical_parity_curve(self):
+        sr_a, sr_b = self._pass_rates(np.linspace(1, 0, 150))
+        return np.abs(sr_a - sr_b)
+
+    def _error_ratio(self, channels, q, root):
+        if q == 0:
+            num, den = (
+                self.moments_a[channels[0]] / self.moments_a["n"],
+                self.moments_b[channels[0]] / self.moments_b["n"],
+            )
+        else:
+            tail = self.digest.tail(self._quantile(q))[:, 0]
+            num, den = tail[channels[1]] / tail[1], tail[channels[2]] / tail[2]
+        return np.sqrt(num) / np.sqrt(den) if root else num / den
+
+    def _zscore_diff(self):
+        a, b = self.moments_a, self.moments_b
+        std_pool = np.sqrt(
+            (a["m2_p"] * (a["n"] - 1) / a["n"] + b["m2_p"] * (b["n"] - 1) / b["n"]) / (a["n"] + b["n"] - 2)
+        )
+        return (a["mean_p"] - b["mean_p"]) / std_pool
+
+    def _correlation_diff(self):
+        a, b = self.moments_a, self.moments_b
+        cv_a = a["c_pt"] / np.sqrt(a["m2_p"] * a["m2_t"])
+        cv_b = b["c_pt"] / np.sqrt(b["m2_p"] * b["m2_t"])
+        return cv_a - cv_b
+
+    def _jain_index(self):
+        jain = self.jain["sum"] ** 2 / (self.jain["n"] * self.jain["sum_sq"])
+        return 1.0 if np.isnan(jain) else jain
+
+    def compute(self, metric_type="group"):
+        """
+        Compute the regression bias metrics of all the rows seen so far.
+
+        Parameters
+        ----------
+        metric_type : str, optional
+            Specifies which metrics we compute: 'group', 'equal_outcome', 'equal_opportunity' or 'individual'
+
+        Returns
+        -------
+        pandas DataFrame
+            Metrics | Values | Reference
+        """
+        if self.moments_a is None:
+            msg = "No data has been accumulated, call update first."
+            raise ValueError(msg)
+
+        if metric_type == "individual":
+            if self.jain is None:
+                msg = "y_pred and y_true must be provided for individual metrics"
+                raise ValueError(msg)
+            return _metrics_frame([["Jain Index", self._jain_index(), 1]])
+
+        a, b = self.moments_a, self.moments_b
+        sp_curve = self._statistical_parity_curve()
+        out_metrics = [
+            ["Disparate Impact Q90", self._disparate_impact(0.9), 1],
+            ["Disparate Impact Q80", self._disparate_impact(0.8), 1],
+            ["Disparate Impact Q50", self._disparate_impact(0.5), 1],
+            ["Statistical Parity Q50", self._statistical_parity(0.8), 0],
+            ["No Disparate Impact Level", self._no_disparate_impact_level(), "-"],
+            ["Average Score Difference", a["mean_p"] - b["mean_p"], 0],
+            ["Average Score Ratio", a["mean_p"] / b["mean_p"], 1],
+            ["Z Score Difference", self._zscore_diff(), 0],
+            ["Max Statistical Parity", np.max(sp_curve), 0],
+            ["Statistical Parity AUC", np.sum(sp_curve / 150), 0],
+        ]
+        opp_metrics = []
+        if self.jain is not None:
+            opp_metrics = [
+                ["RMSE Ratio", self._error_ratio(("sse", 3, 4), 0, root=True), 1],
+                ["RMSE Ratio Q80", self._error_ratio(("sse", 3, 4), 0.8, root=True), 1],
+                ["MAE Ratio", self._error_ratio(("sae", 5, 6), 0, root=False), 1],
+                ["MAE Ratio Q80", self._error_ratio(("sae", 5, 6), 0.8, root=False), 1],
+                ["Correlation Difference", self._correlation_diff(), 0],
+            ]
+        return _select_metrics(out_metrics, opp_metrics, metric_type)
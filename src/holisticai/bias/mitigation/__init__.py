@@ -24,6 +24,7 @@ from holisticai.bias.mitigation.postprocessing import (
     MCMF,
     CalibratedEqualizedOdds,
     DebiasingExposure,
+    DisparateImpactRemoverRS,
     EqualizedOdds,
     FairTopK,
     LPDebiaserBinary,
@@ -37,6 +38,7 @@ from holisticai.bias.mitigation.postprocessing import (
 # preprocessing algorithm classes
 from holisticai.bias.mitigation.preprocessing import (
     CorrelationRemover,
+    DisparateImpactRemover,
     FairletClusteringPreprocessing,
     LearningFairRepresentation,
     Reweighing,
@@ -72,18 +74,13 @@ __all__ = [
     "DebiasingExposure",
     "FairTopK",
     "MCMF",
+    "DisparateImpactRemoverRS",
+    "DisparateImpactRemover",
 ]
 
 import importlib
 from typing import Literal
 
-networkx_spec = importlib.util.find_spec("networkx")
-if networkx_spec is not None:
-    from holisticai.bias.mitigation.postprocessing import DisparateImpactRemoverRS
-    from holisticai.bias.mitigation.preprocessing import DisparateImpactRemover
-
-__all__ += ["DisparateImpactRemoverRS", "DisparateImpactRemover"]
-
 cvxpy_spec = importlib.util.find_spec("cvxpy")
 if cvxpy_spec is not None:
     from holisticai.bias.mitigation.inprocessing.fair_scoring_classifier.transformer import FairScoreClassifier
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import numpy as np
+
 from holisticai.bias.mitigation.commons.disparate_impact_remover._categorical_repairer import CategoricalRepairer
 from holisticai.bias.mitigation.commons.disparate_impact_remover._utils import (
     freedman_diaconis_bin_size as bin_calculator,
 )
-from holisticai.bias.mitigation.commons.disparate_impact_remover._utils import get_median, make_histogram_bins
+from holisticai.bias.mitigation.commons.disparate_impact_remover._utils import make_histogram_bins, median_index
 
 
 class NumericalRepairer:
@@ -21,6 +23,8 @@ class NumericalRepairer:
         Whether to use the K-nearest neighbor density estimator to calculate bin sizes. Default is False.
     features_to_ignore : list, optional
         A list of feature names to ignore during repair. Default is an empty list.
+    n_jobs : int, optional
+        The number of columns repaired in parallel. Default is None (one).
 
     Attributes
     ----------
@@ -32,6 +36,8 @@ class NumericalRepairer:
         Whether to use the K-nearest neighbor density estimator to calculate bin sizes.
     features_to_ignore : list
         A list of feature names to ignore during repair.
+    n_jobs : int
+        The number of columns repaired in parallel.
 
     Methods
     -------
@@ -45,6 +51,7 @@ class NumericalRepairer:
         repair_level: float,
         kdd: bool = False,
         features_to_ignore: list[str] | None = None,
+        n_jobs: int | None = None,
     ):
         if features_to_ignore is None:
             features_to_ignore = []
@@ -52,66 +59,57 @@ class NumericalRepairer:
         self.repair_level = repair_level
         self.kdd = kdd
         self.features_to_ignore = features_to_ignore
+        self.n_jobs = n_jobs
 
-    def _calculate_category_medians(self, index_bins: list[list[int]], data_to_repair: list[list[float]]) -> dict:
+    def _calculate_category_medians(self, bins: np.ndarray, feature: np.ndarray) -> np.ndarray:
         """
         Calculates the median value for each bin in the input dataset.
 
         Parameters
         ----------
-        index_bins : list
-            A list of indices for each bin in the dataset.
-        data_to_repair : list
-            The input dataset to repair.
+        bins : np.ndarray
+            The bin index of each row.
+        feature : np.ndarray
+            The values of the feature to repair.
 
         Returns
         -------
-        dict
-            A dictionary containing the median value for each bin in the dataset.
+        np.ndarray
+            The median value of each bin.
         """
-        return {
-            f"BIN_{i}": get_median([data_to_repair[j][self.feature_to_repair] for j in index_bin], self.kdd)
-            for i, index_bin in enumerate(index_bins)
-        }
+        order = np.lexsort((feature, bins))
+        counts = np.bincount(bins)
+        return feature[order[np.cumsum(counts) - counts + median_index(counts, self.kdd)]]
 
-    def repair(self, data_to_repair: list[list[float]]) -> list[list[float]]:
+    def repair(self, data_to_repair: np.ndarray) -> np.ndarray:
         """
         Repairs the numerical feature in the input dataset to mitigate disparate impact.
 
         Parameters
         ----------
-        data_to_repair : list
+        data_to_repair : np.ndarray
             The input dataset to repair.
 
         Returns
         -------
-        list
+        np.ndarray
             The repaired dataset.
         """
-
-        binned_data = [row[:] for row in data_to_repair]
-        index_bins = make_histogram_bins(bin_calculator, data_to_repair, self.feature_to_repair)
-
-        category_medians = self._calculate_category_medians(index_bins, data_to_repair)
-
-        for i, index_bin in enumerate(index_bins):
-            for j in index_bin:
-                binned_data[j][self.feature_to_repair] = f"BIN_{i}"
+        data_to_repair = np.asarray(data_to_repair)
+        feature = data_to_repair[:, self.feature_to_repair].astype(float)
+        bins = make_histogram_bins(bin_calculator, feature)
 
         categoric_repairer = CategoricalRepairer(
             feature_to_repair=self.feature_to_repair,
             repair_level=self.repair_level,
             kdd=self.kdd,
             features_to_ignore=self.features_to_ignore,
+            n_jobs=self.n_jobs,
         )
 
-        repaired_data = categoric_repairer.repair(binned_data)
+        repaired_data = categoric_repairer.repair(data_to_repair, groups=bins)
 
-        for i, row in enumerate(repaired_data):
-            row[self.feature_to_repair] = (
-                category_medians[row[self.feature_to_repair]]
-                if self.repair_level > 0
-                else data_to_repair[i][self.feature_to_repair]
-            )
+        if self.repair_level > 0:
+            repaired_data[:, self.feature_to_repair] = self._calculate_category_medians(bins, feature)[bins]
 
         return repaired_data
@@ -1,468 +1,234 @@
 from __future__ import annotations
 
-import math
-import random
-from copy import deepcopy
-
 import numpy as np
-from holisticai.bias.mitigation.commons.disparate_impact_remover._categorical_feature import CategoricalFeature
-from holisticai.bias.mitigation.commons.disparate_impact_remover._sparse_list import SparseList
-
+import pandas as pd
 
-def get_categories_count_norm(categories, all_stratified_groups, count_dict, group_features):
-    """
-    Get the normalized count for each category , where normalized count is count divided by
-    the number of people in that group.
 
-
-    Parameters
-    ----------
-    categories : list
-        The list of categories.
-    all_stratified_groups : list
-        The list of stratified groups.
-    count_dict : dict
-        The dictionary containing the count of observations in each category.
-    group_features : dict
-        The dictionary containing the CategoricalFeature objects for each group.
-
-    Returns
-    -------
-    dict
-        The dictionary containing the normalized count for each category.
+def median_index(size, kdd):
     """
-    return {
-        cat: SparseList(
-            data=(
-                count_dict[cat][i] * (1.0 / len(group_features[group].data)) if group_features[group].data else 0.0
-                for i, group in enumerate(all_stratified_groups)
-            )
-        )
-        for cat in categories
-    }
-
-
-def gen_desired_dist(group_index, cat, col_id, median, repair_level, norm_counts, feature_to_remove, mode):
-    """
-    Generate the desired distribution for each category in a group.
+    Get the position of the median in a sorted array.
 
     Parameters
     ----------
-    group_index : int
-        The index of the group.
-    cat : str
-        The category.
-    col_id : int
-        The column index.
-    median : dict
-        The dictionary containing the median value for each category.
-    repair_level : float
-        The repair level.
-    norm_counts : dict
-        The dictionary containing the normalized count for each category.
-    feature_to_remove : int
-        The feature to remove.
-    mode : str
-        The mode value.
-
-    Returns
-    -------
-    float
-        The desired distribution for the category.
-    """
-    if feature_to_remove == col_id:
-        return 1 if cat == mode else (1 - repair_level) * norm_counts[cat][group_index]
-    return (1 - repair_level) * norm_counts[cat][group_index] + (repair_level * median[cat])
-
-
-def assign_overflow(all_stratified_groups, categories, overflow, group_features, repair_generator):
-    """
-    Assign the overflow to the desired categories based on the group's desired distribution.
-
-    Parameters
-    ----------
-    all_stratified_groups : list
-        The list of stratified groups.
-    categories : list
-        The list of categories.
-    overflow : dict
-        The dictionary containing the overflow for each group.
-    group_features : dict
-        The dictionary containing the CategoricalFeature objects for each group.
-    repair_generator : function
-        The repair generator function.
+    size : int or np.ndarray
+        The size of the sorted array(s).
+    kdd : bool
+        Whether to use the KDD method (upper median). Otherwise the lower median is used.
 
     Returns
     -------
-    dict
-        The dictionary containing the assigned overflow for each group.
-    dict
-        The dictionary containing the desired distribution for each category.
-    dict
-        The dictionary containing the feature after overflow assignment.
-    """
-    feature = deepcopy(group_features)
-    assigned_overflow = {}
-    desired_dict_list = {}
-    for group_index, group in enumerate(all_stratified_groups):
-        # Calculate the category proportions.
-        def dist_generator(cat):
-            return repair_generator(group_index, cat)
-
-        cat_props = list(map(dist_generator, categories))
-
-        if all(elem == 0 for elem in cat_props):  # TODO: Check that this is correct!
-            cat_props = [1.0 / len(cat_props)] * len(cat_props)
-        s = float(sum(cat_props))
-        cat_props = [elem / s for elem in cat_props]
-        desired_dict_list[group] = cat_props
-        assigned_overflow[group] = {}
-        for i in range(int(overflow[group])):
-            distribution_list = desired_dict_list[group]
-            number = random.uniform(0, 1)
-            cat_index = 0
-            tally = 0
-            for j in range(len(distribution_list)):
-                value = distribution_list[j]
-                if number < (tally + value):
-                    cat_index = j
-                    break
-                tally += value
-            assigned_overflow[group][i] = categories[cat_index]
-        # Actually do the assignment
-        count = 0
-        for i, value in enumerate(group_features[group].data):
-            if value == 0:
-                (feature[group].data)[i] = assigned_overflow[group][count]
-                count += 1
-    return feature, assigned_overflow, desired_dict_list
-
-
-def get_categories_count(categories, all_stratified_groups, group_feature):
+    int or np.ndarray
+        The position of the median.
     """
-    Get the count for each category.
+    return size // 2 if kdd else (size - 1) // 2
 
-    Parameters
-    ----------
-    categories : list
-        The list of categories.
-    all_stratified_groups : list
-        The list of stratified groups.
-    group_feature : dict
-        The dictionary containing the CategoricalFeature objects for each group.
 
-    Returns
-    -------
-    dict
-        The dictionary containing the count for each category.
+def is_numerical(values):
     """
-    return {
-        cat: SparseList(
-            data=(
-                group_feature[group].category_count[cat] if cat in group_feature[group].category_count else 0
-                for group in all_stratified_groups
-            )
-        )
-        for cat in categories
-    }
-
-
-def gen_desired_count(group_index, group, category, median, group_features, repair_level, categories_count):
-    """
-    Generate the desired count for each category in a group.
+    Check if a column holds numerical values.
 
     Parameters
     ----------
-    group_index : int
-        The index of the group.
-    group : str
-        The group.
-    category : str
-        The category.
-    median : dict
-        The dictionary containing the median value for each category.
-    group_features : dict
-        The dictionary containing the CategoricalFeature objects for each group.
-    repair_level : float
-        The repair level.
-    categories_count : dict
-        The dictionary containing the count for each category.
+    values : np.ndarray
+        The column values.
 
     Returns
     -------
-    int
-        The desired count for the category.
+    bool
+        True if all the values are numbers.
     """
-    med = median[category]
-    size = len(group_features[group].data)
-    count = categories_count[category][group_index]
-    return math.floor(((1 - repair_level) * count) + (repair_level) * med * size)
+    if values.dtype.kind in "biuf":
+        return True
+    return pd.api.types.infer_dtype(values, skipna=False) in {"integer", "floating", "mixed-integer-float"}
 
 
-def flow_on_group_features(all_stratified_groups, group_features, repair_generator):
+def make_histogram_bins(bin_size_calculator, values):
     """
-    Flow on group features. Run Max-flow to distribute as many observations to categories as possible.
-    Overflow are those observations that are left over after max-flow.
+    Make histogram bins for a column.
 
     Parameters
     ----------
-    all_stratified_groups : list
-        The list of stratified groups.
-    group_features : dict
-        The dictionary containing the CategoricalFeature objects for each group.
-    repair_generator : function
-        The repair generator function.
+    bin_size_calculator : function
+        The bin size calculator function.
+    values : np.ndarray
+        The column values.
 
     Returns
     -------
-    dict
-        The dictionary containing the new feature after repair.
-    dict
-        The dictionary containing the overflow for each group.Description
+    np.ndarray
+        The index of the (non-empty) bin of each value.
     """
-    dict1 = {}
-    dict2 = {}
-    for i, group in enumerate(all_stratified_groups):
-        feature = group_features[group]
+    bin_range = bin_size_calculator(values)
 
-        def count_generator(category):
-            return repair_generator(i, group, category)
-
-        DG = feature.create_graph(count_generator)
-        new_feature, overflow = feature.repair(DG)
-        dict2[group] = overflow
-        dict1[group] = new_feature
-
-    return dict1, dict2
+    if bin_range == 0.0:
+        bin_range = 1.0
 
+    min_val, max_val = values.min(), values.max()
 
-def get_count(cat, group_feature_category_count):
-    """
-    Get the count for a category.
+    # the lower edges of the bins are a running sum of the bin range
+    num_edges = int((max_val - min_val) / bin_range) + 2
+    lower_edges = np.cumsum(np.r_[min_val, np.full(num_edges - 1, bin_range)])
+    lower_edges = lower_edges[lower_edges <= max_val]
 
-    Parameters
-    ----------
-    cat : str
-        The category.
-    group_feature_category_count : dict
-        The dictionary containing the count for each category.
-
-    Returns
-    -------
-    int
-        The count for the category.
-    """
-    if cat in group_feature_category_count:
-        return group_feature_category_count[cat]
-    return 0
+    bins = np.searchsorted(lower_edges, values, side="right") - 1
+    return np.unique(bins, return_inverse=True)[1]
 
 
-def get_count_norm(count, group_feature_data):
+def freedman_diaconis_bin_size(feature_values):
     """
-    Get the normalized count for a category.
+    Calculate the bin size using the Freedman-Diaconis rule.
 
     Parameters
     ----------
-    count : int
-        The count for the category.
-    group_feature_data : list
-        The list of data for the category.
+    feature_values : list
+        The list of feature values.
 
     Returns
     -------
     float
-        The normalized count for the category.
-    """
-    if group_feature_data:
-        return count * (1.0 / len(group_feature_data))
-    return 0.0
-
-
-def get_column_type(values: list | np.ndarray):
+        The bin size.
     """
-    Get the type of the column.
+    q75, q25 = np.percentile(feature_values, [75, 25])
+    IQR = q75 - q25
+    return 2.0 * IQR * len(feature_values) ** (-1.0 / 3.0)
 
-    Parameters
-    ----------
-    values : list or np.ndarray
-        The list of values.
 
-    Returns
-    -------
-    type
-        The type of the column.
+def repair_numerical_column(values, groups, repair_level, kdd=False):
     """
-    if all(isinstance(value, float) for value in values):
-        return float
-
-    if all(isinstance(value, int) for value in values):
-        return int
-    return str
+    Repair a numerical column, moving the values of every group towards the median of the groups \
+    at the same quantile, while preserving the rank-ordering within groups.
 
-
-def get_median(values, kdd):
-    """
-    Get the median of a list of values.
+    The unique values of every group are split into as many quantiles as the smallest number of unique values \
+    in a group. The median of every quantile is computed for all the groups and quantiles at once, and each value \
+    moves (in the sorted unique values of the column) towards the median of these medians.
 
     Parameters
     ----------
-    values : list
-        The list of values.
+    values : np.ndarray
+        The column values.
+    groups : np.ndarray
+        The group index (0 to n_groups-1) of each value.
+    repair_level : float
+        The repair level.
     kdd : bool
-        Whether to use the KDD method.
+        Whether to use the KDD method for the medians.
 
     Returns
     -------
-    float
-        The median of the list of values.
-    """
-    if not values:
-        msg = "Cannot calculate median of list with no values!"
-        raise ValueError(msg)
-
-    sorted_values = deepcopy(values)
-    sorted_values.sort()  # Not calling `sorted` b/c `sorted_values` may not be list.
-
-    if kdd:
-        return sorted_values[len(values) // 2]
-
-    if len(values) % 2 == 0:
-        return sorted_values[len(values) // 2 - 1]
-
-    return sorted_values[len(values) // 2]
-
-
-def get_group_data(all_stratified_groups, stratified_group_data, col_id):
-    """
-    Get the group data for a column.
-
-    Parameters
-    ----------
-    all_stratified_groups : list
-        The list of stratified groups.
-    stratified_group_data : dict
-        The dictionary containing the stratified group data.
-    col_id : int
-        The column index.
-
-    Returns
-    -------
-    dict
-        The dictionary containing the group data for the column.
-    """
-    group_features = {}
-    for group in all_stratified_groups:
-        points = [(i, val) for indices, val in stratified_group_data[group][col_id] for i in indices]
-        points = sorted(points, key=lambda x: x[0])  # Sort by index
-        values = [value for _, value in points]
-
-        # send values to CategoricalFeature object, which bins the data into categories
-        group_features[group] = CategoricalFeature(values)
-    return group_features
-
-
-# Find the median normalized count for each category
-def get_median_per_category(categories, categories_count_norm):
-    """
-    Get the median normalized count for each category.
+    np.ndarray
+        The repaired column values.
+    """
+    n_groups = groups.max() + 1
+    uniques, codes = np.unique(values, return_inverse=True)
+    n_uniques = len(uniques)
+
+    # sorted unique values of every group
+    pairs = np.unique(groups * n_uniques + codes)
+    group_codes = pairs % n_uniques
+    num_vals = np.bincount(pairs // n_uniques, minlength=n_groups)
+    group_start = np.cumsum(num_vals) - num_vals
+
+    # every quantile spans the positions [starts, ends) of the sorted unique values of each group, the fractions
+    # of the quantiles being a running sum (as in the original implementation, for identical rounding)
+    num_quantiles = num_vals.min()
+    quantile_unit = 1.0 / num_quantiles
+    quantile_fractions = np.cumsum(np.r_[0.0, np.full(num_quantiles - 1, quantile_unit)])
+    exact_starts = quantile_fractions * num_vals[:, None]
+    ends = np.rint(exact_starts + quantile_unit * num_vals[:, None]).astype(int)
+    starts = np.rint(exact_starts).astype(int)
+
+    # median of every group at every quantile, then median over the groups where the quantile is not empty
+    # (empty quantiles get the code n_uniques, which sorts after all the others)
+    sizes = np.minimum(ends, num_vals[:, None]) - starts
+    non_empty = ends > starts
+    median_positions = group_start[:, None] + starts + median_index(np.maximum(sizes, 1), kdd)
+    group_medians = np.where(non_empty, group_codes[np.minimum(median_positions, len(pairs) - 1)], n_uniques)
+    median_rows = median_index(non_empty.sum(axis=0), kdd)
+    medians = np.sort(group_medians, axis=0)[median_rows, np.arange(num_quantiles)]
+
+    # position of every value among the sorted unique values of its group
+    value_positions = np.searchsorted(pairs, groups * n_uniques + codes) - group_start[groups]
+
+    # first quantile of its group ending after each value, searched at once in the quantile ends of all
+    # the groups, each group shifted by a stride larger than any position
+    stride = num_vals.max() + 1
+    group_shifts = stride * np.arange(n_groups)
+    shifted_ends = (ends + group_shifts[:, None]).ravel()
+    quantiles = np.searchsorted(shifted_ends, value_positions + group_shifts[groups], "right")
+    quantiles -= num_quantiles * groups
+
+    # values after the last quantile, or before the start of theirs after rounding, are not repaired
+    in_quantile = quantiles < num_quantiles
+    in_quantile[in_quantile] = starts[groups[in_quantile], quantiles[in_quantile]] <= value_positions[in_quantile]
+
+    repaired_codes = codes.copy()
+    distances = medians[quantiles[in_quantile]] - codes[in_quantile]
+    repaired_codes[in_quantile] += np.rint(distances * repair_level).astype(int)
+
+    # with rounding ties a value can end a quantile and start the next one, it is then repaired again
+    twice = in_quantile & (quantiles + 1 < num_quantiles)
+    twice[twice] = starts[groups[twice], quantiles[twice] + 1] <= value_positions[twice]
+    distances = medians[quantiles[twice] + 1] - repaired_codes[twice]
+    repaired_codes[twice] += np.rint(distances * repair_level).astype(int)
+    return uniques[repaired_codes]
+
+
+def repair_categorical_column(values, groups, repair_level, rng):
+    """
+    Repair a categorical column, moving the category distribution of every group towards the median \
+    distribution of the groups.
+
+    The repair works on the count vectors of the groups. The min-cost flow between the current and the desired \
+    counts keeps every observation whose category is not in excess, moves the excess observations to the categories \
+    of the group in deficit and assigns the remaining (overflow) observations at random following the desired \
+    distribution. Categories absent from a group only receive overflow observations.
 
     Parameters
     ----------
-    categories : list
-        The list of categories.
-    categories_count_norm : dict
-        The dictionary containing the normalized count for each category.
-
-    Returns
-    -------
-    dict
-        The dictionary containing the median normalized count for each category.
-    """
-    return {cat: get_median(categories_count_norm[cat], False) for cat in categories}
-
-
-def get_mode(values):
-    """
-    Get the mode of a list of values.
-
-    Parameters
-    ----------
-    values : list
-        The list of values.
-
-    Returns
-    -------
-    any
-        The mode of the list of values.
-    """
-    counts = {}
-    for value in values:
-        counts[value] = 1 if value not in counts else counts[value] + 1
-    mode_tuple = max(list(counts.items()), key=lambda tup: tup[1])
-    return mode_tuple[0]
-
-
-def make_histogram_bins(bin_size_calculator, data, col_id):
-    """
-    Make histogram bins for a column.
-
-    Parameters
-    ----------
-    bin_size_calculator : function
-        The bin size calculator function.
-    data : list
-        The input dataset.
-    col_id : int
-        The column index.
-
-    Returns
-    -------
-    list
-        The list of histogram bins.
-    """
-    feature_vals = [row[col_id] for row in data]
-    bin_range = bin_size_calculator(feature_vals)
-
-    if bin_range == 0.0:
-        bin_range = 1.0
-
-    data_tuples = list(enumerate(data))  # [(0,row), (1,row'), (2,row''), ... ]
-    sorted_data_tuples = sorted(data_tuples, key=lambda tup: tup[1][col_id])
-
-    max_val = max(data, key=lambda datum: datum[col_id])[col_id]
-    min_val = min(data, key=lambda datum: datum[col_id])[col_id]
-
-    index_bins = []
-    val_ranges = []
-    curr = min_val
-    while curr <= max_val:
-        index_bins.append([])
-        val_ranges.append((curr, curr + bin_range))
-        curr += bin_range
-
-    for row_index, row in sorted_data_tuples:
-        for bin_num, val_range in enumerate(val_ranges):
-            if val_range[0] <= row[col_id] < val_range[1]:
-                index_bins[bin_num].append(row_index)
-                break
-
-    return [b for b in index_bins if b]
-
-
-def freedman_diaconis_bin_size(feature_values):
-    """
-    Calculate the bin size using the Freedman-Diaconis rule.
-
-    Parameters
-    ----------
-    feature_values : list
-        The list of feature values.
+    values : np.ndarray
+        The column values.
+    groups : np.ndarray
+        The group index (0 to n_groups-1) of each value.
+    repair_level : float
+        The repair level.
+    rng : np.random.Generator
+        The random generator used to pick the moved observations.
 
     Returns
     -------
-    float
-        The bin size.
-    """
-    q75, q25 = np.percentile(feature_values, [75, 25])
-    IQR = q75 - q25
-    return 2.0 * IQR * len(feature_values) ** (-1.0 / 3.0)
+    np.ndarray
+        The repaired column values.
+    """
+    n_groups = groups.max() + 1
+    categories, codes = np.unique(values, return_inverse=True)
+    n_categories = len(categories)
+
+    counts = np.bincount(groups * n_categories + codes, minlength=n_groups * n_categories)
+    counts = counts.reshape(n_groups, n_categories)
+    sizes = counts.sum(axis=1, keepdims=True)
+    norm_counts = counts / sizes
+    median = np.sort(norm_counts, axis=0)[median_index(n_groups, False)]
+
+    desired = np.floor((1 - repair_level) * counts + repair_level * median * sizes).astype(int)
+    desired_dist = (1 - repair_level) * norm_counts + repair_level * median
+    desired_dist[desired_dist.sum(axis=1) == 0] = 1.0
+    desired_dist /= desired_dist.sum(axis=1, keepdims=True)
+
+    repaired_codes = codes.copy()
+    for group in range(n_groups):
+        # shuffled observations of the group, sorted by category
+        rows = rng.permutation(np.flatnonzero(groups == group))
+        rows = rows[np.argsort(codes[rows], kind="stable")]
+        ranks = np.arange(len(rows)) - (np.cumsum(counts[group]) - counts[group])[codes[rows]]
+
+        excess = rng.permutation(rows[ranks >= desired[group, codes[rows]]])
+        # only the categories present in the group take excess observations, as in the flow graph of the group
+        deficit = np.maximum(desired[group] - counts[group], 0) * (counts[group] > 0)
+        deficit = np.repeat(np.arange(n_categories), deficit)
+        num_moved = min(len(excess), len(deficit))
+        repaired_codes[excess[:num_moved]] = deficit[:num_moved]
+
+        overflow = excess[num_moved:]
+        repaired_codes[overflow] = rng.choice(n_categories, size=len(overflow), p=desired_dist[group])
+
+    return categories[repaired_codes]
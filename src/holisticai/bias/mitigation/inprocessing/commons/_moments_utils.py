@@ -7,7 +7,21 @@ from holisticai.bias.mitigation.inprocessing.commons._conventions import _EVENT,
 
 
 def merge_columns(feature_columns):
-    return pd.DataFrame(feature_columns).apply(lambda row: ",".join([str(r) for r in row.values]), axis=1)
+    """
+    Merge the feature columns into a single key per row, the values of the row joined by commas.
+
+    The rows are integer coded first, so that only the distinct rows are formatted as strings.
+    """
+    features = pd.DataFrame(feature_columns)
+    codes = np.column_stack([pd.factorize(features.iloc[:, i])[0] for i in range(features.shape[1])])
+    _, first, inverse = np.unique(codes, axis=0, return_index=True, return_inverse=True)
+    keys = features.iloc[first].apply(lambda row: ",".join([str(r) for r in row.values]), axis=1)
+    return pd.Series(keys.to_numpy()[inverse.reshape(-1)], index=features.index)
+
+
+def category_codes(values, categories):
+    """Return the position of every value in the sorted categories, -1 for missing values."""
+    return pd.Categorical(values, categories=categories).codes.astype(np.intp)
 
 
 def format_data(y=None):
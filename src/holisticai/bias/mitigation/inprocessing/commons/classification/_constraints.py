@@ -13,7 +13,7 @@ from holisticai.bias.mitigation.inprocessing.commons._conventions import (
     _SIGNED,
     _UPPER_BOUND_DIFF,
 )
-from holisticai.bias.mitigation.inprocessing.commons._moments_utils import BaseMoment, format_data
+from holisticai.bias.mitigation.inprocessing.commons._moments_utils import BaseMoment, category_codes, format_data
 from holisticai.bias.mitigation.inprocessing.commons.classification._objectives import ErrorRate
 
 
@@ -84,6 +84,8 @@ class ClassificationConstraint(BaseMoment):
         # Groups and Events
         self.group_prob = self.tags.groupby(_GROUP_ID).size() / self.total_samples
         self.group_values = np.sort(self.tags[_GROUP_ID].unique())
+        self.event_codes = category_codes(self.tags[_EVENT], self.event_ids)
+        self.group_codes = category_codes(self.tags[_GROUP_ID], self.group_values)
         self.group_event_prob = (
             self.tags.dropna(subset=[_EVENT]).groupby([_EVENT, _GROUP_ID]).count() / len(self.tags)
         ).iloc[:, 0]
@@ -127,12 +129,11 @@ class ClassificationConstraint(BaseMoment):
 
         adjust = lambda_event - lambda_group_event
 
-        def get_signed_weight(row):
-            if pd.isna(row[_EVENT]):
-                return 0
-            return adjust[row[_EVENT], row[_GROUP_ID]]
-
-        signed_weights = self.tags.apply(get_signed_weight, axis=1)
+        # gather the adjustment of every sample from the (event, group) table, samples without event get 0
+        adjust = adjust.reindex(pd.MultiIndex.from_product([self.event_ids, self.group_values])).to_numpy()
+        adjust = np.append(adjust, 0.0)
+        cells = np.where(self.event_codes >= 0, self.event_codes * len(self.group_values) + self.group_codes, -1)
+        signed_weights = pd.Series(np.take(adjust, cells), index=self.tags.index)
         utility_diff = self.utilities[:, 1] - self.utilities[:, 0]
         return utility_diff.T * signed_weights
 
@@ -236,7 +237,7 @@ class EqualizedOdds(ClassificationConstraint):
         """Load the specified data into the object."""
         params = format_data(y=y)
         y = params["y"]
-        base_event = y.apply(lambda v: _LABEL + "=" + str(v))
+        base_event = _LABEL + "=" + y.astype(str)
         super().load_data(X, y, sensitive_features, base_event)
 
 
@@ -258,7 +259,7 @@ class TruePositiveRateParity(ClassificationConstraint):
         """Load the specified data into the object."""
         params = format_data(y=y)
         y = params["y"]
-        base_event = y.apply(lambda l: f"{_LABEL}={l}").where(y == 1)
+        base_event = (_LABEL + "=" + y.astype(str)).where(y == 1)
         super().load_data(X, y, sensitive_features, base_event)
 
 
@@ -280,7 +281,7 @@ class FalsePositiveRateParity(ClassificationConstraint):
         """Load the specified data into the object."""
         params = format_data(y=y)
         y = params["y"]
-        base_event = y.apply(lambda v: _LABEL + "=" + str(v)).where(y == 0)
+        base_event = (_LABEL + "=" + y.astype(str)).where(y == 0)
         super().load_data(X, y, sensitive_features, base_event)
 
 
@@ -9,7 +9,7 @@ from holisticai.bias.mitigation.inprocessing.commons._conventions import (
     _LOSS,
     _PREDICTION,
 )
-from holisticai.bias.mitigation.inprocessing.commons._moments_utils import BaseMoment, format_data
+from holisticai.bias.mitigation.inprocessing.commons._moments_utils import BaseMoment, category_codes, format_data
 
 
 class RegressionConstraint(BaseMoment):
@@ -59,6 +59,7 @@ class RegressionConstraint(BaseMoment):
             self.tags.groupby(_GROUP_ID).size() / self.total_samples
         )  # self.tags[_GROUP_ID].dropna().value_counts() / len(self.tags)
         self.group_values = np.sort(self.tags[_GROUP_ID].unique())
+        self.group_codes = category_codes(self.tags[_GROUP_ID], self.group_values)
 
         self.index = self.group_prob.index
         self.default_objective_lambda_vec = self.group_prob
@@ -109,7 +110,7 @@ class RegressionConstraint(BaseMoment):
     def signed_weights(self, lambda_vec=None):
         """Return the signed weights."""
         adjust = pd.Series(1.0, index=self.index) if lambda_vec is None else lambda_vec / self.group_prob
-        return self.tags.apply(lambda row: adjust[row[_GROUP_ID]], axis=1)
+        return pd.Series(np.take(adjust.reindex(self.group_values).to_numpy(), self.group_codes), index=self.tags.index)
 
 
 class MeanLoss(RegressionConstraint):
@@ -1,16 +1,39 @@
+from __future__ import annotations
+
+import copy
+
 import numpy as np
 import pandas as pd
 import scipy.optimize as opt
+from joblib import Parallel, delayed
 from sklearn import clone
 
 from holisticai.bias.mitigation.inprocessing.commons._conventions import PRECISION
 
+_INITIAL_CAPACITY = 16
+
 
 class Lagrangian:
-    """Operations related to the Lagrangian"""
+    """
+    Operations related to the Lagrangian
+
+    The error, constraint values (gamma) and Lagrange multipliers of every hypothesis found by the oracle \
+    are kept in preallocated arrays, grown by doubling. With `warm_start`, estimators with a `warm_start` parameter \
+    and a linear solution (`coef_`) start from the previous oracle solution, and the oracle calls for several \
+    candidate multipliers are dispatched in parallel threads when `n_jobs` is not 1.
+    """
 
     def __init__(
-        self, X: np.ndarray, y: np.ndarray, estimator, constraints, B: float, opt_lambda: bool = True, **kwargs
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        estimator,
+        constraints,
+        B: float,
+        opt_lambda: bool = True,
+        warm_start: bool = False,
+        n_jobs: int | None = None,
+        **kwargs,
     ):
         self.constraints = constraints
         self.constraints.load_data(X, y, **kwargs)
@@ -19,21 +42,63 @@ class Lagrangian:
         self.estimator = estimator
         self.B = B
         self.opt_lambda = opt_lambda
-        self.hs = pd.Series(dtype="object")
-        self.predictors = pd.Series(dtype="object")
-        self.errors = pd.Series(dtype="float64")
-        self.gammas = pd.DataFrame()
-        self.lambdas = pd.DataFrame()
+        self.warm_start = warm_start
+        self.n_jobs = n_jobs
+        n_constraints = len(self.constraints.index)
+        self._hs = []
+        self._predictors = []
+        self._errors = np.empty(_INITIAL_CAPACITY)
+        self._gammas = np.empty((n_constraints, _INITIAL_CAPACITY))
+        self._lambdas = np.empty((n_constraints, _INITIAL_CAPACITY))
+        self._last_estimator = None
         self.last_linprog_n_hs = 0
         self.last_linprog_result = None
 
+    @property
+    def hs(self):
+        return pd.Series(self._hs, dtype="object")
+
+    @property
+    def predictors(self):
+        return pd.Series(self._predictors, dtype="object")
+
+    @property
+    def errors(self):
+        return pd.Series(self._errors[: len(self._hs)])
+
+    @property
+    def gammas(self):
+        return pd.DataFrame(self._gammas[:, : len(self._hs)], index=self.constraints.index)
+
+    @property
+    def lambdas(self):
+        return pd.DataFrame(self._lambdas[:, : len(self._hs)], index=self.constraints.index)
+
+    def gamma(self, h_idx):
+        """Constraint violations of a single hypothesis, without copying the other ones."""
+        return pd.Series(self._gammas[:, h_idx], index=self.constraints.index)
+
+    def _add_hypothesis(self, h, classifier, error, gamma, lambda_vec):
+        n_hs = len(self._hs)
+        if n_hs == len(self._errors):
+            self._errors = np.concatenate([self._errors, np.empty_like(self._errors)])
+            self._gammas = np.concatenate([self._gammas, np.empty_like(self._gammas)], axis=1)
+            self._lambdas = np.concatenate([self._lambdas, np.empty_like(self._lambdas)], axis=1)
+        self._hs.append(h)
+        self._predictors.append(classifier)
+        self._errors[n_hs] = error
+        self._gammas[:, n_hs] = gamma.reindex(self.constraints.index).to_numpy()
+        self._lambdas[:, n_hs] = lambda_vec.reindex(self.constraints.index).to_numpy()
+        return n_hs
+
     def _eval(self, Q, lambda_vec):
         if callable(Q):
             error = self.obj.gamma(Q)[0]
             gamma = self.constraints.gamma(Q)
         else:
-            error = self.errors[Q.index].dot(Q)
-            gamma = self.gammas[Q.index].dot(Q)
+            idx, weights = Q.index.to_numpy(), Q.to_numpy()
+            error = self._errors[idx].dot(weights)
+            gamma = pd.Series(self._gammas[:, idx].dot(weights), index=self.constraints.index)
 
         lambda_projected = self.constraints.project_lambda(lambda_vec) if self.opt_lambda else lambda_vec
         constraint_violation = gamma - self.constraints.bound()
@@ -45,8 +110,15 @@ class Lagrangian:
     def eval_gap(self, Q, lambda_hat, nu):
         L, L_high, gamma, error = self._eval(Q, lambda_hat)
         result = _GapResult(L, L, L_high, gamma, error)
-        for mul in [1.0, 2.0, 5.0, 10.0]:
-            h_hat, h_hat_idx = self.best_h(mul * lambda_hat)
+        lambda_vecs = [mul * lambda_hat for mul in [1.0, 2.0, 5.0, 10.0]]
+
+        # with several jobs the oracle is called for every multiplier at once, even if the loop stops early
+        init = self._last_estimator
+        classifiers = None if self.n_jobs in (None, 1) else self._call_oracles(lambda_vecs, init)
+
+        for i, lambda_vec in enumerate(lambda_vecs):
+            classifier = self._call_oracle(lambda_vec, init) if classifiers is None else classifiers[i]
+            h_hat, h_hat_idx = self.best_h(lambda_vec, classifier)
             L_low_mul, _, _, _ = self._eval(pd.Series({h_hat_idx: 1.0}), lambda_hat)
             if L_low_mul < result.L_low:
                 result.L_low = L_low_mul
@@ -55,13 +127,13 @@ class Lagrangian:
         return result
 
     def solve_linprog(self, nu):
-        n_hs = len(self.hs)
+        n_hs = len(self._hs)
         if self.last_linprog_n_hs == n_hs:
             return self.last_linprog_result
 
         linprog_data = self._prepare_linprog_data(n_hs, len(self.constraints.index))
         result = opt.linprog(**linprog_data, method="highs")
-        Q = pd.Series(result.x[:-1], self.hs.index)
+        Q = pd.Series(result.x[:-1], pd.RangeIndex(n_hs))
 
         dual_linprog_data = self._prepare_dual_linprog_data(linprog_data)
         result_dual = opt.linprog(**dual_linprog_data, method="highs")
@@ -72,8 +144,9 @@ class Lagrangian:
         return self.last_linprog_result
 
     def _prepare_linprog_data(self, n_hs, n_constraints):
-        c = np.append(self.errors.values, self.B)
-        A_ub = np.hstack((self.gammas.sub(self.constraints.bound(), axis=0).values, -np.ones((n_constraints, 1))))
+        c = np.append(self._errors[:n_hs], self.B)
+        gammas = self._gammas[:, :n_hs] - self.constraints.bound().to_numpy()[:, None]
+        A_ub = np.hstack((gammas, -np.ones((n_constraints, 1))))
         b_ub = np.zeros(n_constraints)
         A_eq = np.hstack((np.ones((1, n_hs)), np.zeros((1, 1))))
         b_eq = np.ones(1)
@@ -87,7 +160,19 @@ class Lagrangian:
         dual_bounds = [(None, None) if i == n_constraints else (0, None) for i in range(n_constraints + 1)]
         return {"c": dual_c, "A_ub": dual_A_ub, "b_ub": dual_b_ub, "bounds": dual_bounds}
 
-    def _call_oracle(self, lambda_vec):
+    def _new_estimator(self, init):
+        """Return an unfitted copy of the estimator, or a copy of `init` set to warm start from its solution."""
+        if (
+            self.warm_start
+            and init is not None
+            and hasattr(init, "coef_")
+            and hasattr(init, "get_params")
+            and "warm_start" in init.get_params()
+        ):
+            return copy.deepcopy(init).set_params(warm_start=True)
+        return clone(self.estimator, safe=False)
+
+    def _call_oracle(self, lambda_vec, init=None):
         signed_weights = self.obj.signed_weights() + self.constraints.signed_weights(lambda_vec)
         y = (
             (signed_weights > 0).astype(int)
@@ -96,39 +181,43 @@ class Lagrangian:
         )
         w = np.abs(signed_weights)
         sample_weight = self.constraints.total_samples * w / np.sum(w)
-        estimator = clone(self.estimator, safe=False)
+        estimator = self._new_estimator(init)
         estimator.fit(self.constraints.X, y, sample_weight=sample_weight)
         return estimator
 
-    def best_h(self, lambda_vec):
-        classifier = self._call_oracle(lambda_vec)
+    def _call_oracles(self, lambda_vecs, init=None):
+        return Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(self._call_oracle)(lambda_vec, init) for lambda_vec in lambda_vecs
+        )
+
+    def best_h(self, lambda_vec, classifier=None):
+        if classifier is None:
+            classifier = self._call_oracle(lambda_vec, self._last_estimator)
+        self._last_estimator = classifier
 
         def h(X):
             pred = classifier.predict(X)
             return pred.flatten() if hasattr(pred, "flatten") else pred
 
-        h_error = self.obj.gamma(h).iloc[0]
-        h_gamma = self.constraints.gamma(h)
+        # predict the training data once for the objective and the constraints
+        h_pred = h(self.constraints.X)
+        h_error = self.obj.gamma(lambda _: h_pred).iloc[0]
+        h_gamma = self.constraints.gamma(lambda _: h_pred)
         h_value = h_error + np.dot(h_gamma, lambda_vec)
 
-        if not self.hs.empty:
-            values = self.errors + np.dot(self.gammas.T, lambda_vec)
-            best_idx = values.idxmin()
+        n_hs = len(self._hs)
+        if n_hs > 0:
+            values = self._errors[:n_hs] + np.dot(self._gammas[:, :n_hs].T, lambda_vec)
+            best_idx = int(np.argmin(values))
             best_value = values[best_idx]
         else:
             best_idx = -1
             best_value = np.inf
 
         if h_value < best_value - PRECISION:
-            h_idx = len(self.hs)
-            self.hs.at[h_idx] = h
-            self.predictors.at[h_idx] = classifier
-            self.errors.at[h_idx] = h_error
-            self.gammas[h_idx] = h_gamma
-            self.lambdas[h_idx] = lambda_vec.copy()
-            best_idx = h_idx
-
-        return self.hs[best_idx], best_idx
+            best_idx = self._add_hypothesis(h, classifier, h_error, h_gamma, lambda_vec.copy())
+
+        return self._hs[best_idx], best_idx
 
 
 class _GapResult:
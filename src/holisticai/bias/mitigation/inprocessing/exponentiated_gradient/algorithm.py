@@ -37,6 +37,8 @@ class ExponentiatedGradientAlgorithm:
         eta0: float | None = 2.0,
         verbose: int | None = 0,
         seed: int | None = None,
+        warm_start: bool = False,
+        n_jobs: int | None = None,
     ):
         self.estimator = estimator
         self.constraints = constraints
@@ -45,12 +47,16 @@ class ExponentiatedGradientAlgorithm:
         self.nu = nu
         self.eta0 = eta0
         self.seed = seed
+        self.warm_start = warm_start
+        self.n_jobs = n_jobs
         self.monitor = Monitor(verbose=verbose)
         self.eg_helper = Helper()
 
     def fit(self, X, y, **kwargs):
         B = 1 / self.eps
-        lagrangian = Lagrangian(X, y, self.estimator, self.constraints, B, **kwargs)
+        lagrangian = Lagrangian(
+            X, y, self.estimator, self.constraints, B, warm_start=self.warm_start, n_jobs=self.n_jobs, **kwargs
+        )
         theta = pd.Series(0, lagrangian.constraints.index)
 
         def compute_default_nu(h):
@@ -68,7 +74,7 @@ class ExponentiatedGradientAlgorithm:
         for t in range(self.max_iter):
             lambda_vec = B * np.exp(theta) / (1 + np.exp(theta).sum())
             h, h_idx = lagrangian.best_h(lambda_vec)
-            gamma = lagrangian.gammas[h_idx]
+            gamma = lagrangian.gamma(h_idx)
             nu = compute_default_nu(h) if (t == 0 and nu is None) else nu
             Q_EG, gap_EG = self.eg_helper.compute_eg(t, h_idx, lambda_vec, lagrangian, nu)
 
@@ -104,25 +110,23 @@ class ExponentiatedGradientAlgorithm:
             positive_probs = self.predict_proba(X)[:, 1]
             return (positive_probs >= random_state.rand(len(positive_probs))) * 1
 
-        pred = self._forward(X)
-        randomized_pred = np.zeros(pred.shape[0])
-        for i in range(pred.shape[0]):
-            randomized_pred[i] = random_state.choice(pred.iloc[i, :], p=self.weights_)
-        return randomized_pred
+        # draw the hypothesis of every sample at once, then gather its prediction
+        pred, weights = self._active_predictions(X)
+        members = random_state.choice(len(weights), size=pred.shape[0], p=weights)
+        return pred[np.arange(pred.shape[0]), members]
 
     def predict_proba(self, X):
-        pred = self._forward(X)
-        positive_probs = pred[self.weights_.index].dot(self.weights_).to_frame()
-        return np.concatenate((1 - positive_probs, positive_probs), axis=1)
+        pred, weights = self._active_predictions(X)
+        positive_probs = pred.dot(weights)
+        return np.column_stack((1 - positive_probs, positive_probs))
 
-    def _forward(self, X):
-        pred = pd.DataFrame()
-        for t in range(len(self._hs)):
-            if self.weights_[t] == 0:
-                pred[t] = np.zeros(len(X))
-            else:
-                pred[t] = self._hs[t](X)
-        return pred
+    def _active_predictions(self, X):
+        """Return the predictions of the hypotheses with a nonzero weight (one column each) and their weights."""
+        weights = self.weights_[self.weights_ != 0].sort_index()
+        pred = np.empty((len(X), len(weights)))
+        for column, t in enumerate(weights.index):
+            pred[:, column] = self._hs[t](X)
+        return pred, weights.to_numpy()
 
 
 class Helper:
@@ -132,8 +136,8 @@ class Helper:
 
     def __init__(self):
         self.Qsum = pd.Series(dtype="float64")
-        self.lambda_vecs_EG_ = pd.DataFrame()
-        self.lambda_vecs_LP_ = pd.DataFrame()
+        self.lambda_sum_EG_ = 0.0
+        self.lambda_vecs_LP_ = {}
 
     def update_qsum(self, h_idx):
         if h_idx not in self.Qsum.index:
@@ -141,8 +145,9 @@ class Helper:
         self.Qsum[h_idx] += 1.0
 
     def compute_eg(self, t, h_idx, lambda_vec, lagrangian, nu):
-        self.lambda_vecs_EG_[t] = lambda_vec
-        lambda_EG = self.lambda_vecs_EG_.mean(axis=1)
+        # running mean of the multipliers of all the iterations
+        self.lambda_sum_EG_ = self.lambda_sum_EG_ + lambda_vec
+        lambda_EG = self.lambda_sum_EG_ / (t + 1)
         self.update_qsum(h_idx)
         Q_EG = self.Qsum / self.Qsum.sum()
         result_EG = lagrangian.eval_gap(Q_EG, lambda_EG, nu)
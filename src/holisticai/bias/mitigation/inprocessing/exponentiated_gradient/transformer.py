@@ -70,6 +70,15 @@ class ExponentiatedGradientReduction(BaseEstimator, ClassifierMixin, BMImp):
         seed: int
             seed for random initialization
 
+        warm_start: bool
+            Whether to warm-start the estimator from the previous oracle solution. Only used by estimators\
+            with a ``warm_start`` parameter and a linear solution (``coef_``). Defaults to False, as warm starts\
+            lead the oracle to different solutions, and so change the fitted model.
+
+        n_jobs: int
+            Number of threads used to fit the estimator for several candidate Lagrange multipliers at once.\
+            None or 1 fits them one by one.
+
     Examples
     --------
     >>> from holisticai.bias.mitigation import ExponentiatedGradientReduction
@@ -105,6 +114,8 @@ class ExponentiatedGradientReduction(BaseEstimator, ClassifierMixin, BMImp):
         verbose: int | None = 0,
         estimator=None,
         seed: int = 0,
+        warm_start: bool = False,
+        n_jobs: int | None = None,
     ):
         self.constraints = constraints
         self.eps = eps
@@ -118,6 +129,8 @@ class ExponentiatedGradientReduction(BaseEstimator, ClassifierMixin, BMImp):
         self.verbose = verbose
         self.estimator = estimator
         self.seed = seed
+        self.warm_start = warm_start
+        self.n_jobs = n_jobs
 
     def transform_estimator(self, estimator):
         """
@@ -184,6 +197,8 @@ class ExponentiatedGradientReduction(BaseEstimator, ClassifierMixin, BMImp):
             eta0=self.eta0,
             verbose=self.verbose,
             seed=self.seed,
+            warm_start=self.warm_start,
+            n_jobs=self.n_jobs,
         )
 
         self.model_.fit(X, y, sensitive_features=sensitive_features)
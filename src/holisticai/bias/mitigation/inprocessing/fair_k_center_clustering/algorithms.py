@@ -2,6 +2,22 @@ import itertools
 
 import numpy as np
 import scipy.sparse.csgraph
+from sklearn.metrics.pairwise import pairwise_distances, pairwise_distances_argmin, pairwise_distances_argmin_min
+
+
+def _distances_to(X, center):
+    """l1 distances from every point to the given center."""
+    return pairwise_distances(X, X[[center]], metric="l1")[:, 0]
+
+
+def _distances_to_closest(X, centers):
+    """l1 distance from every point to its closest center, computed by blocks of points."""
+    return pairwise_distances_argmin_min(X, X[centers], metric="l1")[1]
+
+
+def _closest_center(X, centers):
+    """Position (in centers) of the closest center of every point, computed by blocks of points."""
+    return pairwise_distances_argmin(X, X[centers], metric="l1")
 
 
 def fair_k_center_exact(dmat, p_attr, nr_centers_per_group, given_centers):
@@ -60,16 +76,18 @@ def fair_k_center_exact(dmat, p_attr, nr_centers_per_group, given_centers):
     return best_choice, clustering, cost
 
 
-def k_center_greedy_with_given_centers(dmat, k, given_centers):
+def k_center_greedy_with_given_centers(X, k, given_centers):
     """
     Description
     -----------
         Implementation of Algorithm 1.
+        The l1 distance of every point to its closest center is updated with the distances
+        to each new center, without computing the distance matrix.
 
     Parameters
     ----------
-    dmat : matrix-like
-        distance matrix of size nxn
+    X : matrix-like
+        data matrix of size nxd
     k : int
         integer smaller than n
     given_centers : array-like
@@ -80,7 +98,7 @@ def k_center_greedy_with_given_centers(dmat, k, given_centers):
         approx. optimal centers
     """
 
-    n = dmat.shape[0]
+    n = X.shape[0]
 
     if k == 0:
         cluster_centers = np.array([], dtype=int)
@@ -92,11 +110,11 @@ def k_center_greedy_with_given_centers(dmat, k, given_centers):
             cluster_centers = given_centers
             kk = 0
 
-        distance_to_closest = np.amin(dmat[np.ix_(cluster_centers, np.arange(n))], axis=0)
+        distance_to_closest = _distances_to_closest(X, cluster_centers)
         while kk < k:
             temp = np.argmax(distance_to_closest)
             cluster_centers = np.append(cluster_centers, temp)
-            distance_to_closest = np.amin(np.vstack((distance_to_closest, dmat[temp, :])), axis=0)
+            distance_to_closest = np.minimum(distance_to_closest, _distances_to(X, temp))
             kk += 1
 
         cluster_centers = cluster_centers[given_centers.size :]
@@ -104,7 +122,7 @@ def k_center_greedy_with_given_centers(dmat, k, given_centers):
     return cluster_centers
 
 
-def fair_k_center_approx(dmat, p_attr, nr_centers_per_group, given_centers):
+def fair_k_center_approx(X, p_attr, nr_centers_per_group, given_centers):
     """
     Description
     -----------
@@ -112,8 +130,8 @@ def fair_k_center_approx(dmat, p_attr, nr_centers_per_group, given_centers):
 
     Parameters
     ----------
-    dmat : array-like
-        distance matrix of size nxn
+    X : array-like
+        data matrix of size nxd
     p_attr :  array-like
         integer-vector of length n with entries in 0,...,m-1, where m is the number of groups
     nr_centers_per_group : array-like
@@ -126,23 +144,21 @@ def fair_k_center_approx(dmat, p_attr, nr_centers_per_group, given_centers):
         approx. optimal centers
     """
 
-    n = dmat.shape[0]
+    n = X.shape[0]
     m = nr_centers_per_group.size
     k = np.sum(nr_centers_per_group)
 
-    cluster_centersTE = k_center_greedy_with_given_centers(dmat, k, given_centers)
+    cluster_centersTE = k_center_greedy_with_given_centers(X, k, given_centers)
 
     CURRENT_nr_clusters_per_sex = np.zeros(m, dtype=int)
     for ell in np.arange(k):
         CURRENT_nr_clusters_per_sex[p_attr[cluster_centersTE[ell]]] += 1
 
-    partition = np.array([np.argmin(dmat[ell, np.hstack((cluster_centersTE, given_centers))]) for ell in np.arange(n)])
+    partition = _closest_center(X, np.hstack((cluster_centersTE, given_centers)))
     selection = partition < k
     selected_partition = partition[selection]
     selected_p_attr = p_attr[selection]
-    selected_index = np.array(
-        [np.where(np.arange(n)[selection] == cluster_centersTE[ell])[0][0] for ell in np.arange(k)]
-    )
+    selected_index = np.searchsorted(np.flatnonzero(selection), cluster_centersTE)
     G, centersTE = swapping_graph(selected_partition, selected_index, selected_p_attr, nr_centers_per_group)
     cluster_centersTE = np.arange(n)[partition < k][centersTE]
 
@@ -167,7 +183,7 @@ def fair_k_center_approx(dmat, p_attr, nr_centers_per_group, given_centers):
         p_attr_newT = np.hstack((p_attr_newT, np.zeros(new_given_centers.size, dtype=int)))
 
         cluster_centers_rek = fair_k_center_approx(
-            dmat[np.ix_(new_data_set, new_data_set)],
+            X[new_data_set],
             p_attr_newT,
             nr_centers_per_group[G],
             np.arange(new_data_set.size - new_given_centers.size, new_data_set.size),
@@ -226,8 +242,7 @@ def swapping_graph(partition, centers, p_attr, nr_centers_per_group):
 
     sex_of_assigned_center = p_attr[centers[partition]]
     Adja = np.zeros((m, m))
-    for ell in np.arange(n):
-        Adja[sex_of_assigned_center[ell], p_attr[ell]] = 1
+    Adja[sex_of_assigned_center, p_attr] = 1
 
     dmat_gr, predec = scipy.sparse.csgraph.shortest_path(Adja, directed=True, return_predecessors=True)
 
@@ -258,8 +273,7 @@ def swapping_graph(partition, centers, p_attr, nr_centers_per_group):
         CURRENT_nr_clusters_per_sex[path[-1]] += 1
 
         Adja = np.zeros((m, m))
-        for ell in np.arange(n):
-            Adja[sex_of_assigned_center[ell], p_attr[ell]] = 1
+        Adja[sex_of_assigned_center, p_attr] = 1
 
         dmat_gr, predec = scipy.sparse.csgraph.shortest_path(Adja, directed=True, return_predecessors=True)
 
@@ -291,7 +305,7 @@ def swapping_graph(partition, centers, p_attr, nr_centers_per_group):
     return G, centers
 
 
-def heuristic_greedy_on_each_group(dmat, p_attr, nr_centers_per_group, given_centers):
+def heuristic_greedy_on_each_group(X, p_attr, nr_centers_per_group, given_centers):
     """
     Description
     -----------
@@ -299,8 +313,8 @@ def heuristic_greedy_on_each_group(dmat, p_attr, nr_centers_per_group, given_cen
 
     Parameters
     ----------
-    dmat : matrix-like
-        distance matrix of size nxn
+    X : matrix-like
+        data matrix of size nxd
     p_attr : array-like
         integer-vector of length n with entries in 0,...,m-1, where m is the number of groups
     nr_centers_per_group : array-like
@@ -322,7 +336,7 @@ def heuristic_greedy_on_each_group(dmat, p_attr, nr_centers_per_group, given_cen
         given_centers_subgroup = np.where(np.isin(subgroup, given_centers))[0]
 
         cent_subgroup = k_center_greedy_with_given_centers(
-            dmat[np.ix_(subgroup, subgroup)],
+            X[subgroup],
             nr_centers_per_group[ell],
             given_centers_subgroup,
         )
@@ -332,7 +346,7 @@ def heuristic_greedy_on_each_group(dmat, p_attr, nr_centers_per_group, given_cen
     return cluster_centers
 
 
-def heuristic_greedy_till_constraint_is_satisfied(dmat, p_attr, nr_centers_per_group, given_centers):
+def heuristic_greedy_till_constraint_is_satisfied(X, p_attr, nr_centers_per_group, given_centers):
     """
     Description
     -----------
@@ -340,8 +354,8 @@ def heuristic_greedy_till_constraint_is_satisfied(dmat, p_attr, nr_centers_per_g
 
     Parameters
     ----------
-    dmat : matrix-like
-        distance matrix of size nxn
+    X : matrix-like
+        data matrix of size nxd
     p_attr : array-like
         integer-vector of length n with entries in 0,...,m-1, where m is the number of groups
     nr_centers_per_group : array-like
@@ -355,7 +369,7 @@ def heuristic_greedy_till_constraint_is_satisfied(dmat, p_attr, nr_centers_per_g
 
     """
 
-    n = dmat.shape[0]
+    n = X.shape[0]
     m = nr_centers_per_group.size
     k = np.sum(nr_centers_per_group)
 
@@ -372,14 +386,14 @@ def heuristic_greedy_till_constraint_is_satisfied(dmat, p_attr, nr_centers_per_g
             cluster_centers = given_centers
             kk = 0
 
-        distance_to_closest = np.amin(dmat[np.ix_(cluster_centers, np.arange(n))], axis=0)
+        distance_to_closest = _distances_to_closest(X, cluster_centers)
         while kk < k:
             feasible_groups = np.where(current_nr_per_sex < nr_centers_per_group)[0]
             feasible_points = np.where(np.isin(p_attr, feasible_groups))[0]
             new_point = feasible_points[np.argmax(distance_to_closest[feasible_points])]
             current_nr_per_sex[p_attr[new_point]] += 1
             cluster_centers = np.append(cluster_centers, new_point)
-            distance_to_closest = np.amin(np.vstack((distance_to_closest, dmat[new_point, :])), axis=0)
+            distance_to_closest = np.minimum(distance_to_closest, _distances_to(X, new_point))
             kk += 1
 
         cluster_centers = cluster_centers[given_centers.size :]
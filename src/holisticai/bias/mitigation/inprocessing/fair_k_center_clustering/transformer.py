@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import numpy as np
 from sklearn.base import BaseEstimator
-from sklearn.metrics.pairwise import pairwise_distances, pairwise_distances_argmin
+from sklearn.metrics.pairwise import pairwise_distances_argmin, pairwise_distances_argmin_min
 
 from holisticai.bias.mitigation.inprocessing.fair_k_center_clustering.algorithms import (
     fair_k_center_approx,
@@ -103,23 +103,17 @@ class FairKCenterClustering(BaseEstimator, BMImp):
         p_attr = np.array(self._sensgroups.fit_transform(sensitive_groups, convert_numeric=True))
 
         n = len(X)
-        dmat = pairwise_distances(X, metric="l1")
         initially_given = np.random.choice(n, size=self.nr_initially_given, replace=False)
-        centers = STRATEGIES_CATALOG[self.strategy](dmat, p_attr, self.req_nr_per_group, initially_given)
-        cost = np.amax(
-            np.amin(
-                dmat[np.ix_(np.hstack((centers, initially_given)), np.arange(n))],
-                axis=0,
-            )
-        )
+        centers = STRATEGIES_CATALOG[self.strategy](X, p_attr, self.req_nr_per_group, initially_given)
         self.centers = centers
         self.initially_given = initially_given
-        self.cost = cost
 
         self.centroids = X[self.centers]
         self.all_centroids = X[self.all_centers]
 
-        self.labels_ = self.all_centers[pairwise_distances_argmin(X, Y=self.all_centroids, metric="l1")]
+        closest, distances = pairwise_distances_argmin_min(X, self.all_centroids, metric="l1")
+        self.cost = np.amax(distances)
+        self.labels_ = self.all_centers[closest]
         self.center_groups_ = p_attr[self.all_centers]
 
     @property
@@ -140,4 +134,4 @@ class FairKCenterClustering(BaseEstimator, BMImp):
         numpy array
             A distance matrix between the samples and the clusters.
         """
-        return pairwise_distances(self.all_centroids, X, metric="l1").argmin(axis=0)
+        return pairwise_distances_argmin(X, self.all_centroids, metric="l1")
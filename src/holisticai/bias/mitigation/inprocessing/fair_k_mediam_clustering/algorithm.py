@@ -1,8 +1,9 @@
-import random
-
 import numpy as np
 from sklearn.metrics.pairwise import pairwise_distances
 
+# bytes of the distance matrix (or of a block of distance columns) held in memory
+_MEMORY_BUDGET = 2**28
+
 
 class KMediamClusteringAlgorithm:
     def __init__(
@@ -12,12 +13,27 @@ class KMediamClusteringAlgorithm:
         max_iter=1000,
         strategy="LS",
         verbose=False,
+        n_candidates=None,
+        precompute_distances="auto",
     ):
         self.k = n_clusters
         self.init_centers = init_centers
         self.max_iter = max_iter
         self.verbose = verbose
         self.strategy = strategy
+        self.n_candidates = n_candidates
+        self.precompute_distances = precompute_distances
+
+    def _distances_to(self, indices):
+        """l1 distances from every point to the given points, one column per point."""
+        indices = np.asarray(indices, dtype=np.intp)
+        if self.distances is not None:
+            return self.distances[:, indices]
+        return pairwise_distances(self.X, self.X[indices], metric="l1")
+
+    def _group_costs(self, point_costs):
+        """Mean cost of every group (rows), for one or several (columns) assignments of the points."""
+        return self.group_weights @ point_costs
 
     def _compute_new_assigment_and_cost(self, centers):
         cost = self._compute_cost(centers)
@@ -25,25 +41,34 @@ class KMediamClusteringAlgorithm:
         return assignment, cost
 
     def _compute_cost(self, centers):
-        centers = np.array(centers, dtype=np.int32)
-        group_costs = []
-        for gid in self.group_ids:
-            group_cost = np.mean(np.amin(self.distances[np.ix_(self.p_attr == gid, centers)], axis=1))
-            group_costs.append(group_cost)
-        return np.max(group_costs)
+        return np.max(self._group_costs(np.amin(self._distances_to(centers), axis=1)))
+
+    def _compute_costs(self, centers):
+        """Cost of several sets of centers (rows), from the distances to their distinct centers."""
+        centers = np.asarray(centers, dtype=np.intp)
+        unique_centers, inverse = np.unique(centers, return_inverse=True)
+        distances = self._distances_to(unique_centers)[:, inverse.reshape(-1)].reshape(self.n, *centers.shape)
+        return np.max(self._group_costs(np.amin(distances, axis=2)), axis=0)
 
     def _compute_new_assigment(self, centers):
         centers = np.array(centers, dtype=np.int32)
-        return centers[np.argmin(self.distances[np.ix_(np.arange(self.n), centers)], axis=1)]
+        return centers[np.argmin(self._distances_to(centers), axis=1)]
 
     def fit(self, X, p_attr):
         self.n = len(X)
-        self.group_ids = np.unique(p_attr)
-        distances = pairwise_distances(X, Y=X, metric="l1")
-
-        self.distances = distances
+        self.group_ids, groups = np.unique(p_attr, return_inverse=True)
+        self.X = X
         self.p_attr = p_attr
 
+        group_matrix = np.zeros((len(self.group_ids), self.n))
+        group_matrix[groups, np.arange(self.n)] = 1.0
+        self.group_weights = group_matrix / group_matrix.sum(axis=1, keepdims=True)
+
+        precompute = self.precompute_distances
+        if precompute == "auto":
+            precompute = self.n * self.n * 8 <= _MEMORY_BUDGET
+        self.distances = pairwise_distances(X, Y=X, metric="l1") if precompute else None
+
         if self.strategy == "LS":
             self._linear_search(X)
 
@@ -51,6 +76,15 @@ class KMediamClusteringAlgorithm:
             self._genetic_algorithm(X)
 
     def _linear_search(self, X):
+        """
+        Local search over single center swaps, accepting the first swap that lowers the cost.
+
+        The distances of every point to the current centers are kept, with the nearest and second nearest center.
+        Replacing center i by a candidate c leaves every point at distance min(d(x, c), d_i(x)), where d_i(x) is the
+        distance to its second nearest center if i is its nearest one and to its nearest center otherwise. The cost
+        of the k swaps of a candidate is then computed in O(n k), from the distances to the candidate only. The
+        candidate distances are computed by blocks, from the distance matrix or from the data.
+        """
         if self.init_centers == "KMedoids":
             from holisticai.utils.models.cluster import KMedoids
 
@@ -58,49 +92,46 @@ class KMediamClusteringAlgorithm:
             starting_centers = kmedoids.medoid_indices_
 
         elif self.init_centers == "Random":
-            starting_centers = random.sample(range(1, self.n - 1), self.k)
-
-        if starting_centers[1] > starting_centers[0] - 1:
-            starting_centers[1] += 1
+            starting_centers = np.random.choice(self.n, self.k, replace=False)
 
-        chosen_centers = starting_centers
-        centers = starting_centers
+        centers = np.array(starting_centers, dtype=np.intp)
+        center_distances = self._distances_to(centers)
+        remaining = _remaining_distances(center_distances)
+        min_cost = np.max(self._group_costs(np.amin(center_distances, axis=1)))
 
-        assignment, min_cost = self._compute_new_assigment_and_cost(centers)
-
-        flag = 0
+        block_size = max(1, _MEMORY_BUDGET // (8 * self.n))
         for _ in range(self.max_iter):
-            flag = 1
+            improved = False
             # Check if any other point is a better center
-            r = list(range(self.n))
-            random.shuffle(r)
-            for c in r:
-                for i in range(self.k):
-                    centers = list(chosen_centers)
-                    # Try replacing i center
-                    if c not in centers:
-                        # set new center
+            candidates = np.random.permutation(self.n)[: self.n_candidates]
+            for start in range(0, len(candidates), block_size):
+                block = candidates[start : start + block_size]
+                block_distances = self._distances_to(block)
+                for j, c in enumerate(block):
+                    if c in centers:
+                        continue
+                    distances = block_distances[:, j]
+                    # cost of replacing every center by c, keep the first one that is better
+                    swap_costs = self._group_costs(np.minimum(distances[:, None], remaining)).max(axis=0)
+                    better = np.flatnonzero(swap_costs < min_cost)
+                    if len(better) > 0:
+                        i = better[0]
                         centers[i] = c
-                        # do new assignment calculate new cost
-                        assignment, curr_cost = self._compute_new_assigment_and_cost(centers)
-                        # change variables if new cost is better
-                        if curr_cost < min_cost:
-                            min_cost = curr_cost
-                            chosen_centers = centers
-                            chosen_assignment = assignment
-                            flag = 0
-                            break
-
-            if flag == 1:
+                        center_distances[:, i] = distances
+                        remaining = _remaining_distances(center_distances)
+                        min_cost = swap_costs[i]
+                        improved = True
+
+            if not improved:
                 break
 
-        self.labels_ = np.array(chosen_assignment)
-        self.cluster_centers_ = X[np.array(chosen_centers)]
-        self.centers = np.array(chosen_centers)
+        self.labels_ = centers[np.argmin(center_distances, axis=1)]
+        self.cluster_centers_ = X[centers]
+        self.centers = centers
 
     def _genetic_algorithm(self, X):
-        def optimization_function(x):
-            return self._compute_cost(x)
+        def optimization_function(population):
+            return self._compute_costs(population)
 
         from holisticai.utils.optimizers import GAHiperparameters, GeneticAlgorithm
 
@@ -126,6 +157,7 @@ class KMediamClusteringAlgorithm:
             variable_boundaries=varbound,
             algorithm_parameters=algorithm_parameters,
             verbose=self.verbose,
+            batch_function=True,
         )
 
         optimizer.run()
@@ -136,3 +168,16 @@ class KMediamClusteringAlgorithm:
         self.labels_ = np.array(chosen_assignment)
         self.cluster_centers_ = X[chosen_centers]
         self.centers = chosen_centers
+
+
+def _remaining_distances(center_distances):
+    """
+    Distance of every point (rows) to its nearest center once each center (columns) is removed: the distance to
+    the second nearest center for the nearest one, and to the nearest center for the others.
+    """
+    n, k = center_distances.shape
+    if k == 1:
+        return np.full((n, 1), np.inf)
+    nearest_two = np.argpartition(center_distances, 1, axis=1)[:, :2]
+    first, second = np.take_along_axis(center_distances, nearest_two, axis=1).T
+    return np.where(np.arange(k) == nearest_two[:, :1], second[:, None], first[:, None])
@@ -35,6 +35,13 @@ class FairKMedianClustering(BaseEstimator, BMImp):
         seed : int
             random seed.
 
+        n_candidates : int
+            Number of points (sampled at random) tried as new centers in each LS sweep. None tries all the points.
+
+        precompute_distances : bool or "auto"
+            Whether to precompute the full matrix of pairwise distances. Otherwise the distances are computed\
+            in chunks when needed. "auto" precomputes the matrix if it takes less than 256MB.
+
     Examples
     --------
     >>> from holisticai.bias.mitigation import FairKMedianClustering
@@ -56,15 +63,24 @@ class FairKMedianClustering(BaseEstimator, BMImp):
         seed: int | None = None,
         strategy: str | None = "LS",
         verbose: int | None = 0,
+        n_candidates: int | None = None,
+        precompute_distances: bool | str = "auto",
     ):
         self.n_clusters = n_clusters
         self.max_iter = max_iter
         self.verbose = verbose
         self.seed = seed
         self.strategy = strategy
+        self.n_candidates = n_candidates
+        self.precompute_distances = precompute_distances
         self._sensgroups = SensitiveGroups()
         self.algorithm = KMediamClusteringAlgorithm(
-            n_clusters=n_clusters, max_iter=max_iter, strategy=strategy, verbose=verbose
+            n_clusters=n_clusters,
+            max_iter=max_iter,
+            strategy=strategy,
+            verbose=verbose,
+            n_candidates=n_candidates,
+            precompute_distances=precompute_distances,
         )
 
     def fit(self, X, group_a, group_b):
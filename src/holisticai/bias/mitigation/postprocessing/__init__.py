@@ -1,6 +1,7 @@
 # imports
 from holisticai.bias.mitigation.postprocessing.calibrated_eq_odds_postprocessing import CalibratedEqualizedOdds
 from holisticai.bias.mitigation.postprocessing.debiasing_exposure.transformer import DebiasingExposure
+from holisticai.bias.mitigation.postprocessing.disparate_impact_remover_rs import DisparateImpactRemoverRS
 from holisticai.bias.mitigation.postprocessing.eq_odds_postprocessing import EqualizedOdds
 from holisticai.bias.mitigation.postprocessing.fair_topk.transformer import FairTopK
 from holisticai.bias.mitigation.postprocessing.lp_debiaser.binary_balancer.transformer import LPDebiaserBinary
@@ -25,12 +26,5 @@ __all__ = [
     "DebiasingExposure",
     "FairTopK",
     "MCMF",
+    "DisparateImpactRemoverRS",
 ]
-
-import importlib
-
-networkx_spec = importlib.util.find_spec("networkx")
-if networkx_spec is not None:
-    from holisticai.bias.mitigation.postprocessing.disparate_impact_remover_rs import DisparateImpactRemoverRS
-
-__all__ += ["DisparateImpactRemoverRS"]
@@ -1,20 +1,12 @@
 from __future__ import annotations
 
-import itertools
-import sys
 from typing import Literal
 
 import numpy as np
-from sklearn.metrics import balanced_accuracy_score
 
-import holisticai.bias.metrics as bias_metrics
 from holisticai.utils.transformers.bias import BMPostprocessing as BMPost
 
 
-def statistical_parity(group_a, group_b, y_pred, _):
-    return bias_metrics.statistical_parity(group_a, group_b, y_pred)
-
-
 class RejectOptionClassification(BMPost):
     """
     Reject option classification gives favorable outcomes (y=1) to unpriviliged groups and unfavorable outcomes (y=0) to\
@@ -45,8 +37,10 @@ class RejectOptionClassification(BMPost):
         Upper bound of constraint on the metric value
     metric_lb : float
         Lower bound of constraint on the metric value
+    num_workers : int
+        Unused, kept for backward compatibility. The search runs in a single process.
     verbose : int
-        If >0, will show progress percentage.
+        Unused, kept for backward compatibility. All the configurations are evaluated at once.
 
     Examples
     --------
@@ -158,68 +152,22 @@ class RejectOptionClassification(BMPost):
         y_proba = params["y_proba"]
 
         class_thresholds = np.linspace(self.low_class_thresh, self.high_class_thresh, self.num_class_thresh)
+        high_roc_margins = np.where(class_thresholds <= 0.5, class_thresholds, 1.0 - class_thresholds)
+        roc_margins = np.linspace(0.0, high_roc_margins, self.num_ROC_margin, axis=1)
 
-        if self.metric_name == "Statistical parity difference":
-            fair_metric = statistical_parity
-
-        elif self.metric_name == "Average odds difference":
-            fair_metric = bias_metrics.average_odds_diff
-
-        elif self.metric_name == "Equal opportunity difference":
-            fair_metric = bias_metrics.equal_opportunity_diff
-
-        else:
-            msg = "metric name not in the list of allowed metrics"
-            raise ValueError(msg)
-
-        args_iterator = [
-            (
-                fair_metric,
-                y,
-                likelihoods,
-                group_a,
-                group_b,
-                class_threshold,
-                self.num_ROC_margin,
-            )
-            for class_threshold in class_thresholds
-        ]
-
-        # Serial
-        # configurations = []
-        # self.num_cases = len(args_iterator)
-        # for i, argv in enumerate(args_iterator):
-        #    configurations.append(_evaluate_threshold(*argv))
-        #    self._log_progres(i)
-
-        # Pool
-        from multiprocessing import Pool
-
-        with Pool(self.num_workers) as p:
-            configurations = list(p.starmap(_evaluate_threshold, args_iterator))
-
-        # Joblib
-        # from joblib import Parallel, delayed
-        # configurations = Parallel(n_jobs=-1)(
-        #    delayed(_evaluate_threshold)(*args) for args in args_iterator
-        # )
-
-        configurations = list(itertools.chain.from_iterable(configurations))
-
-        selected_configurations = list(
-            filter(
-                lambda c: (c["fair_score"] >= self.metric_lb) and (c["fair_score"] <= self.metric_ub),
-                configurations,
-            )
+        balanced_accuracy, fair_score = _evaluate_configurations(
+            self.metric_name, y, likelihoods, group_a, group_b, class_thresholds[:, None], roc_margins
         )
 
-        if any(selected_configurations):
-            best_config = max(selected_configurations, key=lambda c: c["balanced_accurracy"])
+        selected = (fair_score >= self.metric_lb) & (fair_score <= self.metric_ub)
+        if selected.any():
+            best = np.argmax(np.where(selected, balanced_accuracy, -np.inf))
         else:
-            best_config = min(configurations, key=lambda c: abs(c["fair_score"]))
+            best = np.nanargmin(np.abs(fair_score))
+        best_thresh, best_margin = np.unravel_index(best, roc_margins.shape)
 
-        self.ROC_margin = best_config["roc_margin"]
-        self.classification_threshold = best_config["class_thresh"]
+        self.ROC_margin = roc_margins[best_thresh, best_margin]
+        self.classification_threshold = class_thresholds[best_thresh]
 
         return self
 
@@ -277,27 +225,89 @@ class RejectOptionClassification(BMPost):
             "y_score": new_y_score,
         }
 
-    def _log_progres(self, i):
-        if self.verbose > 0:
-            sys.stdout.write(f"\rProgress: {i+1}/{self.num_cases}")
-            sys.stdout.flush()
-
-
-def _evaluate_threshold(fair_metric, labels, likelihoods, group_a, group_b, class_thresh, num_roc_margin):
-    base_predictions = np.where(likelihoods > class_thresh, 1, 0)
-    high_roc_margin = class_thresh if class_thresh <= 0.5 else 1.0 - class_thresh
-    roc_margins = np.linspace(0.0, high_roc_margin, num_roc_margin)
-    configurations = []
-    for roc_margin in roc_margins:
-        prediction = predict(base_predictions, likelihoods, group_a, group_b, class_thresh, roc_margin)
-        configuration = {
-            "class_thresh": class_thresh,
-            "roc_margin": roc_margin,
-            "balanced_accurracy": balanced_accuracy_score(labels, prediction),
-            "fair_score": fair_metric(group_b, group_a, prediction, labels),
-        }
-        configurations.append(configuration)
-    return configurations
+
+def _count_above(scores, cuts):
+    """Count the scores strictly above every cut, from the sorted scores."""
+    scores = np.sort(scores)
+    return len(scores) - np.searchsorted(scores, cuts, side="right")
+
+
+def _evaluate_configurations(metric_name, labels, likelihoods, group_a, group_b, class_thresh, roc_margin):
+    """
+    Evaluate the balanced accuracy and the fairness metric of every (threshold, ROC margin) configuration.
+
+    Description
+    ----------
+    With the ROC method a sample is predicted favorable when its likelihood is above a cut that only depends \
+    on its group: threshold + margin for group_b, threshold - margin for group_a and threshold for the other \
+    samples. The likelihoods are sorted once per group and label, and the confusion counts of every configuration \
+    are obtained by a binary search of its cuts.
+
+    Parameters
+    ----------
+    metric_name : str
+        Name of the fairness metric.
+    labels : array-like
+        Target vector (nb_examples,)
+    likelihoods : array-like
+        Likelihood of the favorable class (nb_examples,)
+    group_a : array-like
+        Group membership vector (boolean)
+    group_b : array-like
+        Group membership vector (boolean)
+    class_thresh : array-like
+        Classification thresholds, broadcastable with roc_margin
+    roc_margin : array-like
+        ROC margins
+
+    Returns
+    -------
+    tuple of array-like
+        The balanced accuracy and the fairness metric value of every configuration.
+    """
+    labels = labels == 1
+    upper, lower = class_thresh + roc_margin, class_thresh - roc_margin
+    other = np.broadcast_to(class_thresh, upper.shape)
+
+    # predicted positives of each (rule, label) cell, samples in both groups follow the group_b rule
+    cells = {}
+    for name, rows, cut in (
+        ("ab", group_a & group_b, upper),
+        ("b", group_b & ~group_a, upper),
+        ("a", group_a & ~group_b, lower),
+        ("other", ~group_a & ~group_b, other),
+    ):
+        for label in (False, True):
+            cells[name, label] = _count_above(likelihoods[rows & (labels == label)], cut)
+
+    pos, neg = labels.sum(), (~labels).sum()
+    tp = sum(cells[name, True] for name in ("ab", "b", "a", "other"))
+    fp = sum(cells[name, False] for name in ("ab", "b", "a", "other"))
+    tpr, tnr = (tp / pos if pos > 0 else None), ((neg - fp) / neg if neg > 0 else None)
+    balanced_accuracy = tnr if tpr is None else tpr if tnr is None else (tnr + tpr) / 2
+
+    # the fairness metric compares group_b against group_a
+    rates = {}
+    for name, members, parts in (("b", group_b, ("ab", "b")), ("a", group_a, ("ab", "a"))):
+        group_tp = sum(cells[part, True] for part in parts)
+        group_fp = sum(cells[part, False] for part in parts)
+        group_pos, group_neg = (members & labels).sum(), (members & ~labels).sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rates["sr", name] = (group_fp + group_tp) / members.sum()
+        rates["tpr", name] = group_tp / group_pos if group_pos > 0 else np.zeros(upper.shape)
+        rates["fpr", name] = group_fp / group_neg if group_neg > 0 else np.zeros(upper.shape)
+
+    if metric_name == "Statistical parity difference":
+        fair_score = rates["sr", "b"] - rates["sr", "a"]
+    elif metric_name == "Average odds difference":
+        fair_score = 0.5 * ((rates["tpr", "b"] - rates["tpr", "a"]) + (rates["fpr", "b"] - rates["fpr", "a"]))
+    elif metric_name == "Equal opportunity difference":
+        fair_score = rates["tpr", "b"] - rates["tpr", "a"]
+    else:
+        msg = "metric name not in the list of allowed metrics"
+        raise ValueError(msg)
+
+    return balanced_accuracy, fair_score
 
 
 def predict(predictions, likelihoods, group_a, group_b, threshold, roc_margin):
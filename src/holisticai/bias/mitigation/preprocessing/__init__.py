@@ -1,5 +1,6 @@
 # Imports
 from holisticai.bias.mitigation.preprocessing.correlation_remover import CorrelationRemover
+from holisticai.bias.mitigation.preprocessing.disparate_impact_remover import DisparateImpactRemover
 from holisticai.bias.mitigation.preprocessing.fairlet_clustering.transformer import FairletClusteringPreprocessing
 from holisticai.bias.mitigation.preprocessing.learning_fair_representation import LearningFairRepresentation
 from holisticai.bias.mitigation.preprocessing.reweighing import Reweighing
@@ -9,12 +10,5 @@ __all__ = [
     "Reweighing",
     "CorrelationRemover",
     "FairletClusteringPreprocessing",
+    "DisparateImpactRemover",
 ]
-
-import importlib
-
-networkx_spec = importlib.util.find_spec("networkx")
-if networkx_spec is not None:
-    from holisticai.bias.mitigation.preprocessing.disparate_impact_remover import DisparateImpactRemover
-
-__all__ += ["DisparateImpactRemover"]
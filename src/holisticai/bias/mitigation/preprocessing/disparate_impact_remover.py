@@ -16,6 +16,8 @@ class DisparateImpactRemover(BMPre):
     ----------
     repair_level : float, optional
         The amount of repair to be applied. It should be between 0.0 and 1.0. Default is 1.
+    n_jobs : int, optional
+        The number of features repaired in parallel. Default is None (one).
 
     Examples
     --------
@@ -31,9 +33,10 @@ class DisparateImpactRemover(BMPre):
         discovery and data mining. 2015.
     """
 
-    def __init__(self, repair_level=1.0):
+    def __init__(self, repair_level=1.0, n_jobs=None):
         self._assert_parameters(repair_level)
         self.repair_level = repair_level
+        self.n_jobs = n_jobs
         self._sensgroups = SensitiveGroups()
 
     def _assert_parameters(self, repair_level):
@@ -79,14 +82,14 @@ class DisparateImpactRemover(BMPre):
         p_attr = self._sensgroups.fit_transform(sensitive_features, convert_numeric=True).to_numpy()
 
         # Combine the sensitive feature matrix with the input data matrix
-        data = np.c_[p_attr, X].tolist()
+        data = np.c_[p_attr, X]
 
         # Apply numerical repair to the first column of the combined matrix
-        repairer = NumericalRepairer(feature_to_repair=0, repair_level=self.repair_level, kdd=False)
+        repairer = NumericalRepairer(feature_to_repair=0, repair_level=self.repair_level, kdd=False, n_jobs=self.n_jobs)
         new_data_matrix_np = repairer.repair(data)
 
         # Return only the repaired input data matrix (without the sensitive feature column)
-        return np.array([np.array(row[1:]) for row in new_data_matrix_np])
+        return new_data_matrix_np[:, 1:]
 
     def transform(self, X: np.ndarray, group_a: np.ndarray, group_b: np.ndarray):
         """
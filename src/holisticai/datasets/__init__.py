@@ -2,13 +2,14 @@
 The :mod:`holisticai.datasets` module includes dataloaders for quick experimentation
 """
 
-from holisticai.datasets._dataloaders import load_hai_datasets
+from holisticai.datasets._dataloaders import cache_hai_dataset, load_hai_datasets
 from holisticai.datasets._dataset import DataLoader, Dataset, DatasetDict, GroupByDataset, concatenate_datasets
 from holisticai.datasets._load_dataset import load_dataset
 
 __all__ = [
     "load_dataset",
     "load_hai_datasets",
+    "cache_hai_dataset",
     "Dataset",
     "DatasetDict",
     "GroupByDataset",
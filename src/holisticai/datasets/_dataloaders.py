@@ -1,16 +1,29 @@
 # Base Imports
-from os import environ, makedirs
-from os.path import expanduser, join
+import hashlib
+import json
+import logging
+from os import environ, fdopen, makedirs, remove, replace
+from os.path import basename, dirname, exists, expanduser, join
+from tempfile import mkstemp
+from urllib.request import urlopen
 
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+_HAI_DATASETS_URL = (
+    "https://huggingface.co/datasets/holistic-ai/holisticai-datasets/resolve/main/data/{name}/{name}_dataset.parquet"
+)
+_CACHE_FOLDER = "hai_datasets"
+_CACHE_INDEX = "index.json"
+
 
 def get_data_home(data_home=None):
     """
     Return the path of the holisticai data directory.
     By default the data directory is set to a folder named 'holisticai_data' in the
     user home folder.
-    Alternatively, it can be set by the 'HOLISTICAI_DATA' environment
+    Alternatively, it can be set by the 'HOLISTIC_AI_DATA' environment
     variable or programmatically by giving an explicit folder path. The '~'
     symbol is expanded to the user home folder.
     If the folder does not already exist, it is automatically created.
@@ -31,7 +44,117 @@ def get_data_home(data_home=None):
     return data_home
 
 
-def load_hai_datasets(dataset_name, data_home=None):
+def _cache_dir(data_home=None):
+    """Return the folder of the local datasets cache, creating it if needed."""
+    cache_dir = join(get_data_home(data_home), _CACHE_FOLDER)
+    makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def _file_checksum(path):
+    """Return the sha256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(2**20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_cache_index(cache_dir):
+    """Return the mapping dataset name -> checksum of the cache, empty if the index is missing or unreadable."""
+    path = join(cache_dir, _CACHE_INDEX)
+    if not exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            index = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cache index {path} could not be read, ignoring it: {e}")
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _write_atomic(path, content, mode="wb"):
+    """
+    Write a file through a temporary file so that readers never see it partially written.
+
+    The temporary file has a unique name in the same folder, so that concurrent writers
+    never write to the same file, and the last one to finish replaces the others.
+    """
+    fd, tmp_path = mkstemp(dir=dirname(path), prefix=f"{basename(path)}.", suffix=".tmp")
+    try:
+        with fdopen(fd, mode) as f:
+            f.write(content)
+        replace(tmp_path, path)
+    except BaseException:
+        if exists(tmp_path):
+            remove(tmp_path)
+        raise
+
+
+def _store_in_cache(cache_dir, dataset_name, content):
+    """
+    Store the parquet content of a dataset under its checksum and return its path.
+
+    The data files are content addressed, so concurrent writers cannot corrupt them. An index
+    entry lost to a concurrent update of the index only makes the next load download the
+    dataset again.
+    """
+    checksum = hashlib.sha256(content).hexdigest()
+    path = join(cache_dir, f"{checksum}.parquet")
+    if not exists(path):
+        _write_atomic(path, content)
+
+    index = _read_cache_index(cache_dir)
+    index[dataset_name] = checksum
+    _write_atomic(join(cache_dir, _CACHE_INDEX), json.dumps(index, indent=2), mode="w")
+    return path
+
+
+def _cached_path(cache_dir, dataset_name):
+    """Return the path of a cached dataset, or None if it is missing or corrupted."""
+    checksum = _read_cache_index(cache_dir).get(dataset_name)
+    if checksum is None:
+        return None
+
+    path = join(cache_dir, f"{checksum}.parquet")
+    if not exists(path):
+        return None
+    if _file_checksum(path) != checksum:
+        logger.warning(f"Cached file for dataset {dataset_name} does not match its checksum, discarding it.")
+        remove(path)
+        return None
+    return path
+
+
+def cache_hai_dataset(dataset_name, path, data_home=None):
+    """
+    Pre-seed the local datasets cache with a parquet file.
+
+    Once seeded, `load_hai_datasets` reads the dataset from the cache,
+    which makes it available without network access (see `offline`).
+
+    Parameters
+    ----------
+    dataset_name : str
+        Name of the dataset (as in `load_hai_datasets`).
+    path : str
+        Path to a local copy of the dataset parquet file.
+    data_home : str, optional
+        The data home directory holding the cache. If None, we use
+        the default data home directory.
+
+    Returns
+    -------
+    str
+        The path of the cached file.
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    return _store_in_cache(_cache_dir(data_home), dataset_name, content)
+
+
+def load_hai_datasets(dataset_name, data_home=None, offline=None, timeout=60):
     """
     Generic function to load datasets from holisticai datasets repository.
 
@@ -53,15 +176,26 @@ def load_hai_datasets(dataset_name, data_home=None):
     - mw_small
     - mw_medium
 
+    Datasets are downloaded once to a cache in the data home directory,
+    stored under their sha256 checksum, and read locally afterwards. The
+    checksum is verified on every read and a corrupted file is downloaded
+    again.
+
     Parameters
     ----------
-    name : str
+    dataset_name : str
         Name of the dataset.
-    version : int
-        Version of the dataset.
     data_home : str, optional
         The directory to which the data is downloaded. If None, we download
         to the default data home directory.
+    offline : bool, optional
+        If True, the dataset is only read from the cache and never downloaded
+        (see `cache_hai_dataset` to pre-seed it). If None, it is True when the
+        'HOLISTIC_AI_OFFLINE' environment variable is set to 1 or true.
+    timeout : float, optional
+        Timeout in seconds of the connection and of every read of the download,
+        after which a stalled download raises an error. Default is 60.
+
     Returns
     -------
     data : pd.DataFrame
@@ -72,9 +206,21 @@ def load_hai_datasets(dataset_name, data_home=None):
     .. [1] https://huggingface.co/datasets/holistic-ai/holisticai-datasets
 
     """
-    if data_home is None:
-        data_home = get_data_home()
+    if offline is None:
+        offline = environ.get("HOLISTIC_AI_OFFLINE", "0").lower() in ["1", "true"]
+
+    cache_dir = _cache_dir(data_home)
+    path = _cached_path(cache_dir, dataset_name)
+
+    if path is None:
+        if offline:
+            msg = (
+                f"Dataset {dataset_name} is not in the cache {cache_dir} and offline mode is on. "
+                "Use cache_hai_dataset to pre-seed the cache."
+            )
+            raise FileNotFoundError(msg)
+        with urlopen(_HAI_DATASETS_URL.format(name=dataset_name), timeout=timeout) as response:  # noqa: S310
+            content = response.read()
+        path = _store_in_cache(cache_dir, dataset_name, content)
 
-    return pd.read_parquet(
-        f"https://huggingface.co/datasets/holistic-ai/holisticai-datasets/resolve/main/data/{dataset_name}/{dataset_name}_dataset.parquet"
-    )
+    return pd.read_parquet(path)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from queue import Full, Queue
+from threading import Event, Thread
 from typing import TYPE_CHECKING, Literal
 
 import pandas as pd
@@ -161,6 +163,9 @@ class DataLoader(DatasetReprObj):
     """
     A class that represents a data loader for a dataset. This class is used to load the dataset in batches in a specific data type (jax, pandas, or numpy).
 
+    The features are converted to contiguous arrays once, when the loader is created, and the batches are
+    views (or gathers, when shuffling) of those arrays. With jax, only the rows of each batch are transferred.
+
     Parameters
     ----------
     dataset: Dataset
@@ -169,13 +174,23 @@ class DataLoader(DatasetReprObj):
         The size of the batch.
     dtype: Literal["jax", "pandas", "numpy"]
         The data type to load the dataset in.
+    shuffle: bool
+        Whether to shuffle the rows at the beginning of each epoch.
+    seed: int, optional
+        The seed of the shuffling. Each epoch uses a new permutation drawn from this seed.
+    drop_last: bool
+        Whether to drop the last batch if it is smaller than the batch size.
+    prefetch: int
+        The number of batches prepared ahead in a background thread. If 0, batches are prepared on demand.
 
     Example
     -------
 
     >>> from holisticai.datasets import load_dataset
     >>> dataset = load_dataset("adult")
-    >>> dataloader = DataLoader(dataset, batch_size=32, dtype="jax")
+    >>> dataloader = DataLoader(
+    ...     dataset, batch_size=32, dtype="jax", shuffle=True, seed=0
+    ... )
     >>> for batch in dataloader:
     ...     print(batch)
     """
@@ -185,43 +200,59 @@ class DataLoader(DatasetReprObj):
         dataset: Dataset,
         batch_size: int,
         dtype: Literal["jax", "pandas", "numpy"],
+        shuffle: bool = False,
+        seed: int | None = None,
+        drop_last: bool = False,
+        prefetch: int = 0,
     ):
         self.batch_size = batch_size
         self.dataset = dataset
         self.dtype = dtype
-        self.num_batches = int(np.ceil(len(dataset) / batch_size))
-
-    def batched(self):
-        def batch_generator(batch_size):
-            for i in range(self.num_batches):
-                batch = Dataset(self.dataset.data.iloc[i * batch_size : (i + 1) * batch_size])
-                yield batch
-
-        if self.dtype == "jax":
-            import jax.numpy as jnp
-
-            def batch_generator_jax(batch_size):
-                for batch in batch_generator(batch_size):
-                    yield {f: jnp.array(batch[f].values) for f in batch.features}
-
-            return batch_generator_jax(self.batch_size)
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.prefetch = prefetch
+        self.random_state = np.random.RandomState(seed)
+        if drop_last:
+            self.num_batches = len(dataset) // batch_size
+        else:
+            self.num_batches = int(np.ceil(len(dataset) / batch_size))
+        self._arrays = self._convert_features()
 
+    def _convert_features(self):
+        """Converts each feature of the dataset to the loader data type once."""
         if self.dtype == "pandas":
-
-            def batch_generator_pandas(batch_size):
-                for batch in batch_generator(batch_size):
-                    yield {f: batch[f] for f in batch.features}
-
-            return batch_generator_pandas(self.batch_size)
-
+            return {f: self.dataset[f] for f in self.dataset.features}
+
+        if self.dtype in ["jax", "numpy"]:
+            return {f: np.ascontiguousarray(self.dataset[f].to_numpy()) for f in self.dataset.features}
+        return None
+
+    def _batch_indices(self):
+        """Yields the rows of each batch of an epoch: slices, or index arrays when shuffling."""
+        n = len(self.dataset)
+        order = self.random_state.permutation(n) if self.shuffle else None
+        for i in range(self.num_batches):
+            rows = slice(i * self.batch_size, min((i + 1) * self.batch_size, n))
+            yield rows if order is None else order[rows]
+
+    def _take(self, rows):
+        """Returns the batch with the given rows."""
+        if self.dtype == "pandas":
+            return {f: feature.iloc[rows].reset_index(drop=True) for f, feature in self._arrays.items()}
         if self.dtype == "numpy":
+            return {f: arr[rows] for f, arr in self._arrays.items()}
+        if self.dtype == "jax":
+            import jax.numpy as jnp
 
-            def batch_generator_numpy(batch_size):
-                for batch in batch_generator(batch_size):
-                    yield {f: batch[f].values for f in batch.features}
+            return {f: jnp.asarray(arr[rows]) for f, arr in self._arrays.items()}
+        return Dataset(self.dataset.data.iloc[rows])
 
-            return batch_generator_numpy(self.batch_size)
-        return batch_generator(self.batch_size)
+    def batched(self):
+        """Returns a generator over the batches of one epoch."""
+        batches = (self._take(rows) for rows in self._batch_indices())
+        if self.prefetch > 0:
+            return _prefetch(batches, self.prefetch)
+        return batches
 
     def __iter__(self):
         """Iterates over the batches in the dataset."""
@@ -319,16 +350,34 @@ class Dataset(DatasetReprObj):
             _metadata=self._metadata,
         )
 
-    def filter(self, fn):
-        """Returns a new dataset with rows filtered based on the given function."""
+    def filter(self, fn, vectorized: bool = False):
+        """Returns a new dataset with rows filtered based on the given function.
 
-        def fnw(row):
-            new_row = {k[0] if k[0] == k[1] else k: v for k, v in row.to_dict().items()}
-            return fn(new_row)
+        Parameters
+        ----------
 
-        mask: pd.Series = pd.Series(self.data.apply(fnw, axis=1))
-        new_data: pd.DataFrame = pd.DataFrame(self.data[mask])
-        return Dataset(new_data, _metadata=self._metadata)
+        fn: function
+            The predicate. In vectorized mode it receives a dictionary with the whole
+            columns of each feature (as in `dataset[feature]`) and returns a boolean mask.
+            Otherwise it receives one row at a time as a dictionary and returns a boolean.
+        vectorized: bool, optional
+            Whether to apply the function in a vectorized manner or not. Defaults to False.
+        """
+        if vectorized:
+            mask = np.asarray(fn({feature: self[feature] for feature in self.features}))
+            if mask.dtype != bool or mask.shape != (self.num_rows,):
+                msg = f"Vectorized filter function must return a boolean mask of length {self.num_rows}."
+                raise ValueError(msg)
+            return Dataset(self.data[mask], _metadata=self._metadata)
+
+        keys = [col[0] if col[0] == col[1] else col for col in self.data.columns]
+        rows = ({key: row[i] for i, key in enumerate(keys)} for row in self._rows())
+        mask = np.fromiter((fn(row) for row in rows), dtype=bool, count=self.num_rows)
+        return Dataset(self.data[mask], _metadata=self._metadata)
+
+    def _rows(self):
+        """Iterates over the rows of the dataset as tuples of python values."""
+        return self.data.itertuples(index=False, name=None)
 
     def groupby(self, key: list[str] | str):
         """Returns a new GroupByDataset object based on the given key."""
@@ -364,20 +413,21 @@ class Dataset(DatasetReprObj):
                 names=["features", "subfeatures"],
             )
         else:
+            # positions of the subfeatures of each feature
+            positions = {}
+            for i, (feature, subfeature) in enumerate(self.data.columns):
+                positions.setdefault(feature, []).append((subfeature, i))
 
             def fnw_(row):
                 result = {}
-                for upper in row.index.levels[0]:
-                    sub_row = row[upper]
-                    if isinstance(sub_row, pd.Series):
-                        result[upper] = sub_row.to_dict() if len(sub_row) > 1 else sub_row.item()
-                    elif isinstance(sub_row, pd.DataFrame):
-                        sub_row = sub_row.squeeze()
-                        result[upper] = sub_row.to_dict() if len(sub_row) > 1 else sub_row.squeeze().item()
+                for feature, subfeatures in positions.items():
+                    if len(subfeatures) > 1:
+                        result[feature] = {subfeature: row[i] for subfeature, i in subfeatures}
+                    else:
+                        result[feature] = row[subfeatures[0][1]]
                 return fn(result)
 
-            updated_data = self.data.apply(fnw_, axis=1, result_type="expand")
-            updated_data = pd.DataFrame(updated_data)
+            updated_data = pd.DataFrame([fnw_(row) for row in self._rows()], index=self.data.index)
             new_columns = pd.MultiIndex.from_tuples(
                 [(col, col) for col in updated_data.columns],
                 names=["features", "subfeatures"],
@@ -450,6 +500,55 @@ class Dataset(DatasetReprObj):
         self.data.columns = self.data.columns.set_names(["features", "subfeatures"])
 
 
+class _ProducerError:
+    """Wraps an exception raised by the generator run by _prefetch."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _prefetch(generator, size, poll_interval=0.1):
+    """
+    Runs a generator in a background thread, keeping up to size items ready.
+
+    When the consumer stops early (break, exception or garbage collection), the
+    thread notices it within poll_interval seconds, closes the generator and exits.
+    """
+    queue = Queue(maxsize=size)
+    stop = Event()
+    end = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=poll_interval)
+            except Full:
+                continue
+            return True
+        return False
+
+    def produce():
+        try:
+            for item in generator:
+                if not put(item):
+                    return
+        except BaseException as e:  # noqa: BLE001
+            put(_ProducerError(e))
+            return
+        finally:
+            generator.close()
+        put(end)
+
+    Thread(target=produce, daemon=True).start()
+    try:
+        while (item := queue.get()) is not end:
+            if isinstance(item, _ProducerError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
 def concatenate_datasets(part_datasets: list[Dataset]):
     features = part_datasets[0].features
     return Dataset(
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+from os import close, makedirs, remove, replace
+from os.path import basename, dirname, exists, join
+from tempfile import mkstemp
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from holisticai.__about__ import __version__
+from holisticai.datasets import _utils
+from holisticai.datasets._dataloaders import _CACHE_FOLDER as _HAI_CACHE_FOLDER
+from holisticai.datasets._dataloaders import _read_cache_index, get_data_home
+from holisticai.datasets._dataset import Dataset
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FOLDER = "processed_datasets"
+_METADATA_KEY = b"holisticai"
+
+
+def _loader_version(loader: Callable) -> str:
+    """
+    Returns a version of the loader code: the source of the module defining the
+    loader (with its helpers) and of the dataset utilities, together with the
+    package version.
+    """
+    module = inspect.getmodule(loader)
+    source = inspect.getsource(module if module is not None else loader) + inspect.getsource(_utils) + __version__
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def _raw_checksums(data_home: str | None = None) -> dict:
+    """Returns the checksums of the raw datasets in the hai datasets cache of the data home, read by the loaders."""
+    return _read_cache_index(join(get_data_home(data_home), _HAI_CACHE_FOLDER))
+
+
+def _is_stale(raw_checksums: dict, data_home: str | None = None) -> bool:
+    """Whether a raw dataset used when a dataset was cached has changed since."""
+    current = _raw_checksums(data_home)
+    return any(current.get(name, checksum) != checksum for name, checksum in raw_checksums.items())
+
+
+def _cache_path(loader: Callable, params: dict, data_home: str | None = None) -> str:
+    """Returns the cache file of a loader called with the given parameters."""
+    cache_dir = join(get_data_home(data_home), _CACHE_FOLDER)
+    makedirs(cache_dir, exist_ok=True)
+    key = json.dumps([loader.__name__, params, _loader_version(loader)], sort_keys=True)
+    return join(cache_dir, f"{loader.__name__}_{hashlib.sha256(key.encode()).hexdigest()[:32]}.arrow")
+
+
+def _write_dataset(dataset: Dataset, path: str, raw_checksums: dict):
+    """
+    Writes a dataset as an uncompressed Arrow IPC (feather) file, together with the
+    checksums of the raw datasets it was built from.
+
+    The file is written to a unique temporary file, then moved into place, so that
+    concurrent writers never write to the same file.
+    """
+    data = dataset.data
+    metadata = {
+        "columns": [list(col) for col in data.columns],
+        "metadata": dataset._metadata,  # noqa: SLF001
+        "raw_checksums": raw_checksums,
+    }
+    table = pa.Table.from_pandas(data.set_axis([str(i) for i in range(data.shape[1])], axis=1), preserve_index=False)
+    table = table.replace_schema_metadata({**table.schema.metadata, _METADATA_KEY: json.dumps(metadata)})
+
+    fd, tmp_path = mkstemp(dir=dirname(path), prefix=f"{basename(path)}.", suffix=".tmp")
+    close(fd)
+    try:
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        replace(tmp_path, path)
+    except BaseException:
+        if exists(tmp_path):
+            remove(tmp_path)
+        raise
+
+
+def _read_dataset(path: str, data_home: str | None = None) -> Dataset | None:
+    """
+    Reads a dataset written by _write_dataset, memory mapping the file. Returns None
+    if a raw dataset it was built from has changed since in the data home.
+    """
+    table = feather.read_table(path, memory_map=True)
+    metadata = json.loads(table.schema.metadata[_METADATA_KEY])
+    if _is_stale(metadata.get("raw_checksums", {}), data_home):
+        return None
+    data = table.to_pandas()
+    data.columns = pd.MultiIndex.from_tuples(
+        [tuple(col) for col in metadata["columns"]], names=["features", "subfeatures"]
+    )
+    return Dataset(data, _metadata=metadata["metadata"])
+
+
+def load_cached(loader: Callable, data_home: str | None = None, **params) -> Dataset:
+    """
+    Memoizes a dataset loader on disk.
+
+    The dataset returned by `loader(**params)` is stored in the data home directory
+    in a columnar format and read back (memory mapped) on the next calls with the
+    same parameters. The cache is invalidated when the code of the loader module
+    changes, and when a raw dataset it was built from changes in the hai datasets
+    cache of the same data home.
+
+    Parameters
+    ----------
+    loader: Callable
+        The dataset loader, returning a Dataset.
+    data_home: (str, Optional)
+        The data home directory holding the cache. If None, we use the default
+        data home directory.
+    **params:
+        The parameters of the loader.
+
+    Returns
+    -------
+    Dataset: The loaded dataset.
+    """
+    path = _cache_path(loader, params, data_home=data_home)
+    if exists(path):
+        dataset = _read_dataset(path, data_home)
+        if dataset is not None:
+            return dataset
+
+    dataset = loader(**params)
+    try:
+        _write_dataset(dataset, path, _raw_checksums(data_home))
+    except (TypeError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Dataset from {loader.__name__} could not be cached: {e}")
+    return dataset
@@ -7,6 +7,7 @@ import pandas as pd
 
 from holisticai.datasets._dataloaders import load_hai_datasets
 from holisticai.datasets._dataset import Dataset
+from holisticai.datasets._dataset_cache import load_cached
 from holisticai.datasets._utils import convert_float_to_categorical, get_protected_values
 
 
@@ -1007,6 +1008,7 @@ def load_dataset(
     preprocessed: bool = True,
     protected_attribute: str | None = None,
     target: str | None = None,
+    cache: bool = True,
 ) -> Dataset:
     """
     Load a specific dataset based on the given dataset name.
@@ -1020,6 +1022,11 @@ def load_dataset(
     protected_attribute: (str, Optional)
         If this parameter is set, the dataset will be returned with the protected attribute as a binary column group_a and group_b.
         Otherwise, the dataset will be returned with the protected attribute as a column p_attrs.
+    target: (str, Optional)
+        The target variable (only used by the student dataset).
+    cache: (bool, Optional)
+        Whether to store the processed dataset in the data home directory and reuse it
+        on later calls with the same parameters (until the loader code or the raw data changes).
 
     Returns
     -------
@@ -1030,48 +1037,61 @@ def load_dataset(
     NotImplementedError:
         If the specified dataset name is not supported.
     """
+
+    def loader(fn, **params):
+        return load_cached(fn, **params) if cache else fn(**params)
+
     if dataset_name == "adult":
-        return load_adult_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_adult_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "law_school":
-        return load_law_school_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_law_school_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "student_multiclass":
-        return load_student_multiclass_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(
+            load_student_multiclass_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute
+        )
     if dataset_name == "student":
-        return load_student_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute, target=target)
+        return loader(
+            load_student_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute, target=target
+        )
     if dataset_name == "lastfm":
-        return load_lastfm_dataset()
+        return loader(load_lastfm_dataset)
     if dataset_name == "us_crime":
-        return load_us_crime_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_us_crime_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "us_crime_multiclass":
-        return load_us_crime_multiclass_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(
+            load_us_crime_multiclass_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute
+        )
     if dataset_name == "clinical_records":
-        return load_clinical_records_dataset(protected_attribute=protected_attribute)
+        return loader(load_clinical_records_dataset, protected_attribute=protected_attribute)
     if dataset_name == "german_credit":
-        return load_german_credit_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_german_credit_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "census_kdd":
-        return load_census_kdd_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_census_kdd_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "bank_marketing":
-        return load_bank_marketing_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_bank_marketing_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "compas_two_year_recid":
-        return load_compas_two_year_recid_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(
+            load_compas_two_year_recid_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute
+        )
     if dataset_name == "compas_is_recid":
-        return load_compas_is_recid_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_compas_is_recid_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "diabetes":
-        return load_diabetes_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_diabetes_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "acsincome":
-        return load_acsincome_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_acsincome_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "acspublic":
-        return load_acspublic_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_acspublic_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "mw_medium":
-        return load_mw_medium_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_mw_medium_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     if dataset_name == "mw_small":
-        return load_mw_small_dataset(preprocessed=preprocessed, protected_attribute=protected_attribute)
+        return loader(load_mw_small_dataset, preprocessed=preprocessed, protected_attribute=protected_attribute)
     raise NotImplementedError
 
 
 def _load_dataset_benchmark(
     dataset_name: ProcessedDatasets,
     preprocessed: bool = True,
+    cache: bool = True,
 ) -> Dataset:
     """
     Load a specific dataset based on the given dataset name.
@@ -1085,6 +1105,9 @@ def _load_dataset_benchmark(
     protected_attribute: (str, Optional)
         If this parameter is set, the dataset will be returned with the protected attribute as a binary column group_a and group_b.
         Otherwise, the dataset will be returned with the protected attribute as a column p_attrs.
+    cache: (bool, Optional)
+        Whether to store the processed dataset in the data home directory and reuse it
+        on later calls with the same parameters (until the loader code or the raw data changes).
 
     Returns
     -------
@@ -1095,82 +1118,86 @@ def _load_dataset_benchmark(
     NotImplementedError:
         If the specified dataset name is not supported.
     """
+
+    def loader(fn, **params):
+        return load_cached(fn, **params) if cache else fn(**params)
+
     if dataset_name == "adult_sex":
-        return load_adult_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_adult_dataset, preprocessed=preprocessed, protected_attribute="sex")
     if dataset_name == "adult_race":
-        return load_adult_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_adult_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "law_school_sex":
-        return load_law_school_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_law_school_dataset, preprocessed=preprocessed, protected_attribute="sex")
     if dataset_name == "law_school_race":
-        return load_law_school_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_law_school_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "student_multiclass_sex":
-        return load_student_multiclass_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_student_multiclass_dataset, preprocessed=preprocessed, protected_attribute="sex")
     if dataset_name == "student_multiclass_address":
-        return load_student_multiclass_dataset(preprocessed=preprocessed, protected_attribute="address")
+        return loader(load_student_multiclass_dataset, preprocessed=preprocessed, protected_attribute="address")
 
     if dataset_name == "student_sex":
-        return load_student_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_student_dataset, preprocessed=preprocessed, protected_attribute="sex")
     if dataset_name == "student_address":
-        return load_student_dataset(preprocessed=preprocessed, protected_attribute="address")
+        return loader(load_student_dataset, preprocessed=preprocessed, protected_attribute="address")
 
     if dataset_name == "us_crime_race":
-        return load_us_crime_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_us_crime_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "us_crime_multiclass_race":
-        return load_us_crime_multiclass_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_us_crime_multiclass_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "clinical_records_sex":
-        return load_clinical_records_dataset(protected_attribute="sex")
+        return loader(load_clinical_records_dataset, protected_attribute="sex")
 
     if dataset_name == "german_credit_sex":
-        return load_german_credit_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_german_credit_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     if dataset_name == "census_kdd_sex":
-        return load_census_kdd_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_census_kdd_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     if dataset_name == "bank_marketing_marital":
-        return load_bank_marketing_dataset(preprocessed=preprocessed, protected_attribute="marital")
+        return loader(load_bank_marketing_dataset, preprocessed=preprocessed, protected_attribute="marital")
 
     if dataset_name == "compas_two_year_recid_sex":
-        return load_compas_two_year_recid_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_compas_two_year_recid_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     if dataset_name == "compas_two_year_recid_race":
-        return load_compas_two_year_recid_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_compas_two_year_recid_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "compas_is_recid_sex":
-        return load_compas_is_recid_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_compas_is_recid_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     if dataset_name == "compas_is_recid_race":
-        return load_compas_is_recid_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_compas_is_recid_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "diabetes_sex":
-        return load_diabetes_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_diabetes_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     if dataset_name == "diabetes_race":
-        return load_diabetes_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_diabetes_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "acsincome_sex":
-        return load_acsincome_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_acsincome_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     if dataset_name == "acsincome_race":
-        return load_acsincome_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_acsincome_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "acspublic_sex":
-        return load_acspublic_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_acspublic_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     if dataset_name == "acspublic_race":
-        return load_acspublic_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_acspublic_dataset, preprocessed=preprocessed, protected_attribute="race")
 
     if dataset_name == "mw_medium_race":
-        return load_mw_medium_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_mw_medium_dataset, preprocessed=preprocessed, protected_attribute="race")
     if dataset_name == "mw_medium_sex":
-        return load_mw_medium_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_mw_medium_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     if dataset_name == "mw_small_race":
-        return load_mw_small_dataset(preprocessed=preprocessed, protected_attribute="race")
+        return loader(load_mw_small_dataset, preprocessed=preprocessed, protected_attribute="race")
     if dataset_name == "mw_small_sex":
-        return load_mw_small_dataset(preprocessed=preprocessed, protected_attribute="sex")
+        return loader(load_mw_small_dataset, preprocessed=preprocessed, protected_attribute="sex")
 
     raise NotImplementedError
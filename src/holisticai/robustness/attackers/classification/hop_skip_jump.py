@@ -27,7 +27,11 @@ class HopSkipJump:
     name : str, optional
         The name of the attack.
     batch_size : int, optional
-        Batch size for the attack.
+        Batch size for the attack: the number of samples attacked together in batched mode.
+    batched : bool, optional
+        If True, each block of `batch_size` samples goes through the initialization, binary search,
+        gradient estimation and step size search together, with one model prediction per iteration
+        for the whole block. If False, the samples are attacked one at a time.
     targeted : bool, optional
         Indicates whether the attack is targeted or not. If True, the positive ground truth is used as the target.
     norm : int, float, str, optional
@@ -71,9 +75,11 @@ class HopSkipJump:
         input_size=0,
         theta=0.0,
         curr_iter=0,
+        batched=True,
     ):
         self.name = name
         self.batch_size = batch_size
+        self.batched = batched
         self.targeted = targeted
         self.norm = norm
         self.max_iter = max_iter
@@ -181,6 +187,27 @@ class HopSkipJump:
 
         x_adv = x.copy()
 
+        # Generate the adversarial samples by blocks
+        if self.batched:
+            has_init = np.array([adv_init is not None for adv_init in x_adv_init])
+            x_adv_init = np.array([x[i] if adv_init is None else adv_init for i, adv_init in enumerate(x_adv_init)])
+            init_preds = np.array([-1 if init_pred is None else init_pred for init_pred in init_preds])
+            mask = np.array([np.ones(x.shape[1:]) if m is None else m for m in mask])
+
+            for i in range(0, x.shape[0], self.batch_size):
+                self.curr_iter = start
+                rows = slice(i, i + self.batch_size)
+                x_adv[rows] = self._perturb_batch(
+                    x=x[rows],
+                    y=y[rows] if self.targeted else None,  # type: ignore
+                    y_p=preds[rows],
+                    init_pred=init_preds[rows],
+                    adv_init=x_adv_init[rows],
+                    has_init=has_init[rows],
+                    mask=mask[rows],
+                )
+            return x_array_to_df(x_adv, feature_names=self.feature_names)
+
         # Generate the adversarial samples
         for ind, val in enumerate(x_adv):
             self.curr_iter = start
@@ -605,7 +632,294 @@ class HopSkipJump:
         # Compute update
         return grad / np.linalg.norm(grad) if self.norm == 2 else np.sign(grad)
 
-    def _adversarial_satisfactory(self, samples: np.ndarray, target: int) -> np.ndarray:
+    def _perturb_batch(
+        self,
+        x: np.ndarray,
+        y: np.ndarray | None,
+        y_p: np.ndarray,
+        init_pred: np.ndarray,
+        adv_init: np.ndarray,
+        has_init: np.ndarray,
+        mask: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Internal attack function for a block of examples (batched version of `_perturb`).
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The original inputs.
+        y : np.ndarray, optional
+            The target labels (targeted attack only).
+        y_p : np.ndarray
+            The predicted labels of x.
+        init_pred : np.ndarray
+            The predicted labels of the initial images.
+        adv_init : np.ndarray
+            Initial arrays to act as initial adversarial examples.
+        has_init : np.ndarray
+            Whether an initial adversarial example is given for each input.
+        mask : np.ndarray
+            The masks applied to the adversarial perturbations of each input.
+
+        Returns
+        -------
+        np.ndarray
+            The adversarial examples.
+        """
+        target = y if self.targeted else y_p
+        initial_sample, found = self._init_sample_batch(x, target, y_p, init_pred, adv_init, has_init, mask)
+
+        x_adv = x.copy()
+        if found.any():
+            x_adv[found] = self._attack_batch(initial_sample[found], x[found], target[found], mask[found])
+        return x_adv
+
+    def _init_sample_batch(
+        self,
+        x: np.ndarray,
+        target: np.ndarray,
+        y_p: np.ndarray,
+        init_pred: np.ndarray,
+        adv_init: np.ndarray,
+        has_init: np.ndarray,
+        mask: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find initial adversarial examples for a block of inputs (batched version of `_init_sample`).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The initial adversarial examples and whether one was found for each input.
+        """
+        nprd = np.random.RandomState()
+        initial_sample = x.copy()
+
+        if self.targeted:
+            # Attack unsatisfied yet and the initial image satisfied
+            pending = y_p != target
+            given = pending & has_init & (init_pred == target)
+        else:
+            # The initial image satisfied
+            pending = np.ones(len(x), dtype=bool)
+            given = has_init & (init_pred != y_p)
+        initial_sample[given] = adv_init[given]
+        found = given.copy()
+        pending &= ~given
+
+        # Random search, one prediction per round for all the pending inputs
+        random_found = np.zeros(len(x), dtype=bool)
+        for _ in range(self.init_size):
+            if not pending.any():
+                break
+            random_img = nprd.uniform(self._clip_min, self._clip_max, size=x[pending].shape).astype(x.dtype)
+            random_img = random_img * mask[pending] + x[pending] * (1 - mask[pending])
+
+            satisfied = self._adversarial_satisfactory(samples=random_img, target=target[pending])
+            rows = np.flatnonzero(pending)[satisfied]
+            initial_sample[rows] = random_img[satisfied]
+            random_found[rows] = True
+            pending[rows] = False
+
+        # Binary search to reduce the l2 distance to the original images
+        if random_found.any():
+            initial_sample[random_found] = self._binary_search_batch(
+                current_sample=initial_sample[random_found],
+                original_sample=x[random_found],
+                target=target[random_found],
+                norm=2,
+                threshold=0.001,
+            )
+        return initial_sample, found | random_found
+
+    def _attack_batch(
+        self,
+        initial_sample: np.ndarray,
+        original_sample: np.ndarray,
+        target: np.ndarray,
+        mask: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Main function for the boundary attack on a block of examples (batched version of `_attack`).
+
+        Returns
+        -------
+        np.ndarray
+            The adversarial examples.
+        """
+        current_sample = initial_sample.copy()
+        active = np.arange(len(current_sample))
+
+        # Main loop to wander around the boundary
+        for _ in range(self.max_iter):
+            cur, orig, tgt = current_sample[active], original_sample[active], target[active]
+
+            # First compute delta
+            delta = self._compute_delta_batch(current_sample=cur, original_sample=orig)
+
+            # Then run binary search
+            cur = self._binary_search_batch(current_sample=cur, original_sample=orig, norm=self.norm, target=tgt)
+
+            # Next compute the number of evaluations and compute the update
+            num_eval = min(int(self.init_eval * np.sqrt(self.curr_iter + 1)), self.max_eval)
+            update = self._compute_update_batch(
+                current_sample=cur, num_eval=num_eval, delta=delta, target=tgt, mask=mask[active]
+            )
+
+            # Finally run step size search by first computing epsilon
+            dist = self._distance(orig, cur)
+            epsilon = 2.0 * dist / np.sqrt(self.curr_iter + 1)
+            potential_sample = cur.copy()
+            searching = np.ones(len(cur), dtype=bool)
+            while searching.any():
+                epsilon[searching] /= 2.0
+                potential_sample[searching] = cur[searching] + epsilon[searching, None] * update[searching]
+                success = self._adversarial_satisfactory(samples=potential_sample[searching], target=tgt[searching])
+                searching[np.flatnonzero(searching)[success]] = False
+
+            # Update current samples
+            current_sample[active] = np.clip(potential_sample, self._clip_min, self._clip_max)
+
+            # Update current iteration
+            self.curr_iter += 1
+
+            # If attack failed, return original sample
+            failed = np.isnan(current_sample[active]).any(axis=1)
+            if failed.any():  # pragma: no cover
+                current_sample[active[failed]] = original_sample[active[failed]]
+                active = active[~failed]
+            if len(active) == 0:  # pragma: no cover
+                break
+
+        return current_sample
+
+    def _distance(self, original_sample: np.ndarray, current_sample: np.ndarray) -> np.ndarray:
+        """Row-wise distance between two blocks of samples in the norm of the attack."""
+        if self.norm == 2:
+            return np.linalg.norm(original_sample - current_sample, axis=1)
+        return np.max(abs(original_sample - current_sample), axis=1)
+
+    def _binary_search_batch(
+        self,
+        current_sample: np.ndarray,
+        original_sample: np.ndarray,
+        target: np.ndarray,
+        norm: int | float | str,  # noqa: PYI041
+        threshold: float | None = None,
+    ) -> np.ndarray:
+        """
+        Binary search to approach the boundary for a block of examples (batched version of `_binary_search`).
+
+        Returns
+        -------
+        np.ndarray
+            The adversarial examples.
+        """
+        n = len(current_sample)
+        if norm == 2:
+            upper_bound, lower_bound = np.ones(n), np.zeros(n)
+            threshold = np.full(n, self.theta if threshold is None else threshold)
+        else:
+            upper_bound, lower_bound = np.max(abs(original_sample - current_sample), axis=1), np.zeros(n)
+            threshold = np.minimum(upper_bound * self.theta, self.theta) if threshold is None else np.full(n, threshold)
+
+        # One prediction per halving for the samples that have not converged yet
+        searching = (upper_bound - lower_bound) > threshold
+        while searching.any():
+            alpha = (upper_bound[searching] + lower_bound[searching]) / 2.0
+            interpolated_sample = self._interpolate_batch(
+                current_sample=current_sample[searching],
+                original_sample=original_sample[searching],
+                alpha=alpha,
+                norm=norm,
+            )
+            satisfied = self._adversarial_satisfactory(samples=interpolated_sample, target=target[searching])
+            rows = np.flatnonzero(searching)
+            lower_bound[rows[~satisfied]] = alpha[~satisfied]
+            upper_bound[rows[satisfied]] = alpha[satisfied]
+            searching = (upper_bound - lower_bound) > threshold
+
+        return self._interpolate_batch(
+            current_sample=current_sample,
+            original_sample=original_sample,
+            alpha=upper_bound,
+            norm=norm,
+        )
+
+    def _compute_delta_batch(self, current_sample: np.ndarray, original_sample: np.ndarray) -> np.ndarray:
+        """
+        Compute the delta parameter of each example in a block (batched version of `_compute_delta`).
+        """
+        if self.curr_iter == 0:
+            return np.full(len(current_sample), 0.1 * (self._clip_max - self._clip_min))
+
+        dist = self._distance(original_sample, current_sample)
+        if self.norm == 2:
+            return np.sqrt(np.prod(self.input_shape)) * self.theta * dist
+        return np.prod(self.input_shape) * self.theta * dist
+
+    def _compute_update_batch(
+        self,
+        current_sample: np.ndarray,
+        num_eval: int,
+        delta: np.ndarray,
+        target: np.ndarray,
+        mask: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Compute the update in Eq.(14) for a block of examples (batched version of `_compute_update`). The
+        predictions of all the evaluation samples of the block are done at once.
+        """
+        n, n_features = current_sample.shape
+
+        # Generate random noise
+        rnd_noise_shape = (n, num_eval, n_features)
+        if self.norm == 2:
+            rnd_noise = np.random.randn(*rnd_noise_shape)
+        else:
+            rnd_noise = np.random.uniform(low=-1, high=1, size=rnd_noise_shape)
+        rnd_noise = rnd_noise * mask[:, None]
+
+        # Normalize random noise to fit into the range of input data
+        rnd_noise = rnd_noise / np.sqrt(np.sum(rnd_noise**2, axis=2, keepdims=True))
+        eval_samples = np.clip(
+            current_sample[:, None] + delta[:, None, None] * rnd_noise, self._clip_min, self._clip_max
+        )
+        rnd_noise = (eval_samples - current_sample[:, None]) / delta[:, None, None]
+
+        # Compute gradient
+        satisfied = self._adversarial_satisfactory(
+            samples=eval_samples.reshape(-1, n_features), target=np.repeat(target, num_eval)
+        )
+        f_val = 2 * satisfied.reshape(n, num_eval, 1) - 1.0
+        f_mean = np.mean(f_val, axis=1, keepdims=True)
+
+        # as in _compute_update, the mean is only removed when both outcomes are observed
+        f_val = np.where(np.abs(f_mean) == 1.0, f_val, f_val - f_mean)
+        grad = np.mean(f_val * rnd_noise, axis=1)
+
+        # Compute update
+        if self.norm == 2:
+            return grad / np.linalg.norm(grad, axis=1, keepdims=True)
+        return np.sign(grad)
+
+    @staticmethod
+    def _interpolate_batch(
+        current_sample: np.ndarray,
+        original_sample: np.ndarray,
+        alpha: np.ndarray,
+        norm: int | float | str,  # noqa: PYI041
+    ) -> np.ndarray:
+        """
+        Interpolate new samples with a different factor per row (batched version of `_interpolate`).
+        """
+        alpha = alpha[:, None]
+        if norm == 2:
+            return (1 - alpha) * original_sample + alpha * current_sample
+        return np.clip(current_sample, original_sample - alpha, original_sample + alpha)
+
+    def _adversarial_satisfactory(self, samples: np.ndarray, target: int | np.ndarray) -> np.ndarray:
         """
         Check whether an image is adversarial.
 
@@ -613,8 +927,8 @@ class HopSkipJump:
         ----------
         samples : np.ndarray
             The input data.
-        target : int
-            The target label.
+        target : int or np.ndarray
+            The target label, or one target label per sample.
 
         Returns
         -------
@@ -329,20 +329,21 @@ class ZooAttack:
             The updated constant, lower bound, and upper bound.
         """
 
-        comparison = [
-            self._compare(best_label[i], np.argmax(y_batch[i])) and best_label[i] != -np.inf
-            for i in range(len(c_batch))
-        ]
-        for i, comp in enumerate(comparison):
-            if comp:
-                # Successful attack
-                c_upper_bound[i] = min(c_upper_bound[i], c_batch[i])
-                if c_upper_bound[i] < 1e9:
-                    c_batch[i] = (c_lower_bound[i] + c_upper_bound[i]) / 2
-            else:
-                # Failure attack
-                c_lower_bound[i] = max(c_lower_bound[i], c_batch[i])
-                c_batch[i] = (c_lower_bound[i] + c_upper_bound[i]) / 2 if c_upper_bound[i] < 1e9 else c_batch[i] * 10
+        success = self._compare(best_label, np.argmax(y_batch, axis=1)) & (best_label != -np.inf)
+
+        # Successful attack
+        c_upper_bound[success] = np.minimum(c_upper_bound[success], c_batch[success])
+        bisect = success & (c_upper_bound < 1e9)
+        c_batch[bisect] = (c_lower_bound[bisect] + c_upper_bound[bisect]) / 2
+
+        # Failure attack
+        failure = ~success
+        c_lower_bound[failure] = np.maximum(c_lower_bound[failure], c_batch[failure])
+        c_batch[failure] = np.where(
+            c_upper_bound[failure] < 1e9,
+            (c_lower_bound[failure] + c_upper_bound[failure]) / 2,
+            c_batch[failure] * 10,
+        )
 
         return c_batch, c_lower_bound, c_upper_bound
 
@@ -452,12 +453,11 @@ class ZooAttack:
                 prev_loss = loss
 
             # Adjust the best result
-            labels_batch = np.argmax(y_batch, axis=1)
-            for i, (dist, pred) in enumerate(zip(l2dist, np.argmax(preds, axis=1))):
-                if dist < best_dist[i] and self._compare(pred, labels_batch[i]):
-                    best_dist[i] = dist
-                    best_attack[i] = x_adv[i]
-                    best_label[i] = pred
+            pred_labels = np.argmax(preds, axis=1)
+            improved = (l2dist < best_dist) & self._compare(pred_labels, np.argmax(y_batch, axis=1))
+            best_dist[improved] = l2dist[improved]
+            best_attack[improved] = x_adv[improved]
+            best_label[improved] = pred_labels[improved]
 
         # Resize images to original size before returning
         best_attack = np.array(best_attack)
@@ -539,9 +539,9 @@ class ZooAttack:
                 raise
 
         # Create the batch of modifications to run
-        for i in range(self.nb_parallel * self._current_noise.shape[0]):
-            coord_batch[2 * i, indices[i]] += self.variable_h
-            coord_batch[2 * i + 1, indices[i]] -= self.variable_h
+        rows = 2 * np.arange(self.nb_parallel * self._current_noise.shape[0])
+        coord_batch[rows, indices] += self.variable_h
+        coord_batch[rows + 1, indices] -= self.variable_h
 
         # Compute loss for all samples and coordinates, then optimize
         expanded_x = np.repeat(x, 2 * self.nb_parallel, axis=0).reshape((-1,) + x.shape[1:])
@@ -614,7 +614,7 @@ class ZooAttack:
         beta1, beta2 = 0.9, 0.999
 
         # Estimate grads from loss variation (constant `h` from the paper is fixed to .0001)
-        grads = np.array([(losses[i] - losses[i + 1]) / (2 * self.variable_h) for i in range(0, len(losses), 2)])
+        grads = (losses[0::2] - losses[1::2]) / (2 * self.variable_h)
 
         # ADAM update
         mean[index] = beta1 * mean[index] + (1 - beta1) * grads
@@ -777,13 +777,15 @@ class ZooAttack:
         np.ndarray
             The pooled image.
         """
-        img_pool = np.copy(image)
-        for i in range(0, image.shape[1], kernel_size):
-            for j in range(0, image.shape[2], kernel_size):
-                img_pool[:, i : i + kernel_size, j : j + kernel_size] = np.max(
-                    image[:, i : i + kernel_size, j : j + kernel_size],
-                    axis=(1, 2),
-                    keepdims=True,
-                )
+        n, height, width = image.shape
+        pad_height, pad_width = -height % kernel_size, -width % kernel_size
+
+        # Edge padding keeps the maximum of the incomplete blocks unchanged
+        padded = np.pad(image, [(0, 0), (0, pad_height), (0, pad_width)], mode="edge")
+        blocks = padded.reshape(
+            n, padded.shape[1] // kernel_size, kernel_size, padded.shape[2] // kernel_size, kernel_size
+        )
+        img_pool = blocks.max(axis=(2, 4))
+        img_pool = np.repeat(np.repeat(img_pool, kernel_size, axis=1), kernel_size, axis=2)
 
-        return img_pool
+        return img_pool[:, :height, :width]
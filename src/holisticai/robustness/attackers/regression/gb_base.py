@@ -2,6 +2,7 @@ import logging
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import cho_factor, cho_solve
 from sklearn.linear_model import Ridge
 from sklearn.metrics import mean_squared_error
 
@@ -79,8 +80,6 @@ class GDPoisoner:
         self.sigma = sigma
         self.eps = eps
 
-        self.initclf, self.initlam = None, None
-
         self.colmap = None
         self.poison_proportion = poison_proportion
         self.init = INITS[initializer]
@@ -119,10 +118,9 @@ class GDPoisoner:
             logger.info("Training Error: %f", err)
             if err > besterr:
                 bestpoisx, bestpoisy, besterr = np.copy(poisx), poisy[:], err
-        poisx, poisy = bestpoisx, bestpoisy
         logger.info("Best initialization error: %f", besterr)
 
-        return poisx, poisy
+        return np.asarray(bestpoisx, dtype=float), np.asarray(bestpoisy, dtype=float)
 
     def _generate(self, X_train, y_train, categorical_mask=None, return_only_poisoned=False):
         """
@@ -151,9 +149,12 @@ class GDPoisoner:
         This method performs an iterative process to generate poisoned data points that can be used to test the robustness
         of regression models. The process involves:
         - Initializing poison points.
-        - Iteratively updating the poison points based on the model's performance.
+        - Iteratively updating all the poison points together based on the model's performance.
         - Adjusting the learning rate if no progress is made.
         - Stopping when the maximum number of iterations is reached or the change in objective value is below a threshold.
+
+        The models are fitted in closed form from the Gram matrix of the training data, which is computed and
+        factorized once. Adding the poisoning points is a low rank update of it.
         """
         X_original = X_train.copy()
         y_original = y_train.copy()
@@ -168,30 +169,17 @@ class GDPoisoner:
             self.colmap = column_mapping
 
         poisx, poisy = self._initialize_poison_points(X_train, y_train, self.init)
-        self.trnx, self.trny = X_train, y_train
+        self.trnx, self.trny = np.asarray(X_train, dtype=float), np.asarray(y_train, dtype=float)
         self.samplenum = X_train.shape[0]
         self.feanum = X_train.shape[1]
+        self._precompute()
 
         poisct = poisx.shape[0]
         logger.info("Poison Count: %f", poisct)
 
-        new_poisx = np.zeros(poisx.shape)
-        new_poisy = [None for a in poisy]
-
-        best_poisx = np.zeros(poisx.shape)
-        best_poisy = [None for a in poisy]
-
         best_obj = 0
         count = 0
 
-        sig = self._compute_sigma()  # can already compute sigma and mu
-        mu = self._compute_mu()  # as x_c does not change them
-        eq7lhs = np.bmat([[sig, np.transpose(mu)], [mu, np.matrix([1])]])
-
-        # initial model - used in visualization
-        clf_init, lam_init = self.learn_model(self.trnx, self.trny, None)
-        clf, lam = clf_init, lam_init
-
         # figure out starting error
         it_res = self.iter_progress(poisx, poisy, poisx, poisy)
 
@@ -204,21 +192,8 @@ class GDPoisoner:
         # main work loop
         while True:
             count += 1
-            new_poisx = np.matrix(np.zeros(poisx.shape))
-            new_poisy = [None for a in poisy]
-            x_cur = np.concatenate((self.trnx, poisx), axis=0)
-            y_cur = np.concatenate([self.trny, poisy])
-
-            clf, lam = self.learn_model(x_cur, y_cur, None)
-            pois_params = [(poisx[i], poisy[i], eq7lhs, mu, clf, lam) for i in range(poisct)]
-            outofboundsct = 0
-
-            for i in range(poisct):
-                cur_pois_res = self.poison_data_subroutine(pois_params[i])
-
-                new_poisx[i] = cur_pois_res[0]
-                new_poisy[i] = cur_pois_res[1]
-                outofboundsct += cur_pois_res[2]
+            new_poisx, new_poisy, outofbounds = self.poison_data_subroutine(poisx, poisy)
+            outofboundsct = np.sum(outofbounds)
 
             it_res = self.iter_progress(poisx, poisy, new_poisx, new_poisy)
 
@@ -231,7 +206,6 @@ class GDPoisoner:
             if it_res[0] < it_res[1]:
                 logger.info("no progress")
                 self.eta *= 0.75
-                new_poisx, new_poisy = poisx, poisy
             else:
                 poisx = new_poisx
                 poisy = new_poisy
@@ -259,155 +233,226 @@ class GDPoisoner:
 
         return pd.DataFrame(x_out, columns=x_columns), pd.Series(y_out, name=y_column)
 
-    def poison_data_subroutine(self, in_tuple):
+    def _precompute(self):
+        """
+        Computes the Gram matrix of the training data (with an intercept column), its regularized \
+        factorization and the left hand side of the equation 7 of [1], which do not depend on the poisoning points.
+        """
+        z = self._augment(self.trnx)
+        self._gram = z.T @ z
+        self._moment = z.T @ self.trny
+        self._sqnorm = self.trny @ self.trny
+
+        # the intercept is not regularized
+        penalty = np.ones(self.feanum + 1)
+        penalty[-1] = 0
+        self._gram_factor = cho_factor(self._gram + self.alpha * np.diag(penalty))
+        self._theta = cho_solve(self._gram_factor, self._moment)
+
+        # [[sigma, mu.T], [mu, 1]] with sigma the (regularized) covariance matrix and mu the mean
+        eq7lhs = self._gram / self.samplenum + self.lam * np.diag(penalty)
+        self._eq7lhs_pinv = np.linalg.pinv(eq7lhs)
+
+    @staticmethod
+    def _augment(x):
+        """
+        Appends a column of ones to the input samples, for the intercept.
+        """
+        return np.hstack([x, np.ones((x.shape[0], 1))])
+
+    def learn_model(self, poisx, poisy):
         """
-        Poisons a single poisoning point input is passed in as a tuple and immediately unpacked.
+        Fits the model on the training data together with the poisoning points, as a rank-k update \
+        of the training Gram matrix.
 
         Parameters
         ----------
-        in_tuple : tuple
-            Tuple containing poisoning point, poisoning target, eq7lhs, mu, clf, lam.
+        poisx : array-like, shape (n_poison_samples, n_features)
+            The poisoning input samples.
+        poisy : array-like, shape (n_poison_samples,)
+            The poisoning target values.
 
         Returns
         -------
-        poisxelem : array-like, shape (1, n_features)
-            The poisoned input sample.
-        poisyelem : float
-            The poisoned target value.
-        outofbounds : bool
-            Whether the target value was pushed out of bounds.
+        array-like, shape (n_features+1,)
+            The weights of the model followed by its intercept.
         """
+        z = self._augment(poisx)
+        penalty = np.full(self.feanum + 1, self.alpha)
+        penalty[-1] = 0
+        return np.linalg.solve(self._gram + np.diag(penalty) + z.T @ z, self._moment + z.T @ poisy)
 
-        poisxelem, poisyelem, eq7lhs, mu, clf, lam = in_tuple
-        m = self._compute_m(clf, poisxelem, poisyelem)
+    def learn_models(self, poisx, poisy):
+        """
+        Fits one model for each poisoning point, on the training data together with this point only. \
+        Each fit is a rank-1 (Sherman-Morrison) update of the factorized training Gram matrix.
 
-        # compute partials
-        wxc, bxc, wyc, byc = self._compute_wb_zc(eq7lhs, mu, clf.coef_, m, self.samplenum, poisxelem)
+        Parameters
+        ----------
+        poisx : array-like, shape (n_poison_samples, n_features)
+            The poisoning input samples.
+        poisy : array-like, shape (n_poison_samples,)
+            The poisoning target values.
 
-        if self.objective == 0:
-            r = self._compute_r(clf, lam)
-            otherargs = (r,)
-        else:
-            otherargs = None
+        Returns
+        -------
+        array-like, shape (n_poison_samples, n_features+1)
+            The weights of each model followed by its intercept.
+        """
+        z = self._augment(poisx)
+        v = cho_solve(self._gram_factor, z.T).T
+        theta = self._theta + v * poisy[:, None]
+        scale = np.sum(z * theta, axis=1) / (1 + np.sum(z * v, axis=1))
+        return theta - v * scale[:, None]
 
-        attack, attacky = self.attack_comp(clf, wxc, bxc, wyc, byc, otherargs)
+    def _comp_obj_trn(self, theta):
+        """
+        Computes the objective value (training MSE and regularization) of a batch of models.
 
-        # keep track of how many points are pushed out of bounds
-        outofbounds = bool(poisyelem >= 1 and attacky >= 0 or poisyelem <= 0 and attacky <= 0)
+        Parameters
+        ----------
+        theta : array-like, shape (n_models, n_features+1)
+            The weights of each model followed by its intercept.
 
-        # include y in gradient normalization
-        if self.opty:
-            allattack = np.array(np.concatenate((attack, attacky), axis=1))
-            allattack = allattack.ravel()
-        else:
-            allattack = attack.ravel()
+        Returns
+        -------
+        array-like, shape (n_models,)
+            The objective values.
+        """
+        theta = np.atleast_2d(theta)
+        mse = (np.sum((theta @ self._gram) * theta, axis=1) - 2 * theta @ self._moment + self._sqnorm) / self.samplenum
+        return mse + self.lam * np.linalg.norm(theta[:, :-1], axis=1) / 2
 
-        norm = np.linalg.norm(allattack)
-        allattack = allattack / norm if norm > 0 else allattack
-        if self.opty:
-            attack, attacky = allattack[:-1], allattack[-1]
-        else:
-            attack = allattack
+    def _comp_attack_trn(self, theta, poisx, poisy):
+        """
+        Computes the gradient of the objective with respect to each poisoning point, following \
+        the closed form of the equation 7 of [1] for all the points together.
+
+        Parameters
+        ----------
+        theta : array-like, shape (n_features+1,)
+            The weights of the model followed by its intercept.
+        poisx : array-like, shape (n_poison_samples, n_features)
+            The poisoning input samples.
+        poisy : array-like, shape (n_poison_samples,)
+            The poisoning target values.
 
-        poisxelem, poisyelem, _ = self.linesearch(poisxelem, poisyelem, attack, attacky)
-        poisxelem = poisxelem.reshape((1, self.feanum))
+        Returns
+        -------
+        array-like, shape (n_poison_samples, n_features)
+            The attack on the input samples.
+        array-like, shape (n_poison_samples,)
+            The attack on the target values.
+        """
+        w, b = theta[:-1], theta[-1]
 
-        return poisxelem, poisyelem, outofbounds
+        # gradient of the objective with respect to the model parameters
+        grad = (self._gram @ theta - self._moment) / self.samplenum
+        grad[:-1] += self.lam * w
+        q = self._eq7lhs_pinv @ grad
+        q_x, q_b = q[:-1], q[-1]
 
-    def linesearch(self, poisxelem, poisyelem, attack, attacky):
+        err = poisx @ w + b - poisy
+        proj = poisx @ q_x + q_b
+        attackx = -(proj[:, None] * w + err[:, None] * q_x) / self.samplenum
+        attacky = proj / self.samplenum
+        return attackx, attacky
+
+    def poison_data_subroutine(self, poisx, poisy):
         """
-        Line search routine for poisoning points.
+        Poisons all the poisoning points together.
 
         Parameters
         ----------
-        poisxelem : array-like, shape (1, n_features)
-            The poisoning input sample.
-        poisyelem : float
-            The poisoning target value.
-        attack : array-like, shape (1, n_features)
-            The attack on the input sample.
-        attacky : float
-            The attack on the target value.
+        poisx : array-like, shape (n_poison_samples, n_features)
+            The poisoning input samples.
+        poisy : array-like, shape (n_poison_samples,)
+            The poisoning target values.
 
         Returns
         -------
-        array-like, shape (1, n_features)
-            The poisoned input sample.
-        float
-            The poisoned target value.
-        float
-            The objective value.
+        poisx : array-like, shape (n_poison_samples, n_features)
+            The poisoned input samples.
+        poisy : array-like, shape (n_poison_samples,)
+            The poisoned target values.
+        outofbounds : array-like, shape (n_poison_samples,)
+            Whether the target values were pushed out of bounds.
         """
-        k = 0
-        x0 = np.copy(self.trnx)
-        y0 = self.trny[:]
+        theta = self.learn_model(poisx, poisy)
+        attack, attacky = self.attack_comp(theta, poisx, poisy)
 
-        curx = np.append(x0, poisxelem.reshape(1, -1), axis=0)
-        cury = y0[:]
-        cury = np.append(cury, poisyelem)
+        # keep track of how many points are pushed out of bounds
+        outofbounds = (poisy >= 1) & (attacky >= 0) | (poisy <= 0) & (attacky <= 0)
 
-        clf, lam = self.learn_model(curx, cury, None)
-        clf1, lam1 = clf, lam
+        # include y in gradient normalization
+        norm = np.sum(attack**2, axis=1)
+        if self.opty:
+            norm += attacky**2
+        norm = np.sqrt(norm)
+        norm[norm == 0] = 1
+        attack, attacky = attack / norm[:, None], attacky / norm
 
-        lastpoisxelem = poisxelem
-        curpoisxelem = poisxelem
+        poisx, poisy = self.linesearch(poisx, poisy, attack, attacky)
+        return poisx, poisy, outofbounds
 
-        lastyc = poisyelem
-        curyc = poisyelem
-        otherargs = None
+    def linesearch(self, poisx, poisy, attack, attacky):
+        """
+        Line search routine for poisoning points, each point being evaluated on the training data \
+        together with this point only. All the points are searched together.
 
-        w_1 = self.obj_comp(clf, lam, otherargs)
-        count = 0
+        Parameters
+        ----------
+        poisx : array-like, shape (n_poison_samples, n_features)
+            The poisoning input samples.
+        poisy : array-like, shape (n_poison_samples,)
+            The poisoning target values.
+        attack : array-like, shape (n_poison_samples, n_features)
+            The attack on the input samples.
+        attacky : array-like, shape (n_poison_samples,)
+            The attack on the target values.
+
+        Returns
+        -------
+        array-like, shape (n_poison_samples, n_features)
+            The poisoned input samples.
+        array-like, shape (n_poison_samples,)
+            The poisoned target values.
+        """
+        curx, cury = poisx.copy(), poisy.copy()
+        w_1 = self.obj_comp(self.learn_models(curx, cury))
+        active = np.arange(poisx.shape[0])
         eta = self.eta
 
-        while True:
-            if count > 0:
+        for count in range(1, 101):
+            if count > 1:
                 eta = self.beta * eta
-            count += 1
-            curpoisxelem = curpoisxelem + eta * attack
-            curpoisxelem = np.clip(curpoisxelem, 0, 1)
-            curx[-1] = curpoisxelem
-
-            if self.opty:
-                curyc = curyc + attacky * eta
-                curyc = min(1, max(0, curyc))
-                cury[-1] = curyc
-            clf1, lam1 = self.learn_model(curx, cury, clf1)
-            w_2 = self.obj_comp(clf1, lam1, otherargs)
-
-            if count >= 100 or abs(w_1 - w_2) < 1e-8:  # convergence
-                break
-            if w_2 - w_1 < 0:  # bad progress
-                curpoisxelem = lastpoisxelem
-                curyc = lastyc
-                break
 
-            lastpoisxelem = curpoisxelem
-            lastyc = curyc
-            w_1 = w_2
-            k += 1
+            newx = np.clip(curx[active] + eta * attack[active], 0, 1)
+            newy = np.clip(cury[active] + eta * attacky[active], 0, 1) if self.opty else cury[active]
+            w_2 = self.obj_comp(self.learn_models(newx, newy))
 
-        curpoisxelem = curpoisxelem.reshape(1, -1)
+            # bad progress keeps the last points, convergence keeps the new ones
+            converged = (np.abs(w_1[active] - w_2) < 1e-8) | (count >= 100)
+            keep = converged | (w_2 - w_1[active] >= 0)
+            curx[active[keep]] = newx[keep]
+            cury[active[keep]] = newy[keep]
+            w_1[active] = w_2
+
+            active = active[keep & ~converged]
+            if len(active) == 0:
+                break
 
         if self.colmap is not None:
-            for col in self.colmap:
-                vals = [(curpoisxelem[0, j], j) for j in self.colmap[col]]
-                topval, topcol = max(vals)
-                for j in self.colmap[col]:
-                    if j != topcol:
-                        curpoisxelem[0, j] = 0
-                if topval > 1 / (1 + len(self.colmap[col])):
-                    curpoisxelem[0, topcol] = 1
-                else:
-                    curpoisxelem[0, topcol] = 0
-        curx = np.delete(curx, curx.shape[0] - 1, axis=0)
-        curx = np.append(curx, curpoisxelem.reshape(1, -1), axis=0)
-        cury[-1] = curyc
-        clf1, lam1 = self.learn_model(curx, cury, None)
-
-        w_2 = self.obj_comp(clf1, lam1, otherargs)
-
-        return np.clip(curpoisxelem, 0, 1), curyc, w_2
+            for col in self.colmap.values():
+                vals = curx[:, col]
+                # ties are broken towards the last column
+                top = len(col) - 1 - np.argmax(vals[:, ::-1], axis=1)
+                topval = vals[np.arange(len(vals)), top]
+                vals[:] = 0
+                vals[np.arange(len(vals)), top] = topval > 1 / (1 + len(col))
+                curx[:, col] = vals
+
+        return np.clip(curx, 0, 1), cury
 
     def iter_progress(self, lastpoisx, lastpoisy, curpoisx, curpoisy):
         """
@@ -431,14 +476,6 @@ class GDPoisoner:
         float
             The previous objective value.
         """
-        x0 = np.concatenate((self.trnx, lastpoisx), axis=0)
-        y0 = np.concatenate([self.trny, lastpoisy])
-        clf0, lam0 = self.learn_model(x0, y0, None)
-        w_0 = self.obj_comp(clf0, lam0, None)
-
-        x1 = np.concatenate((self.trnx, curpoisx), axis=0)
-        y1 = np.concatenate([self.trny, curpoisy])
-        clf1, lam1 = self.learn_model(x1, y1, None)
-        w_1 = self.obj_comp(clf1, lam1, None)
-
+        w_0 = self.obj_comp(self.learn_model(lastpoisx, lastpoisy))[0]
+        w_1 = self.obj_comp(self.learn_model(curpoisx, curpoisy))[0]
         return w_1, w_0
@@ -96,6 +96,7 @@ def accuracy_degradation_profile(
     threshold_percentual: float = 0.95,
     above_percentual: float = 0.90,
     step_size: float = STEP_SIZE,
+    batch_size: int = 100,
 ):
     """
     Generates an accuracy degradation profile by iteratively reducing the size
@@ -124,8 +125,9 @@ def accuracy_degradation_profile(
         If not provided, the function will not perform neighbor-based operations.
 
     neighbor_estimator : Optional[Any], optional
-        An estimator implementing the neighbor search algorithm. If not provided,
-        the default `NearestNeighbors` from sklearn will be used.
+        An estimator implementing the neighbor search algorithm (`fit` and
+        `kneighbors`), for instance a tree based or approximate index. If not
+        provided, the default `NearestNeighbors` from sklearn will be used.
 
     baseline_accuracy : Optional[float], optional
         The baseline accuracy to be compared against. If not provided, it will
@@ -143,6 +145,10 @@ def accuracy_degradation_profile(
         The step size by which to reduce the test set size in each iteration. It
         determines the incremental reduction of the test set in each step.
 
+    batch_size : int, optional (default=100)
+        The number of test points whose neighbors are queried at once. Memory use is
+        proportional to `batch_size` times the largest neighborhood size.
+
     Returns
     -------
     pd.DataFrame
@@ -194,6 +200,9 @@ def accuracy_degradation_profile(
     if isinstance(y_test, pd.Series):
         y_test = y_test.to_numpy()
 
+    if isinstance(y_pred, pd.Series):
+        y_pred = y_pred.to_numpy()
+
     if baseline_accuracy is None:
         baseline_accuracy = accuracy_score(y_test, y_pred)
 
@@ -207,7 +216,9 @@ def accuracy_degradation_profile(
     neighbor_estimator.fit(X_test)
 
     # Calculate accuracies for varying test set sizes
-    results_df, set_size_list = _calculate_accuracies(X_test, y_test, y_pred, neighbor_estimator, step_size)
+    results_df, set_size_list = _calculate_accuracies(
+        X_test, y_test, y_pred, neighbor_estimator, step_size, batch_size=batch_size
+    )
 
     # Summarize the results
     results_summary_df = _summarize_results(results_df, baseline_accuracy, threshold_percentual, above_percentual)
@@ -312,6 +323,7 @@ def _calculate_accuracies(
     y_pred: np.ndarray,
     knn: Any,
     step_size: float,
+    batch_size: int = 100,
 ) -> tuple[pd.DataFrame, list[float]]:
     """
     Calculate accuracies by iteratively reducing the test set size and evaluating accuracy.
@@ -331,6 +343,8 @@ def _calculate_accuracies(
         The number of nearest neighbors to consider for each test set size.
     step_size : float
         The fraction by which to reduce the test set size at each step. Must be between 0 and 1.
+    batch_size : int
+        The number of test points whose neighbors are queried at once.
 
     Returns:
     -------
@@ -381,30 +395,23 @@ def _calculate_accuracies(
     n_neighbours_list = [int(full_set_size * i) for i in set_size_list]
     results = {size_factor: [] for size_factor in set_size_list}
 
-    # TODO: Get the neighbors for each test set size (is it possible to optimize like this?)
-    test_set_neighbours = []
-    for batch in batched(X_test):
-        batch_indexes = knn.kneighbors(batch, n_neighbors=full_set_size, return_distance=False)
-        test_set_neighbours.extend(batch_indexes)
-    test_set_neighbours = np.array(test_set_neighbours)
-    matches = y_test[test_set_neighbours] == y_pred[test_set_neighbours]
-
-    # Loop over different number of neighbors
-    for size_factor_index, n_neighbours in enumerate(n_neighbours_list):
-        if n_neighbours <= 0:
-            continue  # Skip invalid neighbor size
-
-        # Evaluate accuracy over each test set size
-        size_factor = set_size_list[size_factor_index]
-        # test_set_neighbours_2 = knn.kneighbors(X_test, n_neighbors=n_neighbours, return_distance=False)
-        # print(test_set_neighbours_2)
-
-        accuracy_list = np.mean(
-            matches[:, :n_neighbours], axis=1
-        )  # [accuracy_score(y_pred[neighbors[:n_neighbours]], y_test[neighbors[:n_neighbours]]) for neighbors in test_set_neighbours]
-        # accuracy_list = np.mean(matches[:,:n_neighbours], axis=1)
-
-        results[size_factor] = accuracy_list
+    # Only the largest neighborhood is queried, one batch of test points at a time, so that
+    # memory is bounded by batch_size x max(n_neighbours_list)
+    valid_sizes = [(set_size_list[i], n) for i, n in enumerate(n_neighbours_list) if n > 0]
+    if valid_sizes:
+        max_neighbours = max(n for _, n in valid_sizes)
+        positions = np.array([n for _, n in valid_sizes]) - 1
+        accuracies = []
+        for batch in batched(X_test, batch_size=batch_size):
+            batch_indexes = knn.kneighbors(batch, n_neighbors=max_neighbours, return_distance=False)
+            matches = y_test[batch_indexes] == y_pred[batch_indexes]
+
+            # accuracy over the nearest n neighbours for every n at once
+            accuracies.append(np.cumsum(matches, axis=1)[:, positions] / (positions + 1))
+        accuracies = np.concatenate(accuracies)
+
+        for i, (size_factor, _) in enumerate(valid_sizes):
+            results[size_factor] = accuracies[:, i]
 
     # Organize results into a DataFrame
     results_df = pd.DataFrame.from_dict(results, orient="columns")
@@ -110,81 +110,70 @@ def distrs_compute(tr_values, te_values, tr_labels, te_labels, num_bins=5, log_b
     return tr_distrs, te_distrs, all_bins
 
 
-def find_index(bins, value):
+def _bin_indices(bins, values):
     """
-    Determine the bin index for a given value.
+    Determine the bin index for each of the given values.
 
-    For a given list of bin edges and a value, this function returns the index
-    of the bin that includes the value. If the value is larger than the largest
-    bin edge, it assigns the last bin. If the value is smaller than the smallest
-    bin edge, it assigns the first bin.
+    For a given list of bin edges and values, this function returns the index
+    of the bin that includes each value. Values larger than the largest bin edge
+    are assigned to the last bin, and values smaller than the smallest bin edge
+    to the first bin.
 
     Parameters
     ----------
-    bins : list or array-like
-        A list or array of bin edges. The length of this list should be n+1 for n bins.
-    value : float
-        The value to be assigned to a bin.
+    bins : array-like
+        An array of bin edges. The length of this array should be n+1 for n bins.
+    values : array-like
+        The values to be assigned to a bin.
 
     Returns
     -------
-    int
-        The index of the bin that includes the value.
+    np.ndarray
+        The index of the bin that includes each value.
 
     Examples
     --------
-    >>> bins = [0, 1, 2, 3, 4]
-    >>> find_index(bins, 2.5)
-    2
-    >>> find_index(bins, -1)
-    0
-    >>> find_index(bins, 5)
-    3
+    >>> bins = np.array([0, 1, 2, 3, 4])
+    >>> _bin_indices(bins, np.array([2.5, -1, 5]))
+    array([2, 0, 3])
     """
-    # for given n bins (n+1 list) and one value, return which bin includes the value
-    if value >= bins[-1]:
-        return len(bins) - 2  # when value is larger than any bins, we assign the last bin
-    if value <= bins[0]:
-        return 0  # when value is smaller than any bins, we assign the first bin
-    return np.argwhere(bins <= value)[-1][0]
+    return np.clip(np.searchsorted(bins, values, side="right") - 1, 0, len(bins) - 2)
 
 
-def score_calculate(tr_distr, te_distr, ind):
+def _bin_scores(tr_distrs, te_distrs):
     """
-    Calculate the score based on training and testing distributions.
+    Calculate the score of every bin based on training and testing distributions.
 
-    The function computes the score as the ratio of the training distribution
-    value to the sum of training and testing distribution values at a given index.
-    If both distributions have zero probabilities at the given index, it searches
-    for the nearest bin with a non-zero probability.
+    The score of a bin is the ratio of the training distribution value to the sum of
+    training and testing distribution values. If both distributions have zero
+    probabilities in a bin, the score of the nearest bin with non-zero probability
+    is used (the lower bin on ties), found with a forward and a backward fill.
 
     Parameters
     ----------
-    tr_distr : list or numpy.ndarray
-        The training distribution values.
-    te_distr : list or numpy.ndarray
-        The testing distribution values.
-    ind : int
-        The index at which to calculate the score.
+    tr_distrs : np.ndarray
+        The training distributions, with shape (n_classes, n_bins).
+    te_distrs : np.ndarray
+        The testing distributions, with shape (n_classes, n_bins).
 
     Returns
     -------
-    float
-        The calculated score. If both distributions have zero probabilities at the
-        given index, the score is calculated from the nearest bin with non-zero
-        probability.
+    np.ndarray
+        The scores with shape (n_classes, n_bins). NaN for a class without any non-zero bin.
     """
-    if tr_distr[ind] + te_distr[ind] != 0:
-        return tr_distr[ind] / (tr_distr[ind] + te_distr[ind])
-    # when both distributions have 0 probabilities, we find the nearest bin with non-zero probability
-    for t_n in range(1, len(tr_distr)):
-        t_ind = ind - t_n
-        if t_ind >= 0 and tr_distr[t_ind] + te_distr[t_ind] != 0:
-            return tr_distr[t_ind] / (tr_distr[t_ind] + te_distr[t_ind])
-        t_ind = ind + t_n
-        if t_ind < len(tr_distr) and tr_distr[t_ind] + te_distr[t_ind] != 0:
-            return tr_distr[t_ind] / (tr_distr[t_ind] + te_distr[t_ind])
-    return None
+    totals = tr_distrs + te_distrs
+    nonzero = totals != 0
+    n_bins = totals.shape[1]
+    index = np.arange(n_bins)
+
+    lower = np.maximum.accumulate(np.where(nonzero, index, -1), axis=1)
+    upper = np.minimum.accumulate(np.where(nonzero, index, n_bins)[:, ::-1], axis=1)[:, ::-1]
+    use_lower = (lower >= 0) & ((upper == n_bins) | (index - lower <= upper - index))
+    nearest = np.where(use_lower, lower, np.minimum(upper, n_bins - 1))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = tr_distrs / totals
+    return np.take_along_axis(scores, nearest, axis=1)
 
 
 def _risk_score_compute(tr_distrs, te_distrs, all_bins, data_values, data_labels):
@@ -211,14 +200,14 @@ def _risk_score_compute(tr_distrs, te_distrs, all_bins, data_values, data_labels
     np.ndarray
         Array of computed privacy risk scores for the given data values.
     """
-    risk_score = []
-    for i in range(len(data_values)):
-        c_value, c_label = data_values[i], data_labels[i]
-        c_tr_distr, c_te_distr, c_bins = tr_distrs[c_label], te_distrs[c_label], all_bins[c_label]
-        c_index = find_index(c_bins, c_value)
-        c_score = score_calculate(c_tr_distr, c_te_distr, c_index)
-        risk_score.append(c_score)
-    return np.array(risk_score)
+    scores = _bin_scores(np.asarray(tr_distrs), np.asarray(te_distrs))
+    data_values, data_labels = np.asarray(data_values), np.asarray(data_labels)
+
+    risk_score = np.empty(len(data_values))
+    for label in np.unique(data_labels):
+        mask = data_labels == label
+        risk_score[mask] = scores[label, _bin_indices(all_bins[label], data_values[mask])]
+    return risk_score
 
 
 def _check_input_format(input_data):
@@ -6,35 +6,12 @@ import numpy as np
 from sklearn.preprocessing import LabelEncoder
 
 from holisticai.typing import ArrayLike
-from holisticai.utils.models.neighbors import KNeighborsClassifier
-
-try:
-    import jax.numpy as jnp
-    from jax.nn import one_hot
-except ImportError:
-    jnp = None
-    one_hot = None
-
 
 if TYPE_CHECKING:
     import pandas as pd
     from numpy.typing import ArrayLike
 
 
-def to_categorical(labels: np.ndarray | list[float]) -> np.ndarray:
-    """
-    Convert an array of labels to binary class matrix.
-
-    :param labels: An array of integer labels of shape `(nb_samples,)`.
-    :return: A binary matrix representation of `y` in the shape `(nb_samples, nb_classes)`.
-    """
-    labels = np.array(labels, dtype=int)
-    nb_classes = np.max(labels) + 1
-    categorical = np.zeros((labels.shape[0], nb_classes), dtype=np.float32)
-    categorical[np.arange(labels.shape[0]), np.squeeze(labels)] = 1
-    return categorical
-
-
 def transform_label_to_numerical_label(labels: np.ndarray, le: LabelEncoder = None) -> np.ndarray:
     return_encoder = False
     if labels.dtype.kind in {"U", "S", "O"}:  # Check if labels are strings
@@ -55,48 +32,37 @@ def transform_label_to_numerical_label(labels: np.ndarray, le: LabelEncoder = No
     return np.array(labels)
 
 
-def check_and_transform_label_format(labels: np.ndarray):
+# distances, neighbors order, indicators and values of a test sample against one training sample
+_BYTES_PER_PAIR = 64
+_MEMORY_BUDGET = 2**28
+
+
+def _shapley_values(x_test, y_test, x_train, y_train, n_train_samples, batch_size):
     """
-    Check label format and transform to one-hot-encoded labels if necessary
+    Recursive KNN-Shapley values of the training samples for every test sample (rows), in float32.
 
-    :param labels: An array of integer or string labels of shape `(nb_samples,)`, `(nb_samples, 1)` or `(nb_samples, nb_classes)`.
-    :return: Labels with shape `(nb_samples, nb_classes)` (one-hot) or `(nb_samples,)` (index).
+    The columns follow the training samples when the whole training set is used, and the sorted
+    indices of the nearest neighbors otherwise.
     """
-    if one_hot is None or jnp is None:
-        msg = "jax or jax.nn is not installed. Please install it with `pip install jax jaxlib`."
-        raise ImportError(msg)
-
-    labels = jnp.array(labels)
-    return_one_hot = True
-    labels_return = labels
-    binary_case = 2
-
-    if len(labels.shape) == binary_case and labels.shape[1] > 1:  # multi-class, one-hot encoded
-        if not return_one_hot:
-            labels_return = jnp.argmax(labels, axis=1)
-            labels_return = jnp.expand_dims(labels_return, axis=1)
-    elif len(labels.shape) == binary_case and labels.shape[1] == 1:
-        nb_classes = int(jnp.max(labels) + 1)
-        if nb_classes > binary_case:  # multi-class, index labels
-            labels_return = one_hot(labels, nb_classes) if return_one_hot else jnp.expand_dims(labels, axis=1)
-        elif nb_classes == binary_case:  # binary, index labels
-            if return_one_hot:
-                labels_return = one_hot(labels, nb_classes)
+    n_test = len(y_test)
+    values = np.empty((n_test, n_train_samples), dtype=np.float32)
+    for start in range(0, n_test, batch_size):
+        batch = slice(start, start + batch_size)
+        dists = np.abs(x_test[batch, None] - x_train[None, :])
+        neighbors = np.argsort(dists, axis=1, kind="stable")[:, :n_train_samples]
+        y_indicator = (y_train[neighbors] == y_test[batch, None]).astype(float)
+
+        # a single pass from the farthest to the nearest neighbor
+        d_phi_y = np.empty_like(y_indicator)
+        d_phi_y[:, -1] = y_indicator[:, -1] / n_train_samples
+        d_phi_y[:, :-1] = (y_indicator[:, :-1] - y_indicator[:, 1:]) / np.arange(1, n_train_samples)
+        phi_y = np.cumsum(d_phi_y[:, ::-1], axis=1)[:, ::-1]
+
+        if n_train_samples == len(y_train):
+            np.put_along_axis(values[batch], neighbors, phi_y, axis=1)
         else:
-            msg = (
-                "Shape of labels not recognised."
-                "Please provide labels in shape (nb_samples,) or (nb_samples, nb_classes)"
-            )
-            raise ValueError(msg)
-    elif len(labels.shape) == 1:  # index labels
-        labels_return = one_hot(labels, int(jnp.max(labels) + 1)) if return_one_hot else jnp.expand_dims(labels, axis=1)
-    else:
-        msg = (
-            "Shape of labels not recognised." "Please provide labels in shape (nb_samples,) or (nb_samples, nb_classes)"
-        )
-        raise ValueError(msg)
-
-    return labels_return
+            values[batch] = np.take_along_axis(phi_y, np.argsort(neighbors, axis=1), axis=1)
+    return values
 
 
 class ShaprScore:
@@ -109,54 +75,53 @@ class ShaprScore:
         y_test: ArrayLike,
         y_pred_train: ArrayLike,
         y_pred_test: ArrayLike,
-        batch_size=500,
+        batch_size=None,
         train_size=1.0,
         aggregated=True,
+        per_train_sample=False,
     ) -> np.ndarray | float:
-        if one_hot is None or jnp is None:
-            msg = "jax or jax.nn is not installed. Please install it with `pip install jax jaxlib`."
-            raise ImportError(msg)
-
+        """
+        Compute the SHAPr values.
+
+        The distances are computed between predicted labels, so the values of a test sample only
+        depend on its predicted and true labels. They are computed once for every distinct pair of
+        labels, in blocks of batch_size pairs, and then gathered or summed.
+
+        With aggregated=True the output is the full (n_test, n_train) float32 matrix, which takes
+        4 * n_test * n_train bytes (8GB for 20k test and 100k training samples). Use
+        per_train_sample=True to get the SHAPr score of every training sample (the sum of its values
+        over the test samples) in O(n_train) memory, or aggregated=False for the mean of these scores.
+        """
         y_train, le = transform_label_to_numerical_label(y_train)
         y_test = transform_label_to_numerical_label(y_test, le)
-        y_pred_train = transform_label_to_numerical_label(y_pred_train, le)
-        y_pred_test = transform_label_to_numerical_label(y_pred_test, le)
-
-        y_train = check_and_transform_label_format(y_train)
-        y_test = check_and_transform_label_format(y_test)
-
-        y_pred_train = y_pred_train.reshape([-1, 1])
-        y_pred_test = y_pred_test.reshape([-1, 1])
+        x_train = transform_label_to_numerical_label(y_pred_train, le).astype(float)
+        x_test = transform_label_to_numerical_label(y_pred_test, le).astype(float)
 
         n_train_samples = int(train_size * len(y_train))
-
-        knn = KNeighborsClassifier()
-        knn.fit(y_pred_train, y_train)
-        batch_generator = knn.kneighbors_batched(
-            y_pred_test, n_neighbors=n_train_samples, return_distance=False, batch_size=batch_size
+        n_test = len(y_test)
+        if batch_size is None:
+            batch_size = max(1, _MEMORY_BUDGET // (_BYTES_PER_PAIR * len(y_train)))
+
+        if not aggregated:
+            # the values of a test sample sum to the utility of the training set (efficiency of the Shapley
+            # values), i.e. whether its nearest neighbor has its label
+            correct = 0
+            for start in range(0, n_test, batch_size):
+                dists = np.abs(x_test[start : start + batch_size, None] - x_train[None, :])
+                correct += np.sum(y_train[np.argmin(dists, axis=1)] == y_test[start : start + batch_size])
+            return float(correct / n_test)
+
+        pairs, inverse, counts = np.unique(
+            np.column_stack([x_test, y_test]), axis=0, return_inverse=True, return_counts=True
         )
-        n_test = y_pred_test.shape[0]
-
-        results = []
-        for i, batch in enumerate(batch_generator):
-            n_indexes = jnp.array(batch)
-            n_indexes = n_indexes[:, ::-1]
-            sorted_indexes = jnp.argsort(n_indexes, axis=1)
-            b_y_test = y_test[i * batch_size : (i + 1) * batch_size]
-            sorted_y_train = y_train[n_indexes]
-            y_test_rep = jnp.repeat(b_y_test[:, jnp.newaxis], n_indexes.shape[1], axis=1)
-            y_indicator = jnp.all(sorted_y_train == y_test_rep, axis=2).astype(int)
-            d_phi_y = (y_indicator[:, 1:] - y_indicator[:, :-1]) / (n_train_samples - jnp.arange(1, n_train_samples))
-            d_phi_y = jnp.concatenate([y_indicator[:, 0:1] / n_train_samples, d_phi_y], axis=1)
-            phi_y = jnp.cumsum(d_phi_y, axis=1)
-            results_test_sorted = jnp.take_along_axis(phi_y, sorted_indexes, axis=1)
-            results.append(results_test_sorted)
-
-        results = jnp.concatenate(results, axis=0) * n_train_samples / n_test
-        if aggregated:
-            return np.array(results)
-        sum_per_sample = jnp.sum(results, axis=0)
-        return float(sum_per_sample.mean())
+        values = _shapley_values(
+            pairs[:, 0], pairs[:, 1].astype(y_train.dtype), x_train, y_train, n_train_samples, batch_size
+        )
+        if per_train_sample:
+            return (counts @ values.astype(float)) * (n_train_samples / n_test)
+        results = values[inverse.reshape(-1)]
+        results *= n_train_samples / n_test
+        return results
 
 
 def shapr_score(
@@ -164,8 +129,9 @@ def shapr_score(
     y_test: pd.Series,
     y_pred_train: pd.Series,
     y_pred_test: pd.Series,
-    batch_size=500,
+    batch_size=None,
     train_size=1.0,
+    per_train_sample=False,
 ):
     """
     Compute the SHAPr membership privacy risk metric [1]_ for the given classifier and training set.
@@ -185,15 +151,21 @@ def shapr_score(
     y_pred_test: pd.Series
         (nb_samples, nb_classes) or indices of shape (nb_samples,). Predicted values (class labels) of `x_test`, one-hot-encoded.
 
-    batch_size: int, default=100
-        The number of samples to process in each batch.
+    batch_size: int, default=None
+        The number of distinct (predicted, true) test label pairs to process in each batch. If None, it is chosen so that a batch takes about 256MB.
 
     train_size: float, default=1.0
         The fraction of the training set to use for the k-nearest neighbors search
 
+    per_train_sample: bool, default=False
+        If True, return the SHAPr score of every training sample (the sum of its values over the test samples), \
+        computed without the (n_test, n_train) matrix of values.
+
     Returns
     -------
-        float: The higher the value, the higher the privacy leakage for that sample. Any value above 0 should be considered a privacy leak.
+        np.ndarray: The values of every test (rows) and training (columns) sample, or the score of every training \
+        sample with per_train_sample=True. The higher the value, the higher the privacy leakage for that sample. \
+        Any value above 0 should be considered a privacy leak.
 
     Reference
     ---------
@@ -201,4 +173,4 @@ def shapr_score(
 
     """
     shapr = ShaprScore()
-    return shapr(y_train, y_test, y_pred_train, y_pred_test, batch_size, train_size)
+    return shapr(y_train, y_test, y_pred_train, y_pred_test, batch_size, train_size, per_train_sample=per_train_sample)
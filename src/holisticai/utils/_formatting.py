@@ -1,8 +1,12 @@
 # Base Imports
 import numpy as np
+from scipy import sparse
 
 from holisticai.utils._validation import _array_like_to_numpy
 
+# number of matrix elements processed at once in mat_to_binary
+_CHUNK_SIZE = 2**20
+
 
 def extract_columns(df, cols):
     """
@@ -59,51 +63,137 @@ def mat_to_binary(mat, top=None, thresh=0.5):
     Given a recommender matrix, it will coerce to the binary form
     (shown / not shown). This will be first according to the top k rule
     if top is not None. If top is None, it will threshold scores at
-    thresh (by default 0.5).
+    thresh (by default 0.5). Ties in the top k rule are broken in favour
+    of the items with the largest column index. Versions up to 1.0.14
+    used an unstable argsort, which picked arbitrary items among ties, so
+    the shown items can differ from those versions on tied scores.
 
     Parameters
     ----------
-    mat : numpy ndarray
+    mat : numpy ndarray or scipy sparse matrix
         Matrix with shape (num_users, num_items). A recommender
-        score (binary or soft pred) for each item.
+        score (binary or soft pred) for each item. For sparse
+        input only the stored entries are candidate items.
     top : int
         If not None, the top k scores that are shown to each user
+        (a positive integer)
     thresh : float
         Float in (0,1) range indicating threshold at which
         a given item is shown to user
 
     Returns
     -------
-    float
+    numpy ndarray or scipy sparse csr_matrix
         Binary matrix
     """
+    if sparse.issparse(mat):
+        return _sparse_mat_to_binary(mat, top=top, thresh=thresh)
+
+    mat = np.asarray(mat)
+
     # Case 1 : it's binary
-    if np.array_equal(mat, mat.astype(bool)):
+    if _is_binary(mat):
         return mat
 
+    n_users, n_items = mat.shape
+
     # Case 2 : top is not None
     if top is not None:
-        # preprocess
-        mat = np.nan_to_num(mat, copy=True, nan=-np.inf)
-        n_users, n_items = mat.shape
-        top_items = np.argsort(mat, axis=1)
+        _check_top(top)
+        n_mat = np.zeros((n_users, n_items))
+        for rows in _row_chunks(n_users, n_items):
+            n_mat[rows] = _top_k_mask(mat[rows], top)
 
-        # find indices of top items for each user
-        columns = top_items[:, -top:].flatten()
-        rows = np.arange(0, n_users).repeat(top, axis=0)
+    # Case 3 : the score is thresholded
+    else:
+        n_mat = np.zeros((n_users, n_items), dtype=int)
+        for rows in _row_chunks(n_users, n_items):
+            n_mat[rows] = mat[rows] >= thresh
+
+    return n_mat
+
+
+def _row_chunks(n_rows, n_cols, chunk_size=_CHUNK_SIZE):
+    """
+    Slices of consecutive rows holding about chunk_size elements each,
+    so that the temporaries of a row block have bounded memory.
+    """
+    step = max(1, chunk_size // max(n_cols, 1))
+    return [slice(i, i + step) for i in range(0, n_rows, step)]
+
+
+def _is_binary(mat):
+    """
+    Checks that all entries of a matrix are 0 or 1, one row block at
+    a time (nan is not binary).
+    """
+    return all(((mat[rows] == 0) | (mat[rows] == 1)).all() for rows in _row_chunks(*mat.shape))
 
-        # create
-        n_mat = np.zeros((n_users, n_items))
-        n_mat[rows, columns] = 1
 
-        # impute nans with 0
-        n_mat[np.isnan(n_mat)] = 0
+def _check_top(top):
+    """
+    Checks that the number of top scores shown to each user is positive.
+    """
+    if top <= 0:
+        msg = f"top must be a positive integer, got {top}."
+        raise ValueError(msg)
+
+
+def _top_k_mask(mat, top):
+    """
+    Boolean mask of the top scores of each row (nan scores come last).
+
+    The top-th largest score of each row is found with a partial sort.
+    Scores above it are all shown, and ties at that score are broken in
+    favour of the largest column indices, as a stable sort would (the
+    previous unstable argsort broke ties arbitrarily).
+    """
+    n_items = mat.shape[1]
+    top = min(top, n_items)
+
+    scores = np.nan_to_num(mat, nan=-np.inf)
+    kth = np.partition(scores, n_items - top, axis=1)[:, [n_items - top]]
+    greater = scores > kth
+    ties = scores == kth
+
+    # number of ties to keep in each row, taken from the right
+    n_ties = top - greater.sum(axis=1, keepdims=True)
+    ties_from_right = np.cumsum(ties[:, ::-1], axis=1)[:, ::-1]
+    return greater | (ties & (ties_from_right <= n_ties))
+
+
+def _sparse_mat_to_binary(mat, top=None, thresh=0.5):
+    """
+    Sparse version of mat_to_binary, working on the stored entries
+    only so that memory is proportional to the number of interactions.
+    Ties in the top k rule are broken as in the dense case (the item
+    with the largest column index wins).
+    """
+    mat = sparse.csr_matrix(mat)
+    n_users = mat.shape[0]
+
+    # Case 1 : it's binary
+    if np.all((mat.data == 0) | (mat.data == 1)):
+        return (mat != 0) * 1
+
+    rows = np.repeat(np.arange(n_users), np.diff(mat.indptr))
+
+    # Case 2 : top is not None
+    if top is not None:
+        _check_top(top)
+        # sort the entries of each row by score (then by column)
+        scores = np.nan_to_num(mat.data, nan=-np.inf)
+        order = np.lexsort((mat.indices, scores, rows))
+
+        # keep the last top entries of each row
+        keep = order[np.arange(len(order)) >= mat.indptr[1:][rows] - top]
 
     # Case 3 : the score is thresholded
     else:
-        n_mat = mat >= thresh
+        keep = np.flatnonzero(mat.data >= thresh)
 
-    return n_mat * 1
+    data = np.ones(len(keep), dtype=int)
+    return sparse.csr_matrix((data, (rows[keep], mat.indices[keep])), shape=mat.shape)
 
 
 def normalize_tensor(tensor):
@@ -117,14 +207,20 @@ def normalize_tensor(tensor):
 
     Parameters
     ----------
-    tensor : numpy ndarray
-        a numpy ndarray
+    tensor : numpy ndarray or scipy sparse matrix
+        a numpy ndarray (or a sparse matrix, in which case only the
+        stored entries are normalised)
 
     Returns
     -------
-    numpy ndarray
+    numpy ndarray or scipy sparse matrix
         Normalised tensor
     """
+    if sparse.issparse(tensor):
+        tensor = tensor.copy()
+        tensor.data = normalize_tensor(tensor.data)
+        return tensor
+
     a = np.nanmin(tensor)
     b = np.nanmax(tensor)
     return (tensor - a) / (b - a)
@@ -161,7 +257,7 @@ def slice_arrays_by_quantile(q, scores, arr_ls):
     return [[arr[i] for i in top_ind] for arr in arr_ls]
 
 
-def recommender_formatter(df, users_col, groups_col, items_col, scores_col, aggfunc="sum"):
+def recommender_formatter(df, users_col, groups_col, items_col, scores_col, aggfunc="sum", sparse_output=False):
     """
     Recommender formatter
 
@@ -186,12 +282,20 @@ def recommender_formatter(df, users_col, groups_col, items_col, scores_col, aggf
         (predicted or true) of user on given item
     aggfunc : 'sum' or 'mean'
         the aggregation function for duplicate index, column pairs
+    sparse_output : bool
+        If True, the scores are returned as a scipy sparse csr_matrix
+        (rows and columns follow the sorted user and item id's) whose
+        stored entries are the observed scores. Memory is then
+        proportional to the number of interactions.
 
     Returns
     -------
     list of numpy ndarray
         df_pivot, p_attr
     """
+    if sparse_output:
+        return _sparse_recommender_formatter(df, users_col, groups_col, items_col, scores_col, aggfunc=aggfunc)
+
     # pivot dataframe on users and items
     df_pivot = df.pivot_table(index=users_col, columns=items_col, values=scores_col, aggfunc=aggfunc)
     # we need to get group info for each user
@@ -199,3 +303,33 @@ def recommender_formatter(df, users_col, groups_col, items_col, scores_col, aggf
     p_attr = np.array(df_pivot.index.map(user_to_group))
 
     return df_pivot, p_attr
+
+
+def _sparse_recommender_formatter(df, users_col, groups_col, items_col, scores_col, aggfunc="sum"):
+    """
+    Sparse version of recommender_formatter: the pivoted scores are
+    built as a csr_matrix straight from the (user, item) codes.
+    """
+    if aggfunc not in ["sum", "mean"]:
+        msg = "aggfunc has to be one of : sum, mean"
+        raise ValueError(msg)
+
+    # missing values are not pivoted
+    df = df.dropna(subset=[users_col, items_col, scores_col])
+    users, user_codes = np.unique(df[users_col].to_numpy(), return_inverse=True)
+    items, item_codes = np.unique(df[items_col].to_numpy(), return_inverse=True)
+    shape = (len(users), len(items))
+
+    # duplicate (user, item) pairs are summed when converting to csr
+    scores = df[scores_col].to_numpy(dtype=float)
+    mat = sparse.csr_matrix((scores, (user_codes, item_codes)), shape=shape)
+    if aggfunc == "mean":
+        counts = sparse.csr_matrix((np.ones(len(scores)), (user_codes, item_codes)), shape=shape)
+        mat.data /= counts.data
+
+    # we need to get group info for each user (last one seen)
+    groups = df[groups_col].to_numpy()
+    p_attr = np.empty(len(users), dtype=groups.dtype)
+    p_attr[user_codes] = groups
+
+    return mat, p_attr
@@ -1,12 +1,77 @@
 import numpy as np
-
-# scikit
-from sklearn.metrics import f1_score, precision_score, recall_score
+from scipy import sparse
 
 # Formatting
 from holisticai.utils import mat_to_binary
 
 
+def _axis_sum(mat, axis):
+    """
+    Sum of a dense or sparse matrix along an axis, as a flat numpy array
+    """
+    return np.asarray(mat.sum(axis=axis)).ravel()
+
+
+def _common_entries(mat_pred, mat_true):
+    """
+    Values of two sparse csr matrices on the entries stored in both
+    (the sparse counterpart of the non null scores of dense matrices)
+    """
+    n_items = mat_pred.shape[1]
+    pred, true = mat_pred.tocoo(), mat_true.tocoo()
+    keys_pred = pred.row.astype(np.int64) * n_items + pred.col
+    keys_true = true.row.astype(np.int64) * n_items + true.col
+    _, idx_pred, idx_true = np.intersect1d(keys_pred, keys_true, assume_unique=True, return_indices=True)
+    return pred.data[idx_pred], true.data[idx_true]
+
+
+def _user_hit_counts(mat_pred, mat_true, top=None, thresh=0.5):
+    """
+    User hit counts (recommender)
+
+    Description
+    ----------
+    Makes both matrices binary and counts, for each user, the
+    recommended items that are relevant (true positives), the
+    recommended items and the relevant items.
+
+    Parameters
+    ----------
+    mat_pred : numpy ndarray or scipy sparse csr_matrix
+        Matrix with shape (num_users, num_items). A recommender
+        score (binary or soft pred) for each item.
+    mat_true : numpy ndarray or scipy sparse csr_matrix
+        Matrix with shape (num_users, num_items). A target score
+        (binary or soft pred) for each item.
+    top : int
+        If not None, the top k scores that are shown to each user
+    thresh : float
+        Float in (0,1) range indicating threshold at which
+        a given item is shown to user
+
+    Returns
+    -------
+    tuple of numpy arrays
+        (true positives, predicted positives, true positives + false negatives)
+        each with shape (num_users,)
+    """
+    binary_mat_pred = mat_to_binary(mat_pred, top=top, thresh=thresh) != 0
+    binary_mat_true = mat_to_binary(mat_true, top=top, thresh=thresh) != 0
+    if sparse.issparse(binary_mat_pred):
+        hits = binary_mat_pred.multiply(binary_mat_true)
+    else:
+        hits = binary_mat_pred & binary_mat_true
+    return _axis_sum(hits, 1), _axis_sum(binary_mat_pred, 1), _axis_sum(binary_mat_true, 1)
+
+
+def _safe_divide(num, den):
+    """
+    Elementwise division where a zero denominator gives 0 (as
+    sklearn's zero_division default)
+    """
+    return np.divide(num, den, out=np.zeros(len(num)), where=den > 0)
+
+
 def avg_precision(mat_pred, mat_true, top=None, thresh=0.5):
     """
     Average Precision (recommender)
@@ -18,10 +83,10 @@ def avg_precision(mat_pred, mat_true, top=None, thresh=0.5):
 
     Parameters
     ----------
-    mat_pred : numpy ndarray
+    mat_pred : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each item.
-    mat_true : numpy ndarray
+    mat_true : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each item.
     top : int
@@ -35,18 +100,9 @@ def avg_precision(mat_pred, mat_true, top=None, thresh=0.5):
     float
         Average precision
     """
-    # Make matrices binary
-    binary_mat_pred = mat_to_binary(mat_pred, top=top, thresh=thresh)
-    binary_mat_true = mat_to_binary(mat_true, top=top, thresh=thresh)
-
-    num_users, _ = mat_pred.shape
-    vals = np.zeros((num_users,))
-
-    # Sum accuracy over users
-    for u in range(num_users):
-        pred = binary_mat_pred[u]
-        true = binary_mat_true[u]
-        vals[u] = precision_score(true, pred)
+    # Count hits of all users at once
+    tp, n_pred, n_true = _user_hit_counts(mat_pred, mat_true, top=top, thresh=thresh)
+    vals = _safe_divide(tp, n_pred)
 
     # Average
     return np.mean(vals)
@@ -63,10 +119,10 @@ def avg_recall(mat_pred, mat_true, top=None, thresh=0.5):
 
     Parameters
     ----------
-    mat_pred : numpy ndarray
+    mat_pred : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each item.
-    mat_true : numpy ndarray
+    mat_true : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each item.
     top : int
@@ -80,18 +136,9 @@ def avg_recall(mat_pred, mat_true, top=None, thresh=0.5):
     float
         Average recall
     """
-    # Make matrices binary
-    binary_mat_pred = mat_to_binary(mat_pred, top=top, thresh=thresh)
-    binary_mat_true = mat_to_binary(mat_true, top=top, thresh=thresh)
-
-    num_users, _ = mat_pred.shape
-    vals = np.zeros((num_users,))
-
-    # Sum accuracy over users
-    for u in range(num_users):
-        pred = binary_mat_pred[u]
-        true = binary_mat_true[u]
-        vals[u] = recall_score(true, pred)
+    # Count hits of all users at once
+    tp, n_pred, n_true = _user_hit_counts(mat_pred, mat_true, top=top, thresh=thresh)
+    vals = _safe_divide(tp, n_true)
 
     # Average
     return np.mean(vals)
@@ -108,10 +155,10 @@ def avg_f1(mat_pred, mat_true, top=None, thresh=0.5):
 
     Parameters
     ----------
-    mat_pred : numpy ndarray
+    mat_pred : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each item.
-    mat_true : numpy ndarray
+    mat_true : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each item.
     top : int
@@ -125,18 +172,9 @@ def avg_f1(mat_pred, mat_true, top=None, thresh=0.5):
     float
         Average f1
     """
-    # Make matrices binary
-    binary_mat_pred = mat_to_binary(mat_pred, top=top, thresh=thresh)
-    binary_mat_true = mat_to_binary(mat_true, top=top, thresh=thresh)
-
-    num_users, _ = mat_pred.shape
-    vals = np.zeros((num_users,))
-
-    # Sum accuracy over users
-    for u in range(num_users):
-        pred = binary_mat_pred[u]
-        true = binary_mat_true[u]
-        vals[u] = f1_score(true, pred)
+    # Count hits of all users at once
+    tp, n_pred, n_true = _user_hit_counts(mat_pred, mat_true, top=top, thresh=thresh)
+    vals = _safe_divide(2 * tp, n_pred + n_true)
 
     # Average
     return np.mean(vals)
@@ -153,10 +191,10 @@ def recommender_rmse(mat_pred, mat_true):
 
     Parameters
     ----------
-    mat_pred : numpy ndarray
+    mat_pred : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each item.
-    mat_true : numpy ndarray
+    mat_true : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each item.
 
@@ -165,6 +203,8 @@ def recommender_rmse(mat_pred, mat_true):
     float
         Recommender RMSE
     """
+    if sparse.issparse(mat_pred):
+        mat_pred, mat_true = _common_entries(mat_pred, mat_true)
     se_diff = (mat_pred - mat_true) ** 2
     return np.sqrt(np.nanmean(se_diff))
 
@@ -180,10 +220,10 @@ def recommender_mae(mat_pred, mat_true):
 
     Parameters
     ----------
-    mat_pred : numpy ndarray
+    mat_pred : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A recommender
         score (binary or soft pred) for each item.
-    mat_true : numpy ndarray
+    mat_true : numpy ndarray or scipy sparse csr_matrix
         Matrix with shape (num_users, num_items). A target score
         (binary or soft pred) for each item.
 
@@ -192,6 +232,8 @@ def recommender_mae(mat_pred, mat_true):
     float
         Recommender MAE
     """
+    if sparse.issparse(mat_pred):
+        mat_pred, mat_true = _common_entries(mat_pred, mat_true)
     abs_diff = np.abs(mat_pred - mat_true)
     return np.nanmean(abs_diff)
 
@@ -2,6 +2,7 @@ import logging
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 logger = logging.getLogger(__name__)
 
@@ -264,6 +265,32 @@ def _matrix_like_to_numpy(arr, name=""):
         raise TypeError(msg) from e
 
 
+def _sparse_matrix_to_csr(arr):
+    """
+    Coerce sparse input to csr
+
+    Description
+    ----------
+    This function converts a scipy sparse matrix to
+    csr format with sorted indices and no duplicate
+    entries.
+
+    Parameters
+    ----------
+    arr : scipy sparse matrix
+        Input to coerce
+
+    Returns
+    -------
+    scipy sparse csr_matrix
+    """
+    out = sparse.csr_matrix(arr)
+    if not out.has_canonical_format:
+        out = out.copy()
+        out.sum_duplicates()
+    return out
+
+
 def _matrix_like_to_dataframe(arr, name=""):  # noqa: ARG001
     num_dimensions = 2
     try:
@@ -505,10 +532,19 @@ def _recommender_checks(
         _check_same_shape([group_a, group_b], names="group_a, group_b")
 
     if mat_pred is not None:
-        mat_pred = _matrix_like_to_numpy(mat_pred, name="mat_pred")
+        if sparse.issparse(mat_pred):
+            mat_pred = _sparse_matrix_to_csr(mat_pred)
+        else:
+            mat_pred = _matrix_like_to_numpy(mat_pred, name="mat_pred")
 
     if mat_true is not None:
-        mat_true = _matrix_like_to_numpy(mat_true, name="mat_true")
+        if sparse.issparse(mat_true):
+            mat_true = _sparse_matrix_to_csr(mat_true)
+        else:
+            mat_true = _matrix_like_to_numpy(mat_true, name="mat_true")
+        if sparse.issparse(mat_pred) != sparse.issparse(mat_true):
+            msg = "mat_pred and mat_true have to be both sparse or both dense"
+            raise TypeError(msg)
         _check_same_shape([mat_pred, mat_true], names="mat_pred, mat_true")
 
     if top is not None and not isinstance(top, int):
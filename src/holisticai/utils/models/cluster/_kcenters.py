@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from holisticai.utils.models.cluster._utils import distance
+import numpy as np
 from numpy.random import RandomState
 
 
@@ -14,33 +14,46 @@ class KCenters:
 
     def fit(self, data):
         """
-        Performs the k-centers algorithm.
+        Performs the k-centers algorithm (farthest-first traversal).
+
+        The distance of every point to its closest center and the index of that center are kept
+        and updated with the distances to each new center, in O(n k) time and O(n) memory.
 
         Args:
                 data (list) : Points in the dataset
         """
 
-        self.data = data
-        self.centers = [int(self.random_state.randint(0, len(self.data), 1))]
+        self.data = np.asarray(data, dtype=float)
+        n = len(self.data)
+        self.centers = [int(self.random_state.randint(0, n, 1)[0])]
         self.costs = []
 
+        closest_center = np.full(n, self.centers[0])
+        closest_distance = self._distances_to(self.centers[0])
         while True:
-            # Remaining points in the data set
-            rem_points = list(set(range(len(self.data))) - set(self.centers))
-
             # Finding the point which has the closest center most far-off
-            point_center = [(i, min([distance(self.data[i], self.data[j]) for j in self.centers])) for i in rem_points]
-            point_center = sorted(point_center, key=lambda x: x[1], reverse=True)
+            candidate_distance = closest_distance.copy()
+            candidate_distance[self.centers] = -np.inf
+            farthest = int(np.argmax(candidate_distance))
 
-            self.costs.append(point_center[0][1])
+            self.costs.append(closest_distance[farthest])
             if len(self.centers) < self.k:
-                self.centers.append(point_center[0][0])
+                self.centers.append(farthest)
+                distance = self._distances_to(farthest)
+                closer = distance < closest_distance
+                closest_center[closer] = farthest
+                closest_distance[closer] = distance[closer]
             else:
                 break
 
-        self.cluster_centers_ = [self.data[j] for j in self.centers]
+        self.closest_center_ = closest_center
+        self.cluster_centers_ = self.data[self.centers]
         self.labels = self.assign()
 
+    def _distances_to(self, center):
+        """Euclidean distances from every point to the given center."""
+        return np.linalg.norm(self.data - self.data[center], axis=1)
+
     def assign(self):
         """
         Assigning every point in the dataset to the closest center.
@@ -48,14 +61,4 @@ class KCenters:
         Returns:
                 mapping (list) : tuples of the form (point, center)
         """
-        return [
-            (
-                i,
-                sorted(
-                    [(j, distance(self.data[i], self.data[j])) for j in self.centers],
-                    key=lambda x: x[1],
-                    reverse=False,
-                )[0][0],
-            )
-            for i in range(len(self.data))
-        ]
+        return list(enumerate(self.closest_center_.tolist()))
@@ -1,8 +1,10 @@
+from __future__ import annotations
+
 import logging
 import sys
-import time
 
 import numpy as np
+from joblib import Parallel, delayed
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,9 @@ class GeneticAlgorithm:
     Genetic Algorithm (Elitist version)
     Implementation of elitist genetic algorithm for solving problems with
     continuous, integers, or mixed variables.
+
+    The population is held as a 2D array (one individual per row), the crossover
+    and mutation operators work on all the offspring at once with masks.
     """
 
     def __init__(
@@ -35,6 +40,8 @@ class GeneticAlgorithm:
         variable_type_mixed: np.ndarray = None,
         algorithm_parameters: GAHiperparameters = None,
         verbose: int = 0,
+        batch_function: bool = False,
+        n_jobs: int | None = None,
     ):
         """
         Parameters
@@ -75,6 +82,15 @@ class GeneticAlgorithm:
         verbose: int
         If >0, log information
 
+        batch_function: bool
+        If True, the function is evaluated on a whole population at once: it takes
+        an array of shape (population size, dimension) and returns one objective
+        value per row.
+
+        n_jobs: int
+        Number of threads used to evaluate the individuals when the function is not
+        batched. None or 1 evaluates them one by one.
+
         """
         self.verbose = verbose
 
@@ -82,6 +98,8 @@ class GeneticAlgorithm:
         assert callable(function), "function must be callable"
         self.f = function
         self.dim = int(dimension)
+        self.batch_function = batch_function
+        self.n_jobs = n_jobs
 
         # input variable type
         if variable_type not in ("bool", "int", "real"):
@@ -195,27 +213,14 @@ class GeneticAlgorithm:
         self.integers = np.where(self.var_type == "int")
         self.reals = np.where(self.var_type == "real")
 
-        pop = np.array([np.zeros(self.dim + 1)] * self.pop_s)
-        solo = np.zeros(self.dim + 1)
-        var = np.zeros(self.dim)
-
-        for p in range(self.pop_s):
-            for i in self.integers[0]:
-                var[i] = np.random.randint(self.var_bound[i][0], self.var_bound[i][1] + 1)
-                solo[i] = var[i].copy()
-            for i in self.reals[0]:
-                var[i] = self.var_bound[i][0] + np.random.random() * (self.var_bound[i][1] - self.var_bound[i][0])
-                solo[i] = var[i].copy()
-
-            obj = self.sim(var)
-            solo[self.dim] = obj
-            pop[p] = solo.copy()
+        pop = self._random_population(self.pop_s)
+        fitness = self._evaluate(pop)
 
         # Report
         self.report = []
-        self.test_obj = obj
-        self.best_variable = var.copy()
-        self.best_function = obj
+        self.test_obj = fitness[-1]
+        self.best_variable = pop[-1].copy()
+        self.best_function = fitness[-1]
 
         t = 1
         counter = 0
@@ -224,98 +229,66 @@ class GeneticAlgorithm:
                 logger.info(f"Generation {t}/{self.iterate}")
 
             # Sort
-            pop = pop[pop[:, self.dim].argsort()]
+            order = fitness.argsort()
+            pop, fitness = pop[order], fitness[order]
 
-            if pop[0, self.dim] < self.best_function:
+            if fitness[0] < self.best_function:
                 counter = 0
-                self.best_function = pop[0, self.dim].copy()
-                self.best_variable = pop[0, : self.dim].copy()
+                self.best_function = fitness[0]
+                self.best_variable = pop[0].copy()
                 logger.info(f"Cost: {self.best_function:.4f}")
             else:
                 counter += 1
             # Report
-            self.report.append(pop[0, self.dim])
+            self.report.append(fitness[0])
 
             # Normalizing objective function
-            normobj = np.zeros(self.pop_s)
+            normobj = fitness + abs(fitness[0]) if fitness[0] < 0 else fitness.copy()
+            normobj = np.amax(normobj) - normobj + 1
 
-            minobj = pop[0, self.dim]
-            normobj = pop[:, self.dim] + abs(minobj) if minobj < 0 else pop[:, self.dim].copy()
+            # Calculate probability
+            cumprob = np.cumsum(normobj / np.sum(normobj))
 
-            maxnorm = np.amax(normobj)
-            normobj = maxnorm - normobj + 1
+            # Select parents: the elite and a roulette wheel selection of the others
+            roulette = np.searchsorted(cumprob, np.random.random(self.par_s - self.num_elit))
+            selected = np.concatenate([np.arange(self.num_elit), np.minimum(roulette, self.pop_s - 1)])
+            par, par_fitness = pop[selected], fitness[selected]
 
-            # Calculate probability
-            sum_normobj = np.sum(normobj)
-            prob = np.zeros(self.pop_s)
-            prob = normobj / sum_normobj
-            cumprob = np.cumsum(prob)
-
-            # Select parents
-            par = np.array([np.zeros(self.dim + 1)] * self.par_s)
-
-            for k in range(self.num_elit):
-                par[k] = pop[k].copy()
-            for k in range(self.num_elit, self.par_s):
-                index = np.searchsorted(cumprob, np.random.random())
-                par[k] = pop[index].copy()
-
-            ef_par_list = np.array([False] * self.par_s)
-            par_count = 0
-            while par_count == 0:
-                for k in range(self.par_s):
-                    if np.random.random() <= self.prob_cross:
-                        ef_par_list[k] = True
-                        par_count += 1
-
-            ef_par = par[ef_par_list].copy()
-
-            # New generation
-            pop = np.array([np.zeros(self.dim + 1)] * self.pop_s)
-
-            for k in range(self.par_s):
-                pop[k] = par[k].copy()
-
-            for k in range(self.par_s, self.pop_s, 2):
-                r1 = np.random.randint(0, par_count)
-                r2 = np.random.randint(0, par_count)
-                pvar1 = ef_par[r1, : self.dim].copy()
-                pvar2 = ef_par[r2, : self.dim].copy()
-
-                ch = self.cross(pvar1, pvar2, self.c_type)
-                ch1 = ch[0].copy()
-                ch2 = ch[1].copy()
-
-                ch1 = self.mut(ch1)
-                ch2 = self.mutmidle(ch2, pvar1, pvar2)
-                solo[: self.dim] = ch1.copy()
-                obj = self.sim(ch1)
-                solo[self.dim] = obj
-                pop[k] = solo.copy()
-                solo[: self.dim] = ch2.copy()
-                obj = self.sim(ch2)
-                solo[self.dim] = obj
-                pop[k + 1] = solo.copy()
+            ef_par_list = np.zeros(self.par_s, dtype=bool)
+            while not ef_par_list.any():
+                ef_par_list = np.random.random(self.par_s) <= self.prob_cross
+            ef_par = par[ef_par_list]
+
+            # New generation: the parents and the offspring of random pairs of crossover parents
+            num_children = self.pop_s - self.par_s
+            num_pairs = (num_children + 1) // 2
+            pvar1 = ef_par[np.random.randint(0, len(ef_par), num_pairs)]
+            pvar2 = ef_par[np.random.randint(0, len(ef_par), num_pairs)]
+
+            ch1, ch2 = self.cross(pvar1, pvar2, self.c_type)
+            ch1 = self.mut(ch1)
+            ch2 = self.mutmidle(ch2, pvar1, pvar2)
+            children = np.stack([ch1, ch2], axis=1).reshape(-1, self.dim)[:num_children]
+
+            pop = np.concatenate([par, children])
+            fitness = np.concatenate([par_fitness, self._evaluate(children)])
 
             t += 1
-            if counter > self.mniwi:
-                pop = pop[pop[:, self.dim].argsort()]
-                if pop[0, self.dim] >= self.best_function:
-                    t = self.iterate
-                    time.sleep(2)
-                    t += 1
-                    self.stop_mniwi = True
+            if counter > self.mniwi and np.amin(fitness) >= self.best_function:
+                t = self.iterate + 1
+                self.stop_mniwi = True
 
         # Sort
-        pop = pop[pop[:, self.dim].argsort()]
+        order = fitness.argsort()
+        pop, fitness = pop[order], fitness[order]
 
-        if pop[0, self.dim] < self.best_function:
-            self.best_function = pop[0, self.dim].copy()
-            self.best_variable = pop[0, : self.dim].copy()
+        if fitness[0] < self.best_function:
+            self.best_function = fitness[0]
+            self.best_variable = pop[0].copy()
             logger.info(f"Cost: {self.best_function:.4f}")
 
         # Report
-        self.report.append(pop[0, self.dim])
+        self.report.append(fitness[0])
 
         self.output_dict = {
             "variable": self.best_variable,
@@ -333,68 +306,69 @@ class GeneticAlgorithm:
                 "\nWarning: GA is terminated due to the" " maximum number of iterations without improvement was met!"
             )
 
+    def _random_population(self, size):
+        """Draw individuals (rows) uniformly within the variable boundaries."""
+        low, high = self.var_bound[:, 0], self.var_bound[:, 1]
+        pop = low + np.random.random((size, self.dim)) * (high - low)
+        integers = self.integers[0]
+        pop[:, integers] = np.random.randint(low[integers], high[integers] + 1, size=(size, len(integers)))
+        return pop
+
     def cross(self, x, y, c_type):
-        ofs1 = x.copy()
-        ofs2 = y.copy()
+        """Cross the parents x and y (one pair per row), return the two offspring arrays."""
+        genes = np.arange(self.dim)
 
         if c_type == "one_point":
-            ran = np.random.randint(0, self.dim)
-            for i in range(ran):
-                ofs1[i] = y[i].copy()
-                ofs2[i] = x[i].copy()
+            ran = np.random.randint(0, self.dim, (len(x), 1))
+            swap = genes < ran
 
-        if c_type == "two_point":
-            ran1 = np.random.randint(0, self.dim)
+        elif c_type == "two_point":
+            ran1 = np.random.randint(0, self.dim, (len(x), 1))
             ran2 = np.random.randint(ran1, self.dim)
+            swap = (genes >= ran1) & (genes < ran2)
 
-            for i in range(ran1, ran2):
-                ofs1[i] = y[i].copy()
-                ofs2[i] = x[i].copy()
-
-        if c_type == "uniform":
+        else:
             threshold = 0.5
-            for i in range(self.dim):
-                ran = np.random.random()
-                if ran < threshold:
-                    ofs1[i] = y[i].copy()
-                    ofs2[i] = x[i].copy()
+            swap = np.random.random(x.shape) < threshold
 
-        return np.array([ofs1, ofs2])
+        return np.where(swap, y, x), np.where(swap, x, y)
 
     def mut(self, x):
-        for i in self.integers[0]:
-            ran = np.random.random()
-            if ran < self.prob_mut:
-                x[i] = np.random.randint(self.var_bound[i][0], self.var_bound[i][1] + 1)
-
-        for i in self.reals[0]:
-            ran = np.random.random()
-            if ran < self.prob_mut:
-                x[i] = self.var_bound[i][0] + np.random.random() * (self.var_bound[i][1] - self.var_bound[i][0])
-
-        return x
+        """Mutate the genes of the individuals (rows) to random values within the boundaries."""
+        mutate = np.random.random(x.shape) < self.prob_mut
+        return np.where(mutate, self._random_population(len(x)), x)
 
     def mutmidle(self, x, p1, p2):
-        for i in self.integers[0]:
-            ran = np.random.random()
-            if ran < self.prob_mut:
-                if p1[i] < p2[i]:
-                    x[i] = np.random.randint(p1[i], p2[i])
-                elif p1[i] > p2[i]:
-                    x[i] = np.random.randint(p2[i], p1[i])
-                else:
-                    x[i] = np.random.randint(self.var_bound[i][0], self.var_bound[i][1] + 1)
-
-        for i in self.reals[0]:
-            ran = np.random.random()
-            if ran < self.prob_mut:
-                if p1[i] < p2[i]:
-                    x[i] = p1[i] + np.random.random() * (p2[i] - p1[i])
-                elif p1[i] > p2[i]:
-                    x[i] = p2[i] + np.random.random() * (p1[i] - p2[i])
-                else:
-                    x[i] = self.var_bound[i][0] + np.random.random() * (self.var_bound[i][1] - self.var_bound[i][0])
-        return x
+        """Mutate the genes of the individuals (rows) to random values between the genes of their parents."""
+        mutate = np.random.random(x.shape) < self.prob_mut
+        low, high = np.minimum(p1, p2), np.maximum(p1, p2)
+        values = low + np.random.random(x.shape) * (high - low)
+
+        integers = self.integers[0]
+        if len(integers) > 0:
+            # integer genes are drawn in [low, high), or in the boundaries if the parents agree
+            low_int, high_int = low[:, integers].astype(np.int64), high[:, integers].astype(np.int64)
+            same = low_int == high_int
+            low_int = np.where(same, self.var_bound[integers, 0], low_int)
+            high_int = np.where(same, self.var_bound[integers, 1] + 1, high_int)
+            values[:, integers] = np.random.randint(low_int, high_int)
+
+        # real genes are drawn between the parents, or in the boundaries if the parents agree
+        reals = self.reals[0]
+        same = p1[:, reals] == p2[:, reals]
+        values[:, reals] = np.where(same, self._random_population(len(x))[:, reals], values[:, reals])
+
+        return np.where(mutate, values, x)
+
+    def _evaluate(self, pop):
+        """Return the objective value of every individual (row) of the population."""
+        if self.batch_function:
+            return np.asarray(self.f(pop.copy()), dtype=float).reshape(len(pop))
+        if self.n_jobs in (None, 1):
+            return np.array([self.sim(x) for x in pop], dtype=float)
+        return np.array(
+            Parallel(n_jobs=self.n_jobs, prefer="threads")(delayed(self.f)(x.copy()) for x in pop), dtype=float
+        )
 
     def evaluate(self):
         return self.f(self.temp)
@@ -8,6 +8,7 @@ from holisticai.bias.metrics import (
     abroca,
     accuracy_diff,
     average_odds_diff,
+    classification_bias_metrics,
     cohen_d,
     disparate_impact,
     equal_opportunity_diff,
@@ -124,3 +125,13 @@ def test_accuracy_diff():
     a = accuracy_diff(group_a, group_b, y_pred, y_true)
     b = 3 / 4 - 5 / 6
     assert_approx_equal(a, b)
+
+
+def test_classification_bias_metrics():
+    """test classification_bias_metrics matches the individual metrics"""
+    df = classification_bias_metrics(group_a, group_b, y_pred, y_true, metric_type="group")
+    assert_approx_equal(df.loc["Statistical Parity", "Value"], statistical_parity(group_a, group_b, y_pred))
+    assert_approx_equal(df.loc["Cohen D", "Value"], cohen_d(group_a, group_b, y_pred))
+    assert_approx_equal(df.loc["2SD Rule", "Value"], z_test_diff(group_a, group_b, y_pred))
+    assert_approx_equal(df.loc["Average Odds Difference", "Value"], average_odds_diff(group_a, group_b, y_pred, y_true))
+    assert_approx_equal(df.loc["Accuracy Difference", "Value"], accuracy_diff(group_a, group_b, y_pred, y_true))
@@ -8,6 +8,7 @@ from holisticai.bias.metrics import (
     confusion_tensor,
     frequency_matrix,
     multiclass_average_odds,
+    multiclass_bias_metrics,
     multiclass_equality_of_opp,
     multiclass_statistical_parity,
     multiclass_true_rates,
@@ -44,6 +45,9 @@ def test_confusion_tensor():
     )
     assert_array_almost_equal(a, b)
 
+    a = confusion_tensor(p, y_pred_mc, y_true_mc, groups=["C", "B", "A"], classes=[2, 1, 0], as_tensor=True)
+    assert_array_almost_equal(a, b[::-1, ::-1, ::-1])
+
 
 def test_frequency_matrix():
     """test frequency_matrix"""
@@ -123,3 +127,20 @@ def test_multiclass_statistical_parity():
     a = multiclass_statistical_parity(p, y_pred_mc)
     b = 2 * 3 / 18
     assert_array_almost_equal(a, b)
+
+
+def test_multiclass_bias_metrics():
+    """test multiclass bias metrics batch matches individual metrics"""
+    df = multiclass_bias_metrics(p, y_pred_mc, y_true_mc, metric_type="both")
+    assert_approx_equal(df.loc["Mean Multiclass Statistical Parity", "Value"], multiclass_statistical_parity(p, y_pred_mc))
+    assert_approx_equal(
+        df.loc["Max Multiclass Equality of Opportunity", "Value"],
+        multiclass_equality_of_opp(p, y_pred_mc, y_true_mc, aggregation_fun="max"),
+    )
+    assert_approx_equal(
+        df.loc["Mean Multiclass Average Odds", "Value"], multiclass_average_odds(p, y_pred_mc, y_true_mc)
+    )
+    assert_approx_equal(
+        df.loc["Max Multiclass True Positive Difference", "Value"],
+        multiclass_true_rates(p, y_pred_mc, y_true_mc, aggregation_fun="max"),
+    )
@@ -1,7 +1,9 @@
 # Imports
 import numpy as np
 import pandas as pd
+import pytest
 from numpy.testing import assert_approx_equal
+from scipy import sparse
 
 # Recommender
 from holisticai.bias.metrics import (
@@ -15,12 +17,13 @@ from holisticai.bias.metrics import (
     exposure_l1,
     gini_index,
     mad_score,
+    recommender_bias_metrics,
     recommender_mae_ratio,
     recommender_rmse_ratio,
 )
 
 # Formatting
-from holisticai.utils import extract_columns
+from holisticai.utils import extract_columns, mat_to_binary, recommender_formatter
 from tests.bias.utils import load_bias_recommender_data
 
 # Dataset
@@ -135,3 +138,55 @@ def test_recommender_mae_ratio():
     a = recommender_mae_ratio(group_a, group_b, mat_pred, mat_true)
     b = 4.499999999999998
     assert_approx_equal(a, b)
+
+
+def test_mat_to_binary_top():
+    """test mat_to_binary top k with ties and nan"""
+    mat = np.array([[0.3, 0.9, 0.3, np.nan, 0.3], [np.nan, 0.1, np.nan, 0.2, 0.2]])
+    a = mat_to_binary(mat, top=2)
+    b = np.array([[0, 1, 0, 0, 1], [0, 0, 0, 1, 1]])
+    np.testing.assert_array_equal(a, b)
+    np.testing.assert_array_equal(mat_to_binary(sparse.csr_matrix(mat), top=2).toarray(), b)
+
+
+@pytest.mark.parametrize("top", [0, -1])
+def test_mat_to_binary_top_not_positive(top):
+    """test mat_to_binary rejects a top k rule without items"""
+    mat = np.array([[0.3, 0.9, 0.3], [0.1, 0.5, 0.2]])
+    with pytest.raises(ValueError):
+        mat_to_binary(mat, top=top)
+    with pytest.raises(ValueError):
+        mat_to_binary(sparse.csr_matrix(mat), top=top)
+
+
+def test_recommender_bias_metrics_sparse():
+    """test recommender metrics on sparse input match the dense (nan) ones"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "user": rng.integers(0, 50, 400),
+            "item": rng.integers(0, 30, 400),
+            "score": rng.random(400),
+        }
+    )
+    df["group"] = df["user"] % 2
+    df_pivot, p_attr = recommender_formatter(df, "user", "group", "item", "score", aggfunc="mean")
+    mat_sparse, p_attr_sparse = recommender_formatter(
+        df, "user", "group", "item", "score", aggfunc="mean", sparse_output=True
+    )
+    assert sparse.issparse(mat_sparse)
+    np.testing.assert_array_equal(p_attr, p_attr_sparse)
+    np.testing.assert_allclose(mat_sparse.toarray(), df_pivot.fillna(0).to_numpy())
+
+    mat_dense = df_pivot.to_numpy()
+    mat_dense_true = np.where(np.isnan(mat_dense), np.nan, rng.random(mat_dense.shape))
+    mat_sparse_true = mat_sparse.copy()
+    mat_sparse_true.data = mat_dense_true[~np.isnan(mat_dense)]
+    for top in [None, 2]:
+        a = recommender_bias_metrics(
+            p_attr, 1 - p_attr, mat_sparse, mat_sparse_true, top=top, normalize=True, metric_type="all"
+        )
+        b = recommender_bias_metrics(
+            p_attr, 1 - p_attr, mat_dense, mat_dense_true, top=top, normalize=True, metric_type="all"
+        )
+        np.testing.assert_allclose(a["Value"].astype(float), b["Value"].astype(float))
@@ -156,6 +156,20 @@ def test_max_statistical_parity():
     assert_approx_equal(a, b)
 
 
+def test_statistical_parity_exact_thresholds():
+    """test the exact threshold sweep against a brute force evaluation"""
+    rng = np.random.default_rng(0)
+    group_a = rng.integers(0, 2, 300)
+    group_b = 1 - group_a
+    y_pred = np.round(rng.normal(size=300) + 0.3 * group_a, 1)
+    thresholds = np.sort(y_pred)[::-1]
+    pass_a = np.array([(y_pred[group_a == 1] >= t).mean() for t in thresholds])
+    pass_b = np.array([(y_pred[group_b == 1] >= t).mean() for t in thresholds])
+    di_arr = np.abs(pass_a - pass_b)
+    assert_approx_equal(max_statistical_parity(group_a, group_b, y_pred, exact=True), di_arr.max())
+    assert_approx_equal(statistical_parity_auc(group_a, group_b, y_pred, exact=True), di_arr.mean())
+
+
 def test_correlation_diff():
     """test correlation_diff"""
     a = correlation_diff(group_a, group_b, y_pred_r, y_true_r)
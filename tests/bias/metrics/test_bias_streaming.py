@@ -0,0 +1,93 @@
+# Imports
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Streaming
+from holisticai.bias.metrics import (
+    ClassificationBiasAccumulator,
+    MulticlassBiasAccumulator,
+    RegressionBiasAccumulator,
+    classification_bias_metrics,
+    multiclass_bias_metrics,
+    regression_bias_metrics,
+)
+
+rng = np.random.default_rng(42)
+n = 5000
+group_a = rng.integers(0, 2, n)
+group_b = 1 - group_a
+batches = np.array_split(np.arange(n), 6)
+
+
+def _accumulate(acc_cls, arrays):
+    """update two accumulators on alternating batches and merge them"""
+    acc, other = acc_cls(), acc_cls()
+    for i, b in enumerate(batches):
+        (acc if i % 2 == 0 else other).update(*[arr[b] for arr in arrays])
+    return acc.merge(other)
+
+
+def test_classification_accumulator():
+    """test streaming classification metrics match the batch computation"""
+    y_pred = rng.integers(0, 2, n)
+    y_true = rng.integers(0, 2, n)
+    acc = _accumulate(ClassificationBiasAccumulator, [group_a, group_b, y_pred, y_true])
+    pd.testing.assert_frame_equal(acc.compute(), classification_bias_metrics(group_a, group_b, y_pred, y_true))
+
+
+def test_classification_accumulator_mixed_y_true():
+    """test y_true must be given for every batch or for none"""
+    acc = ClassificationBiasAccumulator().update(group_a, group_b, group_a)
+    with pytest.raises(ValueError):
+        acc.update(group_a, group_b, group_a, group_b)
+
+
+def test_multiclass_accumulator():
+    """test streaming multiclass metrics match the batch computation"""
+    p_attr = rng.choice(["A", "B", "C"], n)
+    y_pred = rng.integers(0, 3, n)
+    y_true = rng.integers(0, 3, n)
+    # the first batch only sees some of the groups and classes
+    p_attr[batches[0]] = "A"
+    y_pred[batches[0]] = 0
+    acc = _accumulate(MulticlassBiasAccumulator, [p_attr, y_pred, y_true])
+    expected = multiclass_bias_metrics(p_attr, y_pred, y_true, metric_type="both")
+    pd.testing.assert_frame_equal(acc.compute(metric_type="both").loc[expected.index], expected)
+
+
+def test_regression_accumulator():
+    """test streaming regression metrics match the batch computation while every distinct value is kept"""
+    y_pred = rng.normal(size=n) + 0.5 * group_a
+    y_true = y_pred + rng.normal(size=n)
+    acc = _accumulate(RegressionBiasAccumulator, [group_a, group_b, y_pred, y_true])
+    pd.testing.assert_frame_equal(acc.compute(), regression_bias_metrics(group_a, group_b, y_pred, y_true))
+
+
+def _regression_cases():
+    """tied, heavy tailed and late outlier predictions"""
+    ties = rng.integers(0, 5, n) + 1.0 * group_a
+    heavy_tail = rng.lognormal(0, 2, n) * (1 + 0.5 * group_a)
+    late_outlier = rng.normal(size=n) + 0.5 * group_a
+    late_outlier[batches[-1][-1]] = 1e6
+    return [ties, heavy_tail, late_outlier]
+
+
+@pytest.mark.parametrize("y_pred", _regression_cases(), ids=["ties", "heavy_tail", "late_outlier"])
+def test_regression_accumulator_quantiles(y_pred):
+    """test quantile based streaming regression metrics against the batch computation"""
+    expected = regression_bias_metrics(group_a, group_b, y_pred, metric_type="equal_outcome")
+    acc = _accumulate(RegressionBiasAccumulator, [group_a, group_b, y_pred])
+    pd.testing.assert_frame_equal(acc.compute(metric_type="equal_outcome"), expected)
+
+    # compressed digest, ties are still counted exactly
+    acc = _accumulate(partial(RegressionBiasAccumulator, rank_error=0.02), [group_a, group_b, y_pred])
+    assert len(acc.digest.prefixes) < n
+    a = acc.compute(metric_type="equal_outcome")["Value"]
+    b = expected["Value"]
+    for metric in ["Statistical Parity Q50", "Max Statistical Parity", "Statistical Parity AUC"]:
+        assert abs(a[metric] - b[metric]) < 0.02
+    for metric in ["Disparate Impact Q90", "Disparate Impact Q80", "Disparate Impact Q50"]:
+        assert abs(a[metric] / b[metric] - 1) < 0.05
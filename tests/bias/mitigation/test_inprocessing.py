@@ -149,6 +149,149 @@ def test_recsys_inprocessor(mitigator_name, mitigator_params, recommender_datase
     check_results(metrics1, metrics2)
 
 
+def test_reduction_signed_weights():
+    import pandas as pd
+    from holisticai.bias.mitigation.inprocessing.commons._moments_utils import merge_columns
+    from holisticai.bias.mitigation.inprocessing.commons.classification._constraints import TruePositiveRateParity
+
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(300, 2))
+    y = pd.Series(rng.integers(0, 2, 300))
+    sensitive_features = pd.DataFrame({"a": rng.integers(0, 3, 300), "b": rng.choice(["x", "y"], 300)})
+    assert merge_columns(sensitive_features).tolist() == [f"{a},{b}" for a, b in sensitive_features.values]
+
+    constraint = TruePositiveRateParity()
+    constraint.load_data(X, y, sensitive_features)
+    lambda_vec = pd.Series(rng.random(len(constraint.index)), index=constraint.index)
+    weights = constraint.signed_weights(lambda_vec)
+
+    event_prob = constraint.event_prob["y=1"]
+    for i, group in enumerate(merge_columns(sensitive_features)):
+        if y[i] == 1:
+            group_prob = constraint.group_event_prob["y=1", group]
+            expected = (lambda_vec["+", "y=1"].sum() - lambda_vec["-", "y=1"].sum()) / event_prob
+            expected -= (lambda_vec["+", "y=1", group] - lambda_vec["-", "y=1", group]) / group_prob
+        else:
+            expected = 0.0
+        assert np.isclose(weights[i], expected)
+
+
+def test_exponentiated_gradient_oracle_calls():
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(500, 3))
+    group_a = rng.random(500) < 0.4
+    y = ((X[:, 0] + group_a + rng.normal(size=500)) > 0.5).astype(int)
+
+    def fit(**params):
+        model = ExponentiatedGradientReduction(constraints="EqualizedOdds", estimator=LogisticRegression(), seed=1, **params)
+        return model.fit(X, y, group_a, ~group_a).predict_proba(X)
+
+    # the parallel oracle calls give the same result as the sequential ones
+    assert np.array_equal(fit(), fit(n_jobs=2))
+    assert np.array_equal(fit(warm_start=True), fit(warm_start=True, n_jobs=2))
+
+
+def test_exponentiated_gradient_warm_start():
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(500, 3))
+    group_a = rng.random(500) < 0.4
+    y = ((X[:, 0] + group_a + rng.normal(size=500)) > 0.5).astype(int)
+
+    def fit(**params):
+        model = ExponentiatedGradientReduction(constraints="EqualizedOdds", estimator=LogisticRegression(), seed=1, **params)
+        return model.fit(X, y, group_a, ~group_a)
+
+    # warm starts are opt-in, they change the oracle solutions but still give a fair classifier
+    cold, warm = fit(), fit(warm_start=True)
+    assert np.array_equal(cold.predict_proba(X), fit(warm_start=False).predict_proba(X))
+    for model in [cold, warm]:
+        metrics = classification_bias_metrics(group_a, ~group_a, model.predict(X), y, metric_type="equal_opportunity")
+        assert abs(metrics.loc["Average Odds Difference", "Value"]) < 0.1
+
+
+def test_exponentiated_gradient_randomized_regression():
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(2000, 3))
+    group_a = rng.random(2000) < 0.4
+    y = X[:, 0] + group_a + rng.normal(size=2000)
+    model = ExponentiatedGradientReduction(constraints="BoundedGroupLoss", loss="Square", min_val=-5, max_val=5,
+                                           upper_bound=1.2, estimator=LinearRegression(), seed=3)
+    model.fit(X, y, group_a, ~group_a)
+
+    # every prediction comes from a hypothesis with nonzero weight, drawn reproducibly
+    weights = model.model_.weights_
+    members = np.column_stack([model.model_._hs[t](X) for t in weights.index[weights > 0]])
+    y_pred = model.predict(X)
+    assert np.array_equal(y_pred, model.predict(X))
+    assert np.all((members == y_pred[:, None]).any(axis=1))
+
+
+def test_fair_k_median_local_search():
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(200, 2))
+    group_a = rng.random(200) < 0.5
+
+    models = [
+        FairKMedianClustering(n_clusters=3, seed=seed, strategy="LS", precompute_distances=precompute).fit(X, group_a, ~group_a)
+        for precompute in [True, False]
+    ]
+    algorithm = models[0].algorithm
+    assert np.array_equal(algorithm.centers, models[1].algorithm.centers)
+
+    # no single swap of a center improves the cost
+    cost = algorithm._compute_cost(algorithm.centers)
+    for c in range(200):
+        for i in range(3):
+            centers = algorithm.centers.copy()
+            centers[i] = c
+            assert algorithm._compute_cost(centers) >= cost - 1e-12
+
+
+def test_genetic_algorithm_batch_function():
+    from holisticai.utils.optimizers import GAHiperparameters, GeneticAlgorithm
+
+    def run(batch_function):
+        np.random.seed(seed)
+        optimizer = GeneticAlgorithm(
+            function=(lambda pop: (pop**2).sum(axis=1)) if batch_function else (lambda x: (x**2).sum()),
+            dimension=3,
+            variable_type="int",
+            variable_boundaries=np.array([[-10, 10]] * 3),
+            algorithm_parameters=GAHiperparameters(max_num_iteration=50, population_size=20),
+            batch_function=batch_function,
+        )
+        optimizer.run()
+        return optimizer.best_variable, optimizer.best_function
+
+    (variable, cost), (batch_variable, batch_cost) = run(False), run(True)
+    assert np.array_equal(variable, batch_variable)
+    assert cost == batch_cost == (variable**2).sum()
+
+
+def test_k_centers_farthest_first():
+    from sklearn.metrics.pairwise import pairwise_distances
+    from holisticai.utils.models.cluster import KCenters
+
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(300, 3))
+    group_a = rng.random(300) < 0.5
+
+    model = KCenters(n_clusters=5, random_state=seed)
+    model.fit(X)
+    distances = pairwise_distances(X, X[model.centers])
+    # every new center is the point farthest from the previous ones
+    for i in range(1, 5):
+        assert model.centers[i] == np.argmax(distances[:, :i].min(axis=1))
+    assert np.isclose(model.costs[-1], distances.min(axis=1).max())
+    assert [center for _, center in model.assign()] == list(np.array(model.centers)[distances.argmin(axis=1)])
+
+    mitigator = FairKCenterClustering(req_nr_per_group=[2, 2], nr_initially_given=3, seed=seed)
+    mitigator.fit(X, group_a, ~group_a)
+    distances = pairwise_distances(X, X[mitigator.all_centers], metric="l1")
+    assert np.isclose(mitigator.cost, distances.min(axis=1).max())
+    assert np.array_equal(mitigator.labels_, mitigator.all_centers[distances.argmin(axis=1)])
+
+
 def run_inprocessing_categorical(dataset, bias_metrics, estimator_class, mitigator_name, model_params, mitigator_params, is_multiclass=False):
     train = dataset['train']
     test = dataset['test']
@@ -121,6 +121,33 @@ def test_recsys_postprocessor(mitigator_name, mitigator_params):
     metrics2 = pd.DataFrame(columns=['Value'], data=[0.985410, 0.001944], index=['exposure_ratio', 'exposure difference'])
     check_results(metrics1, metrics2, atol=0.1)
 
+
+@pytest.mark.parametrize("metric_name", ["Statistical parity difference", "Average odds difference", "Equal opportunity difference"])
+def test_reject_option_configurations(metric_name):
+    import numpy as np
+    from sklearn.metrics import balanced_accuracy_score
+    from holisticai.bias.metrics import average_odds_diff, equal_opportunity_diff, statistical_parity
+    from holisticai.bias.mitigation.postprocessing.reject_option_classification import _evaluate_configurations, predict
+
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, 500)
+    likelihoods = np.round(rng.random(500), 2)
+    group_a = rng.random(500) < 0.4
+    group_b = ~group_a
+    thresholds = np.array([[0.3], [0.5], [0.62]])
+    margins = np.array([[0.0, 0.1, 0.25]]).repeat(3, axis=0)
+    balanced_accuracy, fair_score = _evaluate_configurations(metric_name, y, likelihoods, group_a, group_b, thresholds, margins)
+
+    fair_metric = {
+        "Statistical parity difference": lambda a, b, y_pred, _: statistical_parity(a, b, y_pred),
+        "Average odds difference": average_odds_diff,
+        "Equal opportunity difference": equal_opportunity_diff,
+    }[metric_name]
+    for i, j in np.ndindex(margins.shape):
+        y_pred = predict((likelihoods > thresholds[i, 0]).astype(int), likelihoods, group_a, group_b, thresholds[i, 0], margins[i, j])
+        assert np.isclose(balanced_accuracy[i, j], balanced_accuracy_score(y, y_pred))
+        assert np.isclose(fair_score[i, j], fair_metric(group_b, group_a, y_pred, y))
+
    
 def run_postprocessing_categorical(dataset, bias_metrics, estimator_class, mitigator_name, postprocessor_fit_param_names, mitigator_params, is_multiclass=False):
     train = dataset['train']
@@ -1,5 +1,6 @@
 import warnings
 
+import numpy as np
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
@@ -28,6 +29,9 @@ from holisticai.bias.mitigation import Reweighing
 from holisticai.bias.mitigation import LearningFairRepresentation
 from holisticai.bias.mitigation import FairletClusteringPreprocessing
 from holisticai.bias.mitigation import DisparateImpactRemoverRS
+from holisticai.bias.mitigation import DisparateImpactRemover
+from holisticai.bias.mitigation.commons.disparate_impact_remover._numerical_repairer import NumericalRepairer
+from holisticai.bias.mitigation.commons.disparate_impact_remover._utils import repair_categorical_column
 
 def get_preprocessor(mitigator_name : MITIGATOR_NAME = "CorrelationRemover", parameters: dict = {}):
     if mitigator_name == "CorrelationRemover":
@@ -209,3 +213,33 @@ def run_preprocessing_recsys(bias_metrics, mitigator_name, mitigator_params):
     rankings = pre.transform(rankings)
 
     return bias_metrics(rankings, group_col='protected', query_col='X', score_col='score')
+
+
+def test_disparate_impact_remover_repair():
+    rng = np.random.default_rng(seed)
+    group_a = rng.random(2000) < 0.3
+    X = np.c_[rng.normal(size=2000) + 2 * group_a, rng.integers(0, 10, 2000)]
+
+    Xt = DisparateImpactRemover(repair_level=1.0, n_jobs=2).fit_transform(X, group_a, ~group_a)
+
+    # the repair preserves the rank-ordering within groups and aligns the group distributions
+    for group in [group_a, ~group_a]:
+        assert np.all(np.diff(Xt[group, 0][np.argsort(X[group, 0])]) >= 0)
+    assert abs(np.median(Xt[group_a, 0]) - np.median(Xt[~group_a, 0])) < 0.1
+    assert np.array_equal(DisparateImpactRemover(repair_level=0.0).fit_transform(X, group_a, ~group_a), X)
+
+    # categorical features are repaired on the category counts of the groups
+    data = np.c_[group_a.astype(float), np.where(group_a, "x", rng.choice(["x", "y"], 2000))].astype(object)
+    repaired = NumericalRepairer(feature_to_repair=0, repair_level=1.0).repair(data)
+    share_a, share_b = (repaired[group_a, 1] == "x").mean(), (repaired[~group_a, 1] == "x").mean()
+    assert abs(share_a - share_b) < 0.05
+
+
+def test_disparate_impact_remover_categorical_repair():
+    values = np.array(list("aaaaaabbbbbb" + "aabbccddee" + "aaabbbcccdddeee"))
+    groups = np.repeat([0, 1, 2], [12, 10, 15])
+    repaired = repair_categorical_column(values, groups, 0.5, np.random.default_rng(0))
+
+    # the first group keeps its desired 4 "a" and 4 "b", the categories it lacks only receive the overflow
+    assert "".join(repaired[groups == 0]) == "acaaaabbabdb"
+    assert np.array_equal(repaired[groups != 0], values[groups != 0])
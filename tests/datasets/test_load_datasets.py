@@ -1,4 +1,8 @@
-from holisticai.datasets import load_dataset
+import pandas as pd
+import pytest
+import numpy as np
+from holisticai.datasets import DataLoader, Dataset, cache_hai_dataset, load_dataset, load_hai_datasets
+from holisticai.datasets._dataset_cache import load_cached
 
 def test_load_dataset():
     SHARD_SIZE = 50
@@ -13,4 +17,157 @@ def test_map():
     dataset = dataset.train_test_split(test_size=0.2, random_state=42)
     test = dataset['test']
     new_test = test.map(lambda sample: {'group': sample['y']}, vectorized=False)
-    assert list(new_test['X'].columns) == list(test['X'].columns)
\ No newline at end of file
+    assert list(new_test['X'].columns) == list(test['X'].columns)
+
+
+def test_load_hai_datasets_offline(tmp_path):
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    df.to_parquet(tmp_path / 'local.parquet')
+    data_home = str(tmp_path / 'data_home')
+
+    with pytest.raises(FileNotFoundError):
+        load_hai_datasets('adult', data_home=data_home, offline=True)
+
+    cache_hai_dataset('adult', tmp_path / 'local.parquet', data_home=data_home)
+    pd.testing.assert_frame_equal(load_hai_datasets('adult', data_home=data_home, offline=True), df)
+
+    # a half written index is treated as empty, and no temporary file is left behind
+    cache_dir = tmp_path / 'data_home' / 'hai_datasets'
+    (cache_dir / 'index.json').write_text('{"adult": ')
+    with pytest.raises(FileNotFoundError):
+        load_hai_datasets('adult', data_home=data_home, offline=True)
+    cache_hai_dataset('adult', tmp_path / 'local.parquet', data_home=data_home)
+    pd.testing.assert_frame_equal(load_hai_datasets('adult', data_home=data_home, offline=True), df)
+    assert not list(cache_dir.glob('*.tmp'))
+
+    # a corrupted cached file is discarded
+    cached = cache_hai_dataset('adult', tmp_path / 'local.parquet', data_home=data_home)
+    with open(cached, 'ab') as f:
+        f.write(b'corrupted')
+    with pytest.raises(FileNotFoundError):
+        load_hai_datasets('adult', data_home=data_home, offline=True)
+
+
+def test_load_hai_datasets_timeout(tmp_path, monkeypatch):
+    timeouts = []
+
+    def stalled_urlopen(url, timeout=None):
+        timeouts.append(timeout)
+        raise TimeoutError
+
+    monkeypatch.setattr('holisticai.datasets._dataloaders.urlopen', stalled_urlopen)
+    with pytest.raises(TimeoutError):
+        load_hai_datasets('adult', data_home=str(tmp_path), offline=False, timeout=5)
+    assert timeouts == [5]
+
+
+def test_load_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOLISTIC_AI_DATA', str(tmp_path / 'default'))
+    data_home = str(tmp_path / 'data_home')
+    pd.DataFrame({'a': [1]}).to_parquet(tmp_path / 'raw.parquet')
+    cache_hai_dataset('adult', tmp_path / 'raw.parquet', data_home=data_home)
+    calls = []
+
+    def load_toy_dataset(preprocessed=True):
+        calls.append(preprocessed)
+        X = pd.DataFrame({'a': np.arange(5.0), 'b': list('vwxyz')})
+        y = pd.Series([0, 1, 0, 1, 1], name='y').astype('category')
+        return Dataset(X=X, y=y, _metadata='toy')
+
+    dataset = load_cached(load_toy_dataset, data_home=data_home, preprocessed=True)
+    cached = load_cached(load_toy_dataset, data_home=data_home, preprocessed=True)
+    load_cached(load_toy_dataset, data_home=data_home, preprocessed=False)
+
+    assert calls == [True, False]
+    assert cached._metadata == 'toy'
+    pd.testing.assert_frame_equal(cached.data, dataset.data)
+    assert not list(tmp_path.glob('data_home/processed_datasets/*.tmp'))
+
+    # the cached dataset is rebuilt when a raw dataset changes in its data home only
+    pd.DataFrame({'a': [2]}).to_parquet(tmp_path / 'raw.parquet')
+    cache_hai_dataset('adult', tmp_path / 'raw.parquet')
+    load_cached(load_toy_dataset, data_home=data_home, preprocessed=True)
+    assert calls == [True, False]
+    cache_hai_dataset('adult', tmp_path / 'raw.parquet', data_home=data_home)
+    load_cached(load_toy_dataset, data_home=data_home, preprocessed=True)
+    load_cached(load_toy_dataset, data_home=data_home, preprocessed=True)
+    assert calls == [True, False, True]
+
+
+def test_filter_vectorized():
+    X = pd.DataFrame({'a': np.arange(6.0), 'b': [0, 1, 0, 1, 0, 1]})
+    dataset = Dataset(X=X, y=pd.Series([0, 1, 1, 0, 1, 1]))
+    vectorized = dataset.filter(lambda x: (x['y'] == 1) & (x['X']['a'] > 1), vectorized=True)
+    rowwise = dataset.filter(lambda x: x['y'] == 1 and x[('X', 'a')] > 1, vectorized=False)
+    pd.testing.assert_frame_equal(vectorized.data, rowwise.data)
+    assert len(rowwise) == 3
+    with pytest.raises(ValueError):
+        dataset.filter(lambda x: True, vectorized=True)
+
+
+def test_filter_rowwise_default():
+    X = pd.DataFrame({'a': np.arange(6.0), 'b': [0, 1, 0, 1, 0, 1]})
+    dataset = Dataset(X=X, y=pd.Series([0, 1, 1, 0, 1, 1]))
+    calls = []
+
+    def predicate(row):
+        calls.append(row['y'])
+        return row['y'] == 1
+
+    filtered = dataset.filter(predicate)
+    assert len(calls) == dataset.num_rows
+    assert len(filtered) == 4
+
+
+def test_dataloader_shuffle():
+    X = pd.DataFrame({'a': np.arange(10.0), 'b': np.arange(10.0)})
+    dataset = Dataset(X=X, y=pd.Series(np.arange(10)))
+
+    batches = list(DataLoader(dataset, batch_size=4, dtype='numpy'))
+    assert [len(b['y']) for b in batches] == [4, 4, 2]
+    assert batches[0]['X'].shape == (4, 2)
+
+    loader = DataLoader(dataset, batch_size=4, dtype='numpy', shuffle=True, seed=0, drop_last=True, prefetch=2)
+    epoch = np.concatenate([b['y'] for b in loader])
+    assert loader.num_batches == 2
+    assert len(np.unique(epoch)) == 8
+    for b in loader:
+        np.testing.assert_array_equal(b['X'][:, 0], b['y'])
+    other = DataLoader(dataset, batch_size=4, dtype='numpy', shuffle=True, seed=0, drop_last=True)
+    np.testing.assert_array_equal(epoch, np.concatenate([b['y'] for b in other]))
+
+
+def test_prefetch_stops_early():
+    import threading
+    import time
+    from holisticai.datasets._dataset import _prefetch
+
+    class Interrupt(BaseException):
+        pass
+
+    def failing():
+        yield 0
+        raise Interrupt
+
+    with pytest.raises(Interrupt):
+        list(_prefetch(failing(), 2))
+
+    closed = threading.Event()
+
+    def endless():
+        try:
+            while True:
+                yield 0
+        finally:
+            closed.set()
+
+    n_threads = threading.active_count()
+    for _ in _prefetch(endless(), 2, poll_interval=0.01):
+        break
+    # the producer thread closes the generator and exits
+    assert closed.wait(timeout=5)
+    for _ in range(500):
+        if threading.active_count() == n_threads:
+            break
+        time.sleep(0.01)
+    assert threading.active_count() == n_threads
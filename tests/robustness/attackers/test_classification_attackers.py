@@ -57,6 +57,27 @@ def test_hsj(categorical_dataset):
     # This test should pass when the robustness is greater than 0
     assert hsj_robustness > 0
 
+def test_hsj_batched():
+    import numpy as np
+    import pandas as pd
+    from sklearn.datasets import make_classification
+
+    X, y = make_classification(n_samples=200, n_features=5, random_state=0)
+    X = pd.DataFrame(X, columns=[f"f{i}" for i in range(5)])
+    model = LogisticRegression().fit(X, y)
+    calls = []
+
+    def predict(x):
+        calls.append(len(x))
+        return model.predict(x)
+
+    hsj_attacker = HopSkipJump(name="HSJ", predictor=predict, max_iter=5, batch_size=20)
+    hsj_adv_x = hsj_attacker.generate(X.iloc[:40])
+
+    # every sample is attacked successfully with few (batched) predictions
+    assert np.all(model.predict(hsj_adv_x) != model.predict(X.iloc[:40]))
+    assert len(calls) < 200
+
 def test_zoo(categorical_dataset):
     train, test = categorical_dataset
 
@@ -83,3 +104,14 @@ def test_zoo(categorical_dataset):
     assert zoo_accuracy != baseline_accuracy
     # This test should pass when the robustness is greater than 0
     assert zoo_robustness > 0
+
+def test_zoo_max_pooling():
+    import numpy as np
+
+    image = np.random.default_rng(0).random((2, 10, 7))
+    pooled = ZooAttack._max_pooling(image, 4)
+
+    # every (incomplete) block takes the maximum of its values
+    assert pooled.shape == image.shape
+    assert np.all(pooled[:, :4, :4] == image[:, :4, :4].max(axis=(1, 2), keepdims=True))
+    assert np.all(pooled[:, 8:, 4:] == image[:, 8:, 4:].max(axis=(1, 2), keepdims=True))
@@ -5,6 +5,7 @@ from holisticai.datasets import load_dataset
 from sklearn.pipeline import Pipeline
 from sklearn import linear_model
 import numpy as np
+import pandas as pd
 from sklearn.metrics import mean_squared_error
 from holisticai.robustness.attackers import LinRegGDPoisoner, RidgeGDPoisoner
 import pytest
@@ -164,3 +165,25 @@ def test_gdbridge_only_poison(regression_dataset):
     assert x_poised.shape[0] == poisoned_samples
     assert y_poised.shape[0] == poisoned_samples
     assert poised_err != baseline_error
+
+
+def test_gdbridge_closed_form():
+    rng = np.random.default_rng(0)
+    X_train = pd.DataFrame(rng.random((200, 5)), columns=[f"f{i}" for i in range(5)])
+    y_train = pd.Series(np.clip(X_train.mean(axis=1) + 0.1 * rng.normal(size=200), 0, 1), name="y")
+
+    poiser = RidgeGDPoisoner(poison_proportion=0.2, max_iter=3)
+    x_poised, y_poised = poiser.generate(X_train, y_train, return_only_poisoned=True)
+
+    # the rank-k updates of the training Gram matrix match a model fitted from scratch
+    poisoned = linear_model.Ridge(alpha=0.1).fit(np.concatenate([X_train, x_poised]), np.r_[y_train, y_poised])
+    theta = poiser.learn_model(x_poised.to_numpy(), y_poised.to_numpy())
+    assert np.allclose(theta, np.r_[poisoned.coef_, poisoned.intercept_])
+
+    clf = linear_model.Ridge(alpha=0.1).fit(np.concatenate([X_train, x_poised[:1]]), np.r_[y_train, y_poised[:1]])
+    theta = poiser.learn_models(x_poised.to_numpy(), y_poised.to_numpy())[0]
+    assert np.allclose(theta, np.r_[clf.coef_, clf.intercept_])
+
+    # the poisoning points increase the training error
+    clean = linear_model.Ridge(alpha=0.1).fit(X_train, y_train)
+    assert mean_squared_error(y_train, poisoned.predict(X_train)) > mean_squared_error(y_train, clean.predict(X_train))
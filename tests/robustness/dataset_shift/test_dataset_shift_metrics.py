@@ -84,3 +84,26 @@ def test_accuracy_degradation_profile(mock_data, n_neighbors, baseline_acc, mock
         assert isinstance(result.data, pd.DataFrame), "The output should be a DataFrame"
         assert expected_baseline == mock_acc_score or expected_baseline == baseline_acc, \
             f"Expected baseline {expected_baseline}, but got {baseline_acc}"
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 100])
+def test_calculate_accuracies_batched(batch_size):
+    """
+    The accuracies computed by batches of test points match a brute force computation.
+    """
+    from sklearn.neighbors import NearestNeighbors
+    from holisticai.robustness.metrics.dataset_shift._accuracy_degradation_profile import _calculate_accuracies
+
+    rng = np.random.default_rng(0)
+    X_test = rng.normal(size=(40, 3))
+    y_test = rng.integers(0, 2, 40)
+    y_pred = rng.integers(0, 2, 40)
+    knn = NearestNeighbors(algorithm="kd_tree").fit(X_test)
+
+    results_df, set_size_list = _calculate_accuracies(X_test, y_test, y_pred, knn, 0.1, batch_size=batch_size)
+
+    neighbours = knn.kneighbors(X_test, n_neighbors=40, return_distance=False)
+    matches = y_test[neighbours] == y_pred[neighbours]
+    for size_factor, column in zip(set_size_list, results_df.columns):
+        n_neighbours = int(40 * size_factor)
+        np.testing.assert_allclose(results_df[column], matches[:, :n_neighbours].mean(axis=1))
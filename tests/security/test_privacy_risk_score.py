@@ -19,3 +19,16 @@ def test_privacy_risk_score():
 
     assert isinstance(risk_scores, np.ndarray), "Output should be a numpy array"
     assert risk_scores.shape == (3,), "Output shape should match the number of target training samples"
+
+
+def test_privacy_risk_score_empty_bins():
+    from holisticai.security.metrics._privacy_risk_score import _risk_score_compute
+
+    tr_distrs = np.array([[0.5, 0.0, 0.0, 0.0, 0.5]])
+    te_distrs = np.array([[0.5, 0.0, 0.0, 0.0, 0.0]])
+    bins = np.array([[0.0, 1.0, 2.0, 3.0, 4.0, 5.0]])
+    values = np.array([-1.0, 0.5, 1.5, 2.5, 3.5, 4.5, 9.0])
+
+    # empty bins take the score of the nearest non-empty bin, the lower one on ties
+    risk_scores = _risk_score_compute(tr_distrs, te_distrs, bins, values, np.zeros(7, dtype=int))
+    assert np.allclose(risk_scores, [0.5, 0.5, 0.5, 0.5, 1.0, 1.0, 1.0])
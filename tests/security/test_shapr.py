@@ -35,3 +35,26 @@ def test_shapr(categorical_dataset):
     pred_test = model.predict(test['X'])
     v = shapr_score(train['y'], test['y'], pred_train, pred_test) 
     print(v)
+
+
+def test_shapr_batches():
+    import numpy as np
+    from holisticai.security.metrics import ShaprScore
+
+    rng = np.random.default_rng(0)
+    y_train, y_test = rng.integers(0, 3, 300), rng.integers(0, 3, 50)
+    y_pred_train, y_pred_test = rng.integers(0, 3, 300), rng.integers(0, 3, 50)
+
+    shapr = ShaprScore()
+    values = shapr(y_train, y_test, y_pred_train, y_pred_test)
+    assert values.shape == (50, 300)
+    assert np.allclose(values, shapr(y_train, y_test, y_pred_train, y_pred_test, batch_size=7))
+
+    # the aggregated score is the mean over the training samples of their summed values
+    score = shapr(y_train, y_test, y_pred_train, y_pred_test, batch_size=7, aggregated=False)
+    assert np.isclose(score, values.sum(axis=0).mean())
+
+    # the score of every training sample is reduced without the matrix of values
+    scores = shapr(y_train, y_test, y_pred_train, y_pred_test, per_train_sample=True)
+    assert np.allclose(scores, values.sum(axis=0), atol=1e-5)
+    assert np.isclose(scores.mean(), score)